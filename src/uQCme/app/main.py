@@ -16,7 +16,6 @@ import streamlit as st
 from streamlit.web import cli as stcli
 import pandas as pd
 import requests
-import yaml
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
 from urllib.parse import urlencode, urlparse, urlunparse, parse_qs
@@ -28,11 +27,15 @@ from uQCme.core.loader import (
     load_config_from_file,
     load_data_from_config,
     load_data_from_api_with_debug,
+    load_yaml_file,
     prepare_loaded_data_frame,
+    read_reference_table,
+    read_run_data_table,
 )
 from uQCme.core.engine import QCProcessor
 from uQCme.core.config import UQCMeConfig, DataInput, SampleApiAction
 from uQCme.core.exceptions import ConfigError, DataLoadError, ValidationError
+from uQCme.core.schemas import QCRulesSchema, QCTestsSchema
 
 
 class QCDashboard:
@@ -400,8 +403,7 @@ class QCDashboard:
 
             # Load mapping configuration first as it's needed for validation
             mapping_path = self.config.app.input.mapping
-            with open(mapping_path, 'r', encoding='utf-8') as f:
-                self.mapping = yaml.safe_load(f)
+            self.mapping = load_yaml_file(mapping_path)
             
             # Load processed QC results - check if API or file
             data_config = self.config.app.input.data
@@ -472,11 +474,11 @@ class QCDashboard:
             
             # Load QC rules
             rules_path = self.config.app.input.qc_rules
-            self.qc_rules = pd.read_csv(rules_path, sep='\t')
+            self.qc_rules = read_reference_table(rules_path, QCRulesSchema)
             
             # Load QC tests
             tests_path = self.config.app.input.qc_tests
-            self.qc_tests = pd.read_csv(tests_path, sep='\t')
+            self.qc_tests = read_reference_table(tests_path, QCTestsSchema)
             
             # Load warnings if available
             warnings_path = self.config.app.input.warnings
@@ -2103,7 +2105,7 @@ class QCDashboard:
                 # Try to read as TSV first (standard for this tool)
                 uploaded_file.seek(0)
                 try:
-                    df = pd.read_csv(uploaded_file, sep='\t')
+                    df = read_run_data_table(uploaded_file)
                 except Exception:
                     df = pd.DataFrame()
 
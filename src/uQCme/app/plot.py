@@ -9,13 +9,136 @@ Note: This module requires the 'app' or 'all' extras to be installed:
     pip install uqcme[app]
 """
 
+import functools
+import hashlib
+import inspect
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
 import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
-from typing import Dict, Any, Optional
+import plotly.io as pio
+from typing import Callable, Dict, Any, Optional, Sequence
 from uQCme.core.config import UQCMeConfig
 
 
+DEFAULT_OUTCOME_COLORS: Dict[str, str] = {
+    'PASS': '#28a745',  # Green
+    'WARN': '#ffc107',  # Yellow
+    'FAIL': '#dc3545',  # Red
+    'WARN_COMPLETENESS': '#fd7e14',  # Orange
+    'WARN_CONTAMINATION': '#e83e8c',  # Pink
+    'FAIL_SIZE': '#6f42c1',  # Purple
+    'FAIL_CONTIGUITY': '#20c997'  # Teal
+}
+
+# Prefixes stripped from column names before display
+COLUMN_NAME_PREFIXES = ('QC/', 'QC.', 'QC_')
+
+# System/non-metric columns never offered as plottable metrics
+EXCLUDED_METRIC_COLUMNS = frozenset({
+    'sample_name', 'species', 'qc_outcome', 'qc_action',
+    'failed_rules', 'passed_rules', 'error', 'Select'
+})
+
+# Scatter plots above this many samples are downsampled per outcome
+SCATTER_DOWNSAMPLE_THRESHOLD = 5000
+SCATTER_MAX_POINTS_PER_OUTCOME = 2000
+
+# Process-wide cache of built figures, keyed on the plotted data content
+PLOT_CACHE_SIZE = 64
+_plot_cache: "OrderedDict[tuple, go.Figure]" = OrderedDict()
+_plot_cache_lock = threading.Lock()
+
+
+def _freeze(value: Any) -> Any:
+    """Make list arguments hashable so they can be part of a cache key."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _cache_plot(
+    columns: Sequence[str] = (),
+    columns_arg: Optional[str] = None,
+    columns_fn: Optional[Callable[[pd.DataFrame], Sequence[str]]] = None
+):
+    """Memoize a QCPlotter plotting method on the content of its input.
+
+    The cache key combines the method, its non-data arguments, the outcome
+    colors and a hash of the data columns the result depends on: the fixed
+    ``columns``, the column names passed in argument ``columns_arg`` and
+    those ``columns_fn`` picks from the data. A changed column changes
+    the hash, so stale results are never served. Cached figures are shared
+    between callers and must not be mutated.
+
+    The wrapped method gets a ``cached(self, data, ...)`` attribute that
+    returns the cached result for those arguments, or None, without
+    building anything.
+    """
+    def decorator(method):
+        signature = inspect.signature(method)
+
+        def make_key(self, data: pd.DataFrame, args, kwargs) -> tuple:
+            bound = signature.bind(self, data, *args, **kwargs)
+            bound.apply_defaults()
+            arguments = {
+                name: _freeze(value)
+                for name, value in bound.arguments.items()
+                if name not in ('self', 'data')
+            }
+
+            used = list(columns)
+            if columns_arg:
+                used.extend(arguments[columns_arg])
+            if columns_fn:
+                used.extend(columns_fn(data))
+            used = [col for col in dict.fromkeys(used) if col in data.columns]
+            row_hashes = pd.util.hash_pandas_object(data[used], index=False)
+            data_hash = hashlib.sha1(
+                row_hashes.to_numpy().tobytes()
+            ).hexdigest()
+
+            return (
+                method.__qualname__,
+                tuple(sorted(arguments.items())),
+                tuple(sorted(self._outcome_colors.items(), key=str)),
+                tuple(used),
+                len(data),
+                data_hash,
+            )
+
+        def lookup(key: tuple):
+            with _plot_cache_lock:
+                fig = _plot_cache.get(key)
+                if fig is not None:
+                    _plot_cache.move_to_end(key)
+                return fig
+
+        def cached(self, data: pd.DataFrame, *args, **kwargs):
+            return lookup(make_key(self, data, args, kwargs))
+
+        @functools.wraps(method)
+        def wrapper(self, data: pd.DataFrame, *args, **kwargs):
+            key = make_key(self, data, args, kwargs)
+            fig = lookup(key)
+            if fig is not None:
+                return fig
+
+            fig = method(self, data, *args, **kwargs)
+            with _plot_cache_lock:
+                _plot_cache[key] = fig
+                while len(_plot_cache) > PLOT_CACHE_SIZE:
+                    _plot_cache.popitem(last=False)
+            return fig
+
+        wrapper.cached = cached
+        return wrapper
+    return decorator
+
+
 class QCPlotter:
     """Class containing all plotting functionality for QC data visualization."""
 
@@ -23,30 +146,36 @@ class QCPlotter:
         """Initialize plotter with configuration."""
         self.config = config
         self.priority_colors = config.app.priority_colors if config.app and config.app.priority_colors else {}
+        # Resolve outcome colors once; every plot method reuses them
+        self._outcome_colors = {
+            **DEFAULT_OUTCOME_COLORS,
+            **self.priority_colors.get('qc_outcome', {})
+        }
 
+    @_cache_plot(columns=['qc_outcome'])
     def create_outcome_pie_chart(
         self,
         data: pd.DataFrame,
         title: str = "QC Outcome Distribution"
     ) -> go.Figure:
         """Create pie chart for QC outcomes distribution."""
-        outcome_counts = data['qc_outcome'].value_counts()
+        outcome_counts = _category_counts(data['qc_outcome'])
         
-        fig = px.pie(
-            values=outcome_counts.values,
-            names=outcome_counts.index,
+        layout = go.Layout(
             title=title,
-            color_discrete_map=self._get_outcome_colors()
-        )
-        
-        fig.update_traces(textposition='inside', textinfo='percent+label')
-        fig.update_layout(
             showlegend=True,
             font=dict(size=12)
         )
-        
-        return fig
+        trace = go.Pie(
+            labels=outcome_counts.index.to_numpy(),
+            values=outcome_counts.to_numpy(),
+            textposition='inside',
+            textinfo='percent+label'
+        )
 
+        return go.Figure(data=[trace], layout=layout, skip_invalid=True)
+
+    @_cache_plot(columns=['species'])
     def create_species_bar_chart(
         self,
         data: pd.DataFrame,
@@ -57,24 +186,19 @@ class QCPlotter:
         if 'species' not in data.columns:
             return go.Figure()
 
-        species_counts = data['species'].value_counts().head(top_n)
+        species_counts = _category_counts(data['species']).head(top_n)
         
-        fig = px.bar(
-            x=species_counts.values,
-            y=species_counts.index,
-            orientation='h',
+        return _horizontal_bar_figure(
+            x=species_counts.to_numpy(),
+            y=species_counts.index.to_numpy(),
             title=f"Top {top_n} {title}",
-            labels={'x': 'Sample Count', 'y': 'Species'}
-        )
-        
-        fig.update_layout(
-            yaxis={'categoryorder': 'total ascending'},
+            x_title='Sample Count',
+            y_title='Species',
             height=max(400, top_n * 30),
-            margin=dict(l=200)
+            left_margin=200
         )
-        
-        return fig
 
+    @_cache_plot(columns=['failed_rules'])
     def create_failed_rules_chart(
         self,
         data: pd.DataFrame,
@@ -85,36 +209,19 @@ class QCPlotter:
         failed_rules_data = self._analyze_failed_rules(data)
         
         if failed_rules_data.empty:
-            # Create empty chart
-            fig = go.Figure()
-            fig.add_annotation(
-                text="No failed rules found",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5,
-                showarrow=False,
-                font=dict(size=16)
-            )
-            fig.update_layout(title=title)
-            return fig
+            return _message_figure("No failed rules found", title)
         
         top_rules = failed_rules_data.head(top_n)
         
-        fig = px.bar(
-            top_rules,
-            x='count',
-            y='rule',
-            orientation='h',
+        return _horizontal_bar_figure(
+            x=top_rules['count'].to_numpy(),
+            y=top_rules['rule'].to_numpy(),
             title=f"Top {top_n} {title}",
-            labels={'count': 'Failure Count', 'rule': 'QC Rule'}
-        )
-        
-        fig.update_layout(
-            yaxis={'categoryorder': 'total ascending'},
+            x_title='Failure Count',
+            y_title='QC Rule',
             height=max(500, top_n * 25),
-            margin=dict(l=250)
+            left_margin=250
         )
-        
-        return fig
 
     def create_distribution_plot(
         self,
@@ -125,24 +232,41 @@ class QCPlotter:
         """Create distribution histogram for a quality metric."""
         if title is None:
             title = f"Distribution of {self._format_column_name(metric)}"
-        
-        fig = px.histogram(
-            data,
-            x=metric,
-            color='qc_outcome',
+
+        # Bin on the server so only per-bin counts reach the browser
+        values = pd.to_numeric(data[metric], errors='coerce')
+        finite = values[np.isfinite(values)]
+        edges = np.histogram_bin_edges(finite.to_numpy(), bins=30)
+        centers = (edges[:-1] + edges[1:]) / 2
+        bin_ranges = np.column_stack([edges[:-1], edges[1:]])
+        colors = self._get_outcome_colors()
+
+        traces = []
+        grouped = finite.groupby(data['qc_outcome'], sort=False)
+        for outcome, outcome_values in grouped:
+            counts, _ = np.histogram(outcome_values.to_numpy(), bins=edges)
+            traces.append(go.Bar(
+                x=centers,
+                y=counts,
+                name=outcome,
+                marker_color=colors.get(outcome),
+                customdata=bin_ranges,
+                hovertemplate=(
+                    "%{customdata[0]:.4g} - %{customdata[1]:.4g}"
+                    "<br>Sample Count: %{y}"
+                )
+            ))
+
+        layout = go.Layout(
             title=title,
-            nbins=30,
-            labels={metric: self._format_column_name(metric)},
-            color_discrete_map=self._get_outcome_colors()
-        )
-        
-        fig.update_layout(
+            barmode='stack',
             bargap=0.1,
+            legend_title_text='QC Outcome',
             xaxis_title=self._format_column_name(metric),
             yaxis_title="Sample Count"
         )
-        
-        return fig
+
+        return go.Figure(data=traces, layout=layout, skip_invalid=True)
 
     def create_box_plot(
         self,
@@ -153,24 +277,43 @@ class QCPlotter:
         """Create box plot for a quality metric by QC outcome."""
         if title is None:
             title = f"{self._format_column_name(metric)} by QC Outcome"
-        
-        fig = px.box(
-            data,
-            x='qc_outcome',
-            y=metric,
+
+        # Precompute box statistics so only a handful of numbers per
+        # outcome are sent to the browser instead of every sample
+        values = pd.to_numeric(data[metric], errors='coerce')
+        finite = values[np.isfinite(values)]
+        colors = self._get_outcome_colors()
+
+        traces = []
+        grouped = finite.groupby(data['qc_outcome'], sort=False)
+        for outcome, outcome_values in grouped:
+            v = outcome_values.to_numpy()
+            q1, median, q3 = np.quantile(v, [0.25, 0.5, 0.75])
+            iqr = q3 - q1
+            # Tukey fences: the most extreme samples within 1.5 IQR
+            lower = v[v >= q1 - 1.5 * iqr].min()
+            upper = v[v <= q3 + 1.5 * iqr].max()
+            traces.append(go.Box(
+                name=outcome,
+                x=[outcome],
+                q1=[q1],
+                median=[median],
+                q3=[q3],
+                lowerfence=[lower],
+                upperfence=[upper],
+                mean=[v.mean()],
+                sd=[v.std(ddof=1) if len(v) > 1 else 0.0],
+                marker_color=colors.get(outcome)
+            ))
+
+        layout = go.Layout(
             title=title,
-            labels={
-                'qc_outcome': 'QC Outcome',
-                metric: self._format_column_name(metric)
-            },
-            color='qc_outcome',
-            color_discrete_map=self._get_outcome_colors()
+            showlegend=False,
+            xaxis=dict(title='QC Outcome', tickangle=45),
+            yaxis_title=self._format_column_name(metric)
         )
-        
-        fig.update_xaxes(tickangle=45)
-        fig.update_layout(showlegend=False)
-        
-        return fig
+
+        return go.Figure(data=traces, layout=layout, skip_invalid=True)
 
     def create_scatter_plot(
         self,
@@ -180,38 +323,63 @@ class QCPlotter:
         title: Optional[str] = None
     ) -> go.Figure:
         """Create scatter plot comparing two quality metrics."""
+        x_name = self._format_column_name(x_metric)
+        y_name = self._format_column_name(y_metric)
         if title is None:
-            x_name = self._format_column_name(x_metric)
-            y_name = self._format_column_name(y_metric)
             title = f"{x_name} vs {y_name}"
-        
-        # Determine which columns to include in hover_data
-        hover_cols = [
-            column for column in ['sample_name', 'species']
-            if column in data.columns
-        ]
-        
-        fig = px.scatter(
-            data,
-            x=x_metric,
-            y=y_metric,
-            color='qc_outcome',
-            title=title,
-            labels={
-                x_metric: self._format_column_name(x_metric),
-                y_metric: self._format_column_name(y_metric)
-            },
-            hover_data=hover_cols,
-            color_discrete_map=self._get_outcome_colors()
+
+        if len(data) > SCATTER_DOWNSAMPLE_THRESHOLD:
+            data = _downsample_scatter(
+                data, x_metric, y_metric, SCATTER_MAX_POINTS_PER_OUTCOME
+            )
+        data = _downcast_numeric(data, [x_metric, y_metric])
+
+        # Only per-point hover fields are shipped as customdata; a species
+        # column holding a single value is written into the template instead
+        hover_lines = [f"{x_name}: %{{x}}", f"{y_name}: %{{y}}"]
+        custom_cols = []
+        if 'sample_name' in data.columns:
+            custom_cols.append('sample_name')
+        if 'species' in data.columns:
+            species = data['species'].dropna().unique()
+            if len(species) > 1:
+                custom_cols.append('species')
+            elif len(species) == 1:
+                hover_lines.append(f"Species: {species[0]}")
+        for i, column in enumerate(custom_cols):
+            label = self._format_column_name(column)
+            hover_lines.insert(i, f"{label}: %{{customdata[{i}]}}")
+
+        hovertemplate = (
+            "<br>".join(hover_lines) + "<extra>%{fullData.name}</extra>"
         )
-        
-        fig.update_layout(
-            xaxis_title=self._format_column_name(x_metric),
-            yaxis_title=self._format_column_name(y_metric)
+        colors = self._get_outcome_colors()
+
+        # One trace per outcome with its color resolved up front
+        traces = []
+        for outcome, group in data.groupby('qc_outcome', sort=False):
+            traces.append(go.Scatter(
+                x=group[x_metric].to_numpy(),
+                y=group[y_metric].to_numpy(),
+                mode='markers',
+                name=outcome,
+                marker=dict(color=colors.get(outcome)),
+                customdata=(
+                    group[custom_cols].to_numpy() if custom_cols else None
+                ),
+                hovertemplate=hovertemplate
+            ))
+
+        layout = go.Layout(
+            title=title,
+            legend_title_text='QC Outcome',
+            xaxis_title=x_name,
+            yaxis_title=y_name
         )
-        
-        return fig
 
+        return go.Figure(data=traces, layout=layout, skip_invalid=True)
+
+    @_cache_plot(columns_arg='metrics')
     def create_correlation_heatmap(
         self,
         data: pd.DataFrame,
@@ -223,19 +391,10 @@ class QCPlotter:
         available_metrics = [col for col in metrics if col in data.columns]
         
         if len(available_metrics) < 2:
-            fig = go.Figure()
-            fig.add_annotation(
-                text="Not enough numeric metrics for correlation analysis",
-                xref="paper", yref="paper",
-                x=0.5, y=0.5,
-                showarrow=False,
-                font=dict(size=16)
-            )
-            fig.update_layout(title=title)
-            return fig
+            return _message_figure("Not enough numeric metrics for correlation analysis", title)
         
         # Calculate correlation matrix
-        corr_matrix = data[available_metrics].corr()
+        corr_matrix = self._compute_correlation(data, available_metrics)
         
         fig = px.imshow(
             corr_matrix,
@@ -256,111 +415,338 @@ class QCPlotter:
     def create_quality_overview_dashboard(
         self, data: pd.DataFrame
     ) -> Dict[str, go.Figure]:
-        """Create a set of overview plots for dashboard display."""
-        plots = {}
-        
-        # Outcome distribution
-        plots['outcome_pie'] = self.create_outcome_pie_chart(data)
-        
-        # Species distribution
-        plots['species_bar'] = self.create_species_bar_chart(data)
-        
-        # Failed rules analysis
-        plots['failed_rules'] = self.create_failed_rules_chart(data)
-        
+        """Create a set of overview plots for dashboard display.
+
+        The plots are independent, so the ones not already cached are
+        built concurrently; most of the work happens in NumPy/pandas kernels
+        that release the GIL. Workers only read ``data``.
+        """
+        tasks = [
+            # Outcome distribution
+            ('outcome_pie', self.create_outcome_pie_chart, ()),
+            # Species distribution
+            ('species_bar', self.create_species_bar_chart, ()),
+            # Failed rules analysis
+            ('failed_rules', self.create_failed_rules_chart, ()),
+        ]
+
         # Quality metrics (dynamically find available numeric columns)
         available_cols = get_available_metrics(data)
-        
+
         if available_cols:
-            # Distribution of first available metric
-            plots['metric_dist'] = self.create_distribution_plot(
-                data, available_cols[0]
+            # Distribution and box plot of first available metric
+            tasks.append(
+                ('metric_dist', self.create_distribution_plot,
+                 (available_cols[0],))
             )
-            
-            # Box plot of first available metric
-            plots['metric_box'] = self.create_box_plot(
-                data, available_cols[0]
+            tasks.append(
+                ('metric_box', self.create_box_plot, (available_cols[0],))
             )
-            
+
             # Correlation heatmap if multiple metrics available
             if len(available_cols) > 1:
-                plots['correlation'] = self.create_correlation_heatmap(
-                    data, available_cols
+                tasks.append(
+                    ('correlation', self.create_correlation_heatmap,
+                     (available_cols,))
                 )
-        
-        return plots
+
+        # Cache hits are taken directly; only misses go to the pool
+        figures = {}
+        pending = []
+        for name, build, args in tasks:
+            cached = getattr(build, 'cached', None)
+            fig = cached(self, data, *args) if cached else None
+            if fig is None:
+                pending.append((name, build, args))
+            else:
+                figures[name] = fig
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=len(pending)) as executor:
+                futures = [
+                    (name, executor.submit(build, data, *args))
+                    for name, build, args in pending
+                ]
+                for name, future in futures:
+                    figures[name] = future.result()
+
+        return {name: figures[name] for name, _, _ in tasks}
+
+    @_cache_plot(
+        columns=['qc_outcome', 'species', 'failed_rules'],
+        # Looked up at call time; the function is defined further down
+        columns_fn=lambda data: get_available_metrics(data)
+    )
+    def create_quality_overview_dashboard_json(
+        self, data: pd.DataFrame
+    ) -> Dict[str, str]:
+        """Create the overview plots already serialized to Plotly JSON.
+
+        Serialization skips re-validation (the figures were validated when
+        built) and the result is cached, so repeated requests for the same
+        data return the stored strings without walking the traces again.
+        """
+        return {
+            name: pio.to_json(fig, validate=False, pretty=False)
+            for name, fig in self.create_quality_overview_dashboard(
+                data
+            ).items()
+        }
+
+    def _compute_correlation(
+        self, data: pd.DataFrame, metrics: list
+    ) -> pd.DataFrame:
+        """Compute the Pearson correlation matrix for the given metrics."""
+        values = data[metrics].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        # DataFrame.corr handles missing values pairwise; keep that
+        # behaviour and only take the ndarray fast path on complete data
+        if np.isnan(values).any():
+            return data[metrics].corr()
+
+        # Correlation is the Gram matrix of the standardized columns. NumPy
+        # hands ``X.T @ X`` to BLAS syrk, which only computes one triangle
+        # of the symmetric result and mirrors it.
+        centered = values - values.mean(axis=0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            scaled = centered / np.sqrt((centered ** 2).sum(axis=0))
+            corr = scaled.T @ scaled
+        np.clip(corr, -1.0, 1.0, out=corr)
+        diagonal = np.diagonal(corr).copy()
+        np.fill_diagonal(corr, np.where(np.isnan(diagonal), np.nan, 1.0))
+        return pd.DataFrame(corr, index=metrics, columns=metrics)
 
     def _analyze_failed_rules(self, data: pd.DataFrame) -> pd.DataFrame:
         """Analyze failed rules to get counts."""
-        failed_rules_counts = {}
-        
-        for failed_rules_str in data['failed_rules']:
-            if pd.notna(failed_rules_str) and failed_rules_str:
-                rules = failed_rules_str.split(',')
-                for rule in rules:
-                    rule = rule.strip()
-                    current_count = failed_rules_counts.get(rule, 0)
-                    failed_rules_counts[rule] = current_count + 1
-        
-        if failed_rules_counts:
-            items_list = list(failed_rules_counts.items())
-            df = pd.DataFrame(items_list, columns=['rule', 'count'])
-            return df.sort_values('count', ascending=False)
-        else:
-            return pd.DataFrame(columns=['rule', 'count'])
+        empty = pd.DataFrame(columns=['rule', 'count'])
+        failed_rules = data.get('failed_rules')
+
+        # PASS-only runs leave the column entirely empty
+        if failed_rules is None or failed_rules.isna().all():
+            return empty
+
+        failed_rules = failed_rules.dropna()
+        failed_rules = failed_rules[failed_rules.astype(bool)]
+
+        if failed_rules.empty:
+            return empty
+
+        if isinstance(failed_rules.dtype, pd.ArrowDtype):
+            return _count_arrow_rules(failed_rules)
+
+        # Samples share a small set of failure combinations, so split each
+        # distinct string once and weight its rules by how often it occurs
+        combinations = failed_rules.astype(str).value_counts()
+        rules = pd.DataFrame({
+            'rule': combinations.index.str.split(','),
+            'count': combinations.to_numpy()
+        }).explode('rule')
+        rules['rule'] = rules['rule'].str.strip()
+
+        counts = rules.groupby('rule', sort=False)['count'].sum()
+        counts = counts.sort_values(ascending=False, kind='stable')
+        return counts.reset_index()
 
     def _format_column_name(self, col_name: str) -> str:
         """Format column name for display."""
-        # Handle common patterns and return human-readable names
-        # Remove common prefixes
-        display_name = col_name
-        for prefix in ['QC/', 'QC.', 'QC_']:
-            if display_name.startswith(prefix):
-                display_name = display_name[len(prefix):]
-                break
-        
-        # Replace underscores and format
-        display_name = display_name.replace('_', ' ').title()
-        return display_name
+        return format_column_name(col_name)
 
     def _get_outcome_colors(self) -> Dict[str, str]:
         """Get color mapping for QC outcomes."""
-        default_colors = {
-            'PASS': '#28a745',  # Green
-            'WARN': '#ffc107',  # Yellow
-            'FAIL': '#dc3545',  # Red
-            'WARN_COMPLETENESS': '#fd7e14',  # Orange
-            'WARN_CONTAMINATION': '#e83e8c',  # Pink
-            'FAIL_SIZE': '#6f42c1',  # Purple
-            'FAIL_CONTIGUITY': '#20c997'  # Teal
-        }
-        
-        # Override with config colors if available
-        config_colors = self.priority_colors.get('qc_outcome', {})
-        default_colors.update(config_colors)
-        
-        return default_colors
+        return self._outcome_colors
+
+
+def _message_figure(text: str, title: str) -> go.Figure:
+    """Build an empty figure that shows a centered message."""
+    layout = go.Layout(
+        title=title,
+        annotations=[dict(
+            text=text,
+            xref="paper", yref="paper",
+            x=0.5, y=0.5,
+            showarrow=False,
+            font=dict(size=16)
+        )]
+    )
+    return go.Figure(layout=layout, skip_invalid=True)
+
+
+def _category_counts(values: pd.Series) -> pd.Series:
+    """Count a low-cardinality column, most frequent first.
+
+    Equivalent to ``value_counts`` but counts the categorical codes with
+    ``np.bincount`` so each string is hashed once per category, not per row.
+    """
+    categorical = values.astype('category')
+    codes = categorical.cat.codes.to_numpy()
+    categories = categorical.cat.categories
+    # Missing values have code -1 and are dropped like in value_counts
+    counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+    result = pd.Series(counts, index=categories.to_numpy(), name='count')
+    result = result[result > 0]
+    return result.sort_values(ascending=False, kind='stable')
+
+
+def _horizontal_bar_figure(
+    x: np.ndarray,
+    y: np.ndarray,
+    title: str,
+    x_title: str,
+    y_title: str,
+    height: int,
+    left_margin: int
+) -> go.Figure:
+    """Build a horizontal count bar chart from pre-aggregated arrays."""
+    layout = go.Layout(
+        title=title,
+        xaxis_title=x_title,
+        yaxis=dict(title=y_title, categoryorder='total ascending'),
+        height=height,
+        margin=dict(l=left_margin)
+    )
+    trace = go.Bar(x=x, y=y, orientation='h')
+    return go.Figure(data=[trace], layout=layout, skip_invalid=True)
+
+
+def _count_arrow_rules(failed_rules: pd.Series) -> pd.DataFrame:
+    """Count comma-separated rules of an Arrow-backed string Series.
+
+    Splitting, trimming and counting run as Arrow compute kernels, so no
+    Python string objects are created for the tokens.
+    """
+    # Arrow-backed dtypes imply pyarrow is installed
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    values = pa.array(failed_rules.array, type=pa.string())
+    tokens = pc.utf8_trim_whitespace(
+        pc.list_flatten(pc.split_pattern(values, ','))
+    )
+    counts = tokens.value_counts()
+    result = pd.DataFrame({
+        'rule': counts.field(0).to_pandas(),
+        'count': counts.field(1).to_pandas()
+    })
+    result = result.sort_values('count', ascending=False, kind='stable')
+    return result.reset_index(drop=True)
+
+
+@functools.lru_cache(maxsize=256)
+def format_column_name(col_name: str) -> str:
+    """Format column name for display (memoized; names repeat per plot)."""
+    # Handle common patterns and return human-readable names
+    # Remove common prefixes
+    display_name = col_name
+    for prefix in COLUMN_NAME_PREFIXES:
+        if display_name.startswith(prefix):
+            display_name = display_name[len(prefix):]
+            break
+
+    # Replace underscores and format
+    display_name = display_name.replace('_', ' ').title()
+    return display_name
+
+
+def _downcast_numeric(data: pd.DataFrame, columns: list) -> pd.DataFrame:
+    """Return a copy of ``data`` with plotted numeric columns downcast.
+
+    Plotly serializes every value it is given, so narrower dtypes
+    (float32, int32/int16) shrink the figure payload sent to the browser.
+    Float columns are only narrowed when float32 holds every value
+    exactly, so plotted and hover values are never rounded.
+    """
+    data = data.copy(deep=False)
+    for column in dict.fromkeys(columns):
+        if column not in data.columns:
+            continue
+        values = data[column]
+        if pd.api.types.is_bool_dtype(values):
+            continue
+        if pd.api.types.is_integer_dtype(values):
+            data[column] = pd.to_numeric(values, downcast='integer')
+        elif pd.api.types.is_float_dtype(values):
+            floats = values.to_numpy(dtype=np.float64, na_value=np.nan)
+            if np.array_equal(
+                floats, floats.astype(np.float32), equal_nan=True
+            ):
+                data[column] = pd.to_numeric(values, downcast='float')
+    return data
+
+
+def _lttb_indices(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Select ``n_out`` points with Largest-Triangle-Three-Buckets.
+
+    Points are ordered by ``x``; the first and last points are always kept
+    and each bucket in between contributes the point forming the largest
+    triangle with its neighbours. Returns positions into ``x``/``y``.
+    """
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    order = np.argsort(x, kind='stable')
+    xs = x[order]
+    ys = y[order]
+    every = (n - 2) / (n_out - 2)
+
+    selected = np.empty(n_out, dtype=np.intp)
+    selected[0] = 0
+    a = 0
+    for i in range(n_out - 2):
+        start = int(i * every) + 1
+        end = int((i + 1) * every) + 1
+        next_end = min(int((i + 2) * every) + 1, n)
+        if next_end <= end:
+            avg_x, avg_y = xs[n - 1], ys[n - 1]
+        else:
+            avg_x = xs[end:next_end].mean()
+            avg_y = ys[end:next_end].mean()
+        area = np.abs(
+            (xs[a] - avg_x) * (ys[start:end] - ys[a])
+            - (xs[a] - xs[start:end]) * (avg_y - ys[a])
+        )
+        a = start + int(area.argmax())
+        selected[i + 1] = a
+    selected[-1] = n - 1
+
+    return order[selected]
+
+
+def _downsample_scatter(
+    data: pd.DataFrame,
+    x_metric: str,
+    y_metric: str,
+    max_points: int
+) -> pd.DataFrame:
+    """Downsample scatter data per QC outcome, keeping all other columns."""
+    x = pd.to_numeric(data[x_metric], errors='coerce').to_numpy(
+        dtype=np.float64, na_value=np.nan
+    )
+    y = pd.to_numeric(data[y_metric], errors='coerce').to_numpy(
+        dtype=np.float64, na_value=np.nan
+    )
+    plottable = np.isfinite(x) & np.isfinite(y)
+
+    keep = []
+    outcomes = data['qc_outcome'].to_numpy()
+    for outcome in pd.unique(outcomes[plottable]):
+        positions = np.flatnonzero(plottable & (outcomes == outcome))
+        chosen = _lttb_indices(x[positions], y[positions], max_points)
+        keep.append(positions[chosen])
+
+    if not keep:
+        return data.iloc[:0]
+    return data.iloc[np.sort(np.concatenate(keep))]
 
 
 def get_available_metrics(data: pd.DataFrame) -> list:
     """Get list of available numeric metrics for plotting."""
-    # Exclude system/non-metric columns
-    excluded_cols = [
-        'sample_name', 'species', 'qc_outcome', 'qc_action',
-        'failed_rules', 'passed_rules', 'error', 'Select'
-    ]
-    
-    available_metrics = []
-    for col in data.columns:
-        if col in excluded_cols:
-            continue
-        # Check if column is numeric
-        if pd.api.types.is_numeric_dtype(data[col]):
-            # Ensure there's actual data (not all NaN)
-            if data[col].notna().any():
-                available_metrics.append(col)
-    
-    return available_metrics
+    numeric = data.select_dtypes(include=['number', 'bool']).drop(
+        columns=list(EXCLUDED_METRIC_COLUMNS), errors='ignore'
+    )
+    # Ensure there's actual data (not all NaN), in one vectorized pass
+    has_data = numeric.notna().any(axis=0)
+    return has_data[has_data].index.tolist()
 
 
 def validate_metric_for_plotting(data: pd.DataFrame, metric: str) -> bool:
@@ -368,9 +754,13 @@ def validate_metric_for_plotting(data: pd.DataFrame, metric: str) -> bool:
     if metric not in data.columns:
         return False
     
+    column = data[metric]
+    # Numeric columns need no conversion to decide
+    if pd.api.types.is_numeric_dtype(column):
+        return True
+
     # Check if column has numeric data
     try:
-        pd.to_numeric(data[metric], errors='coerce')
-        return True
+        return bool(pd.to_numeric(column, errors='coerce').notna().any())
     except (ValueError, TypeError):
         return False
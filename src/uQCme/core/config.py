@@ -23,6 +23,9 @@ class QCInput(BaseModel):
 class QCOutput(BaseModel):
     results: str = "qc_results.tsv"
     warnings: str = "qc_warnings.tsv"
+    # Rows per write when saving results; smaller chunks lower peak
+    # memory, larger chunks need fewer writes
+    chunksize: int = Field(default=100_000, gt=0)
 
 
 class QCConfig(BaseModel):
@@ -106,10 +109,3 @@ class UQCMeConfig(BaseModel):
     app: Optional[AppConfig] = None
     log: LogConfig = Field(default_factory=LogConfig)
     outcome_priorities: Optional[Dict[str, int]] = None
-
-    @field_validator('qc', 'app', mode='before')
-    @classmethod
-    def ensure_dict(cls, v):
-        if v is None:
-            return {}
-        return v
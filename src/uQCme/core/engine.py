@@ -1,17 +1,23 @@
 """Core QC processing engine."""
 
+import functools
 import logging
+import operator
+import os
+import numpy as np
 import pandas as pd
-import yaml
 import re
+from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Any, Optional
+from typing import Callable, Dict, FrozenSet, List, Any, Optional, Tuple
 from pandera.errors import SchemaError
 from .loader import (
     collect_duplicate_row_warnings,
     get_unique_columns_from_mapping,
     load_data_from_config,
     load_config_from_file,
+    load_yaml_file,
+    read_reference_table,
     validate_run_data_frame,
 )
 from .config import UQCMeConfig, DataInput, QCConfig
@@ -23,6 +29,27 @@ from .schemas import QCRulesSchema, QCTestsSchema
 
 logger = logging.getLogger(__name__)
 
+# Bundled default configuration, mapping, rules and tests
+DEFAULTS_DIR = Path(__file__).parent.parent / 'defaults'
+
+# Numeric rule operators; these work on scalars and NumPy arrays alike
+COMPARISON_OPERATORS: Dict[str, Callable[[Any, Any], Any]] = {
+    '>=': operator.ge,
+    '<=': operator.le,
+    '>': operator.gt,
+    '<': operator.lt,
+}
+
+# Per-sample rule status codes in process_samples' int8 status matrix
+RULE_NOT_EVALUATED, RULE_PASSED, RULE_FAILED = 0, 1, 2
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern:
+    """Compile a regex rule threshold, reusing earlier compilations."""
+    return re.compile(pattern)
+
+
 class QCProcessor:
     """Main class for processing QC rules and generating outcomes."""
 
@@ -64,6 +91,114 @@ class QCProcessor:
         self.results: pd.DataFrame = pd.DataFrame()
         self.warnings: set = set()  # Collect unique warnings
         self.skipped_rules: set = set()  # Collect unique skipped rules
+        self._warning_cache: Dict[Tuple[str, str], str] = {}
+
+    @property
+    def mapping(self) -> Dict[str, Any]:
+        """Mapping configuration loaded from the mapping YAML."""
+        return self._mapping
+
+    @mapping.setter
+    def mapping(self, value: Dict[str, Any]):
+        # Derived lookups are rebuilt lazily from the new mapping
+        self._mapping = value
+        self._field_mapping = None
+
+    @property
+    def qc_overrides(self) -> Dict[str, Any]:
+        """Normalized QC override settings from the mapping."""
+        return self._qc_overrides
+
+    @qc_overrides.setter
+    def qc_overrides(self, value: Dict[str, Any]):
+        self._qc_overrides = value
+        # Resolve the default assembly type once for all samples
+        default_assembly = value.get('assembly_type', 'short')
+        if isinstance(default_assembly, list) and default_assembly:
+            default_assembly = default_assembly[0]
+        self._default_assembly = default_assembly
+
+    @property
+    def qc_rules(self) -> pd.DataFrame:
+        """QC rule definitions loaded from the QC rules TSV."""
+        return self._qc_rules
+
+    @qc_rules.setter
+    def qc_rules(self, value: pd.DataFrame):
+        self._qc_rules = value
+        self._rules = None
+        self._rule_patterns = None
+
+    def _get_rules(self) -> List[tuple]:
+        """QC rules as ``Rule`` namedtuples, built once per rules table."""
+        if self._rules is None:
+            self._rules = list(
+                self.qc_rules.itertuples(index=False, name='Rule')
+            )
+        return self._rules
+
+    def _get_rule_patterns(self) -> Dict[Any, re.Pattern]:
+        """Map rule_id to its compiled pattern for regex rules."""
+        if self._rule_patterns is None:
+            self._rule_patterns = {}
+            if not self.qc_rules.empty:
+                rules = self.qc_rules[self.qc_rules['operator'] == 'regex']
+                for rule_id, pattern in zip(rules['rule_id'], rules['value']):
+                    if pd.isna(pattern):
+                        continue
+                    try:
+                        self._rule_patterns[rule_id] = _compile_pattern(
+                            str(pattern)
+                        )
+                    except re.error:
+                        # Left uncompiled; fails only if the rule is used
+                        continue
+        return self._rule_patterns
+
+    @property
+    def qc_tests(self) -> pd.DataFrame:
+        """QC test definitions loaded from the QC tests TSV."""
+        return self._qc_tests
+
+    @qc_tests.setter
+    def qc_tests(self, value: pd.DataFrame):
+        self._qc_tests = value
+        self._tests_by_outcome = None
+        self._parsed_tests = None
+
+    def _get_parsed_tests(self) -> List[tuple]:
+        """Parse QC test rule conditions once per tests table.
+
+        Returns (outcome_id, passed_required, failed_required) tuples in
+        table order, where each required entry is a frozenset of stripped
+        rule ids or None when that condition column is empty.
+        """
+        if self._parsed_tests is None:
+            tests = self.qc_tests
+            empty = pd.Series(None, index=tests.index, dtype=object)
+            self._parsed_tests = [
+                (outcome_id, _parse_rule_list(passed), _parse_rule_list(failed))
+                for outcome_id, passed, failed in zip(
+                    tests['outcome_id'] if not tests.empty else [],
+                    tests.get('passed_rule_conditions', empty),
+                    tests.get('failed_rule_conditions', empty)
+                )
+            ]
+        return self._parsed_tests
+
+    def _get_tests_by_outcome(self) -> Dict[Any, tuple]:
+        """Map outcome_id to (priority, action_required), first row wins."""
+        if self._tests_by_outcome is None:
+            tests = self.qc_tests
+            if tests.empty:
+                self._tests_by_outcome = {}
+            else:
+                tests = tests.drop_duplicates('outcome_id')
+                self._tests_by_outcome = dict(zip(
+                    tests['outcome_id'],
+                    zip(tests['priority'], tests['action_required'])
+                ))
+        return self._tests_by_outcome
 
     @property
     def qc_config(self) -> QCConfig:
@@ -86,30 +221,11 @@ class QCProcessor:
 
     def _get_default_config(self) -> UQCMeConfig:
         """Get default configuration using bundled files."""
-        # defaults are in ../defaults relative to this file
-        defaults_dir = Path(__file__).parent.parent / 'defaults'
-        config_path = defaults_dir / 'config.yaml'
-        
-        print(f"✓ Using default configuration from {defaults_dir}")
-        
-        try:
-            config = load_config_from_file(str(config_path))
-        except Exception as e:
-            raise ConfigError(f"Error loading default config: {e}")
-            
-        # Update paths to point to the defaults directory if local files
-        # don't exist
-        if config.qc and config.qc.input:
-            inp = config.qc.input
-            # Update mapping, rules, tests to absolute paths in defaults dir
-            if not Path(inp.mapping).exists():
-                inp.mapping = str(defaults_dir / Path(inp.mapping).name)
-            if not Path(inp.qc_rules).exists():
-                inp.qc_rules = str(defaults_dir / Path(inp.qc_rules).name)
-            if not Path(inp.qc_tests).exists():
-                inp.qc_tests = str(defaults_dir / Path(inp.qc_tests).name)
-        
-        return config
+        print(f"✓ Using default configuration from {DEFAULTS_DIR}")
+
+        # The bundled config is parsed once per working directory; each
+        # processor gets its own copy to modify
+        return _load_default_config(os.getcwd()).model_copy(deep=True)
 
     def load_input_files(self):
         """Load all input files specified in configuration."""
@@ -136,7 +252,7 @@ class QCProcessor:
         try:
             # Load QC rules
             rules_path = self.qc_config.input.qc_rules
-            self.qc_rules = pd.read_csv(rules_path, sep='\t')
+            self.qc_rules = read_reference_table(rules_path, QCRulesSchema)
             QCRulesSchema.validate(self.qc_rules)
             self.logger.info("✓ QC rules loaded: %d rules from %s",
                              len(self.qc_rules), rules_path)
@@ -148,7 +264,7 @@ class QCProcessor:
         try:
             # Load QC tests
             tests_path = self.qc_config.input.qc_tests
-            self.qc_tests = pd.read_csv(tests_path, sep='\t')
+            self.qc_tests = read_reference_table(tests_path, QCTestsSchema)
             QCTestsSchema.validate(self.qc_tests)
             self.logger.info("✓ QC tests loaded: %d tests from %s",
                              len(self.qc_tests), tests_path)
@@ -159,8 +275,7 @@ class QCProcessor:
 
         # Load mapping configuration
         mapping_path = self.qc_config.input.mapping
-        with open(mapping_path, 'r', encoding='utf-8') as f:
-            self.mapping = yaml.safe_load(f)
+        self.mapping = load_yaml_file(mapping_path)
         self.logger.info("✓ Mapping configuration loaded from %s",
                          mapping_path)
 
@@ -192,9 +307,15 @@ class QCProcessor:
         
         return field_mapping
 
+    def _get_field_mapping(self) -> Dict[str, str]:
+        """Return the field mapping, building it once per mapping."""
+        if self._field_mapping is None:
+            self._field_mapping = self._build_field_mapping()
+        return self._field_mapping
+
     def _load_qc_overrides(self):
         """Load and normalize QC override settings."""
-        self.qc_overrides = {}
+        qc_overrides = {}
 
         if 'QC_overrides' in self.mapping:
             overrides = self.mapping['QC_overrides']
@@ -203,14 +324,15 @@ class QCProcessor:
             for key, value in overrides.items():
                 if isinstance(value, str):
                     # Convert single string to list
-                    self.qc_overrides[key] = [value]
+                    qc_overrides[key] = [value]
                 elif isinstance(value, list):
                     # Keep list as is
-                    self.qc_overrides[key] = value
+                    qc_overrides[key] = value
                 else:
                     # Keep other types as is (like booleans, numbers)
-                    self.qc_overrides[key] = value
+                    qc_overrides[key] = value
 
+        self.qc_overrides = qc_overrides
         self.logger.info(f"✓ QC overrides loaded: {self.qc_overrides}")
 
     def prepare_run_data(
@@ -235,9 +357,13 @@ class QCProcessor:
 
         return data
 
-    def _apply_operator(self, value: Any, operator: str,
-                        threshold: Any, field_name: str = "unknown") -> bool:
-        """Apply comparison operator between value and threshold."""
+    def _apply_operator(self, value: Any, op: str,
+                        threshold: Any, field_name: str = "unknown",
+                        compiled: Optional[re.Pattern] = None) -> bool:
+        """Apply comparison operator between value and threshold.
+
+        For regex rules, ``compiled`` may hold the precompiled threshold.
+        """
         try:
             # Handle null/None/NaN values - treat as missing data, rule fails
             if value is None or pd.isna(value) or str(value).lower() in ('null', 'none', 'nan', ''):
@@ -246,53 +372,38 @@ class QCProcessor:
                     f"skipping comparison"
                 )
                 return False
-            
-            # Handle numeric comparisons
-            if operator == '>=':
-                return float(value) >= float(threshold)
-            elif operator == '<=':
-                return float(value) <= float(threshold)
-            elif operator == '>':
-                return float(value) > float(threshold)
-            elif operator == '<':
-                return float(value) < float(threshold)
-            elif operator == '=':
+
+            if op in COMPARISON_OPERATORS:
+                return COMPARISON_OPERATORS[op](float(value), float(threshold))
+            elif op == '=':
                 return str(value) == str(threshold)
-            elif operator == 'regex':
-                # Handle NaN values properly for regex
-                if pd.isna(value) or pd.isna(threshold):
+            elif op == 'regex':
+                # Handle NaN thresholds properly for regex
+                if pd.isna(threshold):
                     return False
-                return bool(re.match(str(threshold), str(value)))
+                if compiled is None:
+                    compiled = _compile_pattern(str(threshold))
+                return bool(compiled.match(str(value)))
             else:
-                self.logger.warning(f"Unknown operator {operator}")
+                self.logger.warning(f"Unknown operator {op}")
                 return False
         except (ValueError, TypeError) as e:
             self.logger.warning(
-                f"Error applying operator {operator} on field '{field_name}': "
+                f"Error applying operator {op} on field '{field_name}': "
                 f"value='{value}', threshold='{threshold}' - {e}"
             )
             return False
 
-    def _evaluate_rule(self, sample_data: pd.Series, rule: pd.Series) -> str:
-        """Evaluate a single QC rule against sample data.
-        
-        Returns:
-            'PASS': Rule passed
-            'FAIL': Rule failed  
-            'SKIP': Rule cannot be evaluated (missing field)
-        """
-        # Get the field value from sample data
-        field_name = rule['field']
-        rule_id = rule['rule_id']
-
-        # Build dynamic field mapping from configuration
-        field_mapping = self._build_field_mapping()
+    def _missing_field_warning(self, field_name: str,
+                               field_mapping: Dict[str, str]) -> str:
+        """Return the warning for a rule field missing from the data.
 
-        # Get the actual column name from mapping
+        Messages are cached per field so repeated misses reuse the string.
+        """
         actual_field = field_mapping.get(field_name, field_name)
-
-        # Check if field exists in sample data
-        if actual_field not in sample_data.index:
+        key = (field_name, actual_field)
+        warning_msg = self._warning_cache.get(key)
+        if warning_msg is None:
             # Generate helpful warning message
             if field_name in field_mapping:
                 # Field was mapped but target column doesn't exist
@@ -306,17 +417,48 @@ class QCProcessor:
                     f"Field '{field_name}' not found in sample data "
                     f"(no mapping defined in config)"
                 )
-            self.warnings.add(warning_msg)
+            self._warning_cache[key] = warning_msg
+        return warning_msg
+
+    def _evaluate_rule(self, sample_data: pd.Series, rule: Any) -> str:
+        """Evaluate a single QC rule against sample data.
+
+        ``rule`` is a rule row with attribute access, either a ``Rule``
+        from ``_get_rules`` or a Series.
+        
+        Returns:
+            'PASS': Rule passed
+            'FAIL': Rule failed  
+            'SKIP': Rule cannot be evaluated (missing field)
+        """
+        # Get the field value from sample data
+        field_name = rule.field
+        rule_id = rule.rule_id
+
+        # Field mapping from configuration, built once per mapping
+        field_mapping = self._get_field_mapping()
+
+        # Get the actual column name from mapping
+        actual_field = field_mapping.get(field_name, field_name)
+
+        # Check if field exists in sample data
+        if actual_field not in sample_data.index:
+            self.warnings.add(
+                self._missing_field_warning(field_name, field_mapping)
+            )
             self.skipped_rules.add(rule_id)
             return 'SKIP'
 
         if actual_field:
             value = sample_data[actual_field]
-            operator = rule['operator']
-            threshold = rule['value']
+            op = rule.operator
+            threshold = rule.value
+
+            compiled = self._get_rule_patterns().get(rule_id)
 
             # Apply the rule
-            if self._apply_operator(value, operator, threshold, actual_field):
+            if self._apply_operator(value, op, threshold, actual_field,
+                                    compiled):
                 return 'PASS'
             else:
                 return 'FAIL'
@@ -335,20 +477,17 @@ class QCProcessor:
         attributes['species'] = species_val
 
         # Get assembly_type with override default
-        default_assembly = self.qc_overrides.get('assembly_type', 'short')
-        if isinstance(default_assembly, list) and default_assembly:
-            default_assembly = default_assembly[0]
         attributes['assembly_type'] = sample.get(
-            'assembly_type', default_assembly
+            'assembly_type', self._default_assembly
         )
 
         return attributes
 
-    def _rule_matches_criteria(self, rule: pd.Series,
+    def _rule_matches_criteria(self, rule: Any,
                                sample_attributes: Dict[str, str]) -> bool:
         """Check if a rule matches the sample criteria."""
         # Species filtering (strip whitespace for comparison)
-        rule_species = str(rule['species']).strip() if pd.notna(rule['species']) else ''
+        rule_species = str(rule.species).strip() if pd.notna(rule.species) else ''
         sample_species = str(sample_attributes['species']).strip() if sample_attributes.get('species') else ''
         # Explicitly handle empty species values: if either is empty, do not match unless rule_species is 'all'
         if rule_species == '' or sample_species == '':
@@ -358,13 +497,13 @@ class QCProcessor:
             return False
 
         # Assembly type filtering
-        rule_assembly = rule['assembly_type']
+        rule_assembly = rule.assembly_type
         sample_assembly = sample_attributes['assembly_type']
         if rule_assembly != 'all' and rule_assembly != sample_assembly:
             return False
 
         # Software filtering using overrides
-        rule_software = rule['software']
+        rule_software = getattr(rule, 'software', None)
         if 'software' in self.qc_overrides:
             allowed_software = self.qc_overrides['software']
             # If software is specified in rule, it must be in allowed list
@@ -376,55 +515,268 @@ class QCProcessor:
 
         return True
 
+    def _sample_attribute_columns(self) -> Dict[str, np.ndarray]:
+        """Get per-sample species and assembly type as arrays.
+
+        Mirrors ``_get_sample_attributes`` and the normalization done in
+        ``_rule_matches_criteria``: species are stripped and lower-cased,
+        with empty values as ''.
+        """
+        n_samples = len(self.run_data)
+
+        species = np.full(n_samples, '', dtype=object)
+        if 'species' in self.run_data.columns:
+            values = self.run_data['species']
+            # Normalize each distinct species once, then spread by code
+            codes, uniques = pd.factorize(values)
+            normalized = np.array(
+                [_normalize_species(value) for value in uniques] + [''],
+                dtype=object
+            )
+            species[:] = normalized[codes]
+            # Missing values (code -1) keep their own truthiness rules
+            for i in np.flatnonzero(codes < 0):
+                species[i] = _normalize_species(values.iat[i])
+
+        if 'assembly_type' in self.run_data.columns:
+            assembly = self.run_data['assembly_type'].to_numpy(dtype=object)
+        else:
+            assembly = np.full(
+                n_samples, self._default_assembly, dtype=object
+            )
+
+        return {'species': species, 'assembly_type': assembly}
+
+    def _rule_applicability(self, rules: pd.DataFrame,
+                            attributes: Dict[str, np.ndarray]) -> np.ndarray:
+        """Vectorized ``_rule_matches_criteria`` for all samples and rules.
+
+        Rule fields are normalized once and compared against the distinct
+        sample species and assembly types, giving an (n_samples, n_rules)
+        boolean matrix.
+        """
+        if rules.empty:
+            return np.zeros((len(attributes['species']), 0), dtype=bool)
+
+        # Species filtering (strip whitespace, case-insensitive); an empty
+        # rule species never matches, an empty sample species only
+        # matches rules for 'all' species
+        rule_species = rules['species'].where(rules['species'].notna(), '')
+        rule_species = rule_species.astype(str).str.strip()
+        rule_all = (rule_species == 'all').to_numpy()
+        rule_empty = (rule_species == '').to_numpy()
+        rule_species_lower = rule_species.str.lower().to_numpy(dtype=object)
+
+        codes, uniques = pd.factorize(attributes['species'])
+        species_match = (
+            rule_all[None, :]
+            | (uniques.astype(object)[:, None] == rule_species_lower[None, :])
+        ) & ~rule_empty[None, :]
+        mask = species_match[codes]
+
+        # Assembly type filtering
+        rule_assembly = rules['assembly_type'].to_numpy(dtype=object)
+        codes, uniques = pd.factorize(
+            attributes['assembly_type'], use_na_sentinel=False
+        )
+        assembly_match = (
+            (rule_assembly == 'all')[None, :]
+            | (uniques.astype(object)[:, None] == rule_assembly[None, :])
+        )
+        mask &= assembly_match[codes]
+
+        # Software filtering using overrides
+        if 'software' in self.qc_overrides:
+            allowed_lower = {
+                s.lower() for s in self.qc_overrides['software']
+            }
+            software_allowed = np.array([
+                not (software and pd.notna(software))
+                or str(software).lower() in allowed_lower
+                for software in rules['software']
+            ], dtype=bool)
+            mask &= software_allowed[None, :]
+
+        return mask
+
+    def _missing_mask(self, values: pd.Series) -> np.ndarray:
+        """Vectorized null/missing check matching ``_apply_operator``."""
+        missing = values.isna().to_numpy()
+        if not pd.api.types.is_numeric_dtype(values):
+            missing |= values.astype(str).str.lower().isin(
+                ('null', 'none', 'nan', '')
+            ).to_numpy()
+        return missing
+
+    def _numeric_values(self, values: pd.Series,
+                        missing: np.ndarray) -> np.ndarray:
+        """Convert values to float as ``float(value)`` would, NaN if not."""
+        if pd.api.types.is_numeric_dtype(values):
+            return values.to_numpy(dtype=float, na_value=np.nan)
+
+        numbers = pd.to_numeric(values, errors='coerce').to_numpy(
+            dtype=float, na_value=np.nan
+        )
+        # Fall back to float() for the few forms to_numeric rejects
+        for i in np.flatnonzero(np.isnan(numbers) & ~missing):
+            try:
+                numbers[i] = float(values.iat[i])
+            except (ValueError, TypeError):
+                pass
+        return numbers
+
+    def _evaluate_rule_column(self, values: pd.Series, op: str,
+                              threshold: Any, field_name: str,
+                              applicable: np.ndarray,
+                              cache: Dict[str, Any],
+                              compiled: Optional[re.Pattern] = None
+                              ) -> np.ndarray:
+        """Vectorized ``_apply_operator`` over a whole data column.
+
+        Returns a boolean pass array; missing values never pass. Derived
+        arrays (missing mask, float values) are kept in ``cache`` so rules
+        sharing a field convert the column only once.
+        """
+        if 'missing' not in cache:
+            cache['missing'] = self._missing_mask(values)
+        missing = cache['missing']
+        evaluated = applicable & ~missing
+
+        if op in COMPARISON_OPERATORS:
+            if 'numbers' not in cache:
+                cache['numbers'] = self._numeric_values(values, missing)
+            numbers = cache['numbers']
+            try:
+                limit = float(threshold)
+            except (ValueError, TypeError) as e:
+                if evaluated.any():
+                    self.logger.warning(
+                        f"Error applying operator {op} on field "
+                        f"'{field_name}': threshold='{threshold}' - {e}"
+                    )
+                return np.zeros(len(values), dtype=bool)
+
+            for i in np.flatnonzero(evaluated & np.isnan(numbers)):
+                self.logger.warning(
+                    f"Error applying operator {op} on field "
+                    f"'{field_name}': value='{values.iat[i]}', "
+                    f"threshold='{threshold}' - could not convert to float"
+                )
+            with np.errstate(invalid='ignore'):
+                passed = COMPARISON_OPERATORS[op](numbers, limit)
+        elif op == '=':
+            if 'strings' not in cache:
+                cache['strings'] = values.astype(str)
+            passed = (cache['strings'] == str(threshold)).to_numpy()
+        elif op == 'regex':
+            if pd.isna(threshold):
+                return np.zeros(len(values), dtype=bool)
+            if 'strings' not in cache:
+                cache['strings'] = values.astype(str)
+            if compiled is None:
+                compiled = _compile_pattern(str(threshold))
+            passed = cache['strings'].str.match(compiled).to_numpy(
+                dtype=bool
+            )
+        else:
+            if evaluated.any():
+                self.logger.warning(f"Unknown operator {op}")
+            return np.zeros(len(values), dtype=bool)
+
+        return passed & ~missing
+
     def process_samples(self):
-        """Process all samples through QC rules."""
+        """Process all samples through QC rules.
+
+        Rules are evaluated column-wise: for each rule, the samples it
+        applies to and their pass/fail results are computed as vectors.
+        """
         self.logger.info("\n🔍 Processing samples through QC rules...")
 
-        results_list = []
+        run_data = self.run_data
+        rules = self._get_rules()
+        applicability = self._rule_applicability(
+            self.qc_rules, self._sample_attribute_columns()
+        )
+        rule_ids = np.array(
+            [rule.rule_id for rule in rules], dtype=object
+        )
+        field_mapping = self._get_field_mapping()
+        rule_patterns = self._get_rule_patterns()
+
+        # Rule status per sample, as RULE_* codes
+        status = np.full(
+            (len(run_data), len(rules)), RULE_NOT_EVALUATED, dtype=np.int8
+        )
+        column_caches: Dict[str, Dict[str, Any]] = {}
 
-        for idx, sample in self.run_data.iterrows():
-            sample_results = sample.copy()
-            failed_rules = []
-            passed_rules = []
+        # Only rules applying to at least one sample are evaluated
+        for j in np.flatnonzero(applicability.any(axis=0)):
+            rule = rules[j]
+            rule_id = rule.rule_id
+            applicable = applicability[:, j]
 
-            # Get sample attributes with defaults
-            sample_attributes = self._get_sample_attributes(sample)
+            field_name = rule.field
+            actual_field = field_mapping.get(field_name, field_name)
 
-            # Test each rule against this sample
-            for _, rule in self.qc_rules.iterrows():
-                rule_id = rule['rule_id']
+            # Check if field exists in sample data
+            if actual_field not in run_data.columns:
+                self.warnings.add(
+                    self._missing_field_warning(field_name, field_mapping)
+                )
+                self.skipped_rules.add(rule_id)
+                continue
 
-                # Check if rule applies to this sample
-                if not self._rule_matches_criteria(rule, sample_attributes):
-                    continue
+            if not actual_field:
+                self.skipped_rules.add(rule_id)
+                continue
+
+            passed = self._evaluate_rule_column(
+                run_data[actual_field], rule.operator, rule.value,
+                actual_field, applicable,
+                column_caches.setdefault(actual_field, {}),
+                rule_patterns.get(rule_id)
+            )
+            status[applicable, j] = np.where(
+                passed[applicable], RULE_PASSED, RULE_FAILED
+            )
 
-                # Evaluate the rule
-                rule_result = self._evaluate_rule(sample, rule)
-                if rule_result == 'PASS':
-                    passed_rules.append(rule_id)
-                elif rule_result == 'FAIL':
-                    failed_rules.append(rule_id)
-                # 'SKIP' rules are not added to either list
+        # Samples sharing a status row share their results, so each
+        # distinct row is resolved once and broadcast back to the samples
+        patterns, inverse = _unique_rows(status)
+        n_patterns = len(patterns)
+        failed_values = np.empty(n_patterns, dtype=object)
+        passed_values = np.empty(n_patterns, dtype=object)
+        outcome_values = np.empty(n_patterns, dtype=object)
+        action_values = np.empty(n_patterns, dtype=object)
 
-            # Add rule results to sample data
-            failed_str = ','.join(failed_rules) if failed_rules else ''
-            sample_results['failed_rules'] = failed_str
+        for i, row in enumerate(patterns):
+            failed_rules = rule_ids[row == RULE_FAILED].tolist()
+            passed_rules = rule_ids[row == RULE_PASSED].tolist()
 
-            passed_str = ','.join(passed_rules) if passed_rules else ''
-            sample_results['passed_rules'] = passed_str
+            failed_values[i] = ','.join(failed_rules)
+            passed_values[i] = ','.join(passed_rules)
 
             # Determine QC outcomes
-            qc_outcomes = self._determine_qc_outcomes(failed_rules, passed_rules)
-            outcome_str = ','.join(qc_outcomes) if qc_outcomes else 'PASS'
-            sample_results['qc_outcome'] = outcome_str
-            
-            # Determine QC action based on highest priority outcome
-            qc_action = self._determine_qc_action(qc_outcomes)
-            sample_results['qc_action'] = qc_action
+            qc_outcomes = self._determine_qc_outcomes(
+                failed_rules, passed_rules
+            )
+            outcome_values[i] = (
+                ','.join(qc_outcomes) if qc_outcomes else 'PASS'
+            )
 
-            results_list.append(sample_results)
+            # Determine QC action based on highest priority outcome
+            action_values[i] = self._determine_qc_action(qc_outcomes)
+
+        # One copy of the run data with all result columns added at once
+        results = run_data.assign(
+            failed_rules=failed_values[inverse],
+            passed_rules=passed_values[inverse],
+            qc_outcome=outcome_values[inverse],
+            qc_action=action_values[inverse]
+        )
 
-        self.results = pd.DataFrame(results_list)
+        self.results = results
         self.logger.info(f"✓ Processed {len(self.results)} samples")
 
     def _determine_qc_outcomes(self, failed_rules: List[str],
@@ -442,55 +794,40 @@ class QCProcessor:
         there are no failed rules (equivalent to old 'no_failed_rules').
         """
         outcomes = []
+        # Sets make each membership check O(1)
+        failed_set = frozenset(failed_rules)
+        evaluated_set = failed_set.union(passed_rules)
 
-        for _, test in self.qc_tests.iterrows():
-            passed_conditions = test.get('passed_rule_conditions')
-            failed_conditions = test.get('failed_rule_conditions')
-            
-            # Check if passed_rule_conditions is specified
-            has_passed_conditions = (
-                pd.notna(passed_conditions) and 
-                isinstance(passed_conditions, str) and 
-                passed_conditions.strip()
-            )
-            
-            # Check if failed_rule_conditions is specified
-            has_failed_conditions = (
-                pd.notna(failed_conditions) and 
-                isinstance(failed_conditions, str) and 
-                failed_conditions.strip()
-            )
-            
+        for outcome_id, passed_required, failed_required in (
+            self._get_parsed_tests()
+        ):
             # Special case: both columns empty = match when no failed rules
-            if not has_passed_conditions and not has_failed_conditions:
+            if passed_required is None and failed_required is None:
                 if not failed_rules:  # No failed rules = this test matches
-                    outcomes.append(test['outcome_id'])
+                    outcomes.append(outcome_id)
                 continue
             
             # Evaluate conditions
             passed_match = True  # Default to True if not specified
             failed_match = True  # Default to True if not specified
             
-            if has_passed_conditions:
+            if passed_required is not None:
                 # NONE-FAILED logic - NONE of these rules can be in failed_rules
                 # BUT at least one of these rules must have been evaluated (in passed_rules or failed_rules)
-                required_rules = [r.strip() for r in passed_conditions.split(',')]
-                # Check if at least one rule was evaluated
-                any_evaluated = any(rule in passed_rules or rule in failed_rules for rule in required_rules)
+                any_evaluated = not evaluated_set.isdisjoint(passed_required)
                 if not any_evaluated:
                     # Skip this test if none of the rules were evaluated (not applicable)
                     continue
                 # Rules were evaluated, check if any failed
-                passed_match = not any(rule in failed_rules for rule in required_rules)
+                passed_match = failed_set.isdisjoint(passed_required)
             
-            if has_failed_conditions:
+            if failed_required is not None:
                 # OR logic - ANY rule must be in failed_rules
-                required_rules = [r.strip() for r in failed_conditions.split(',')]
-                failed_match = any(rule in failed_rules for rule in required_rules)
+                failed_match = not failed_set.isdisjoint(failed_required)
             
             # Both conditions must be satisfied (AND between columns)
             if passed_match and failed_match:
-                outcomes.append(test['outcome_id'])
+                outcomes.append(outcome_id)
 
         # If no specific outcomes, but there are failed rules, mark as
         # general failure
@@ -501,39 +838,40 @@ class QCProcessor:
 
     def _determine_qc_action(self, qc_outcomes: List[str]) -> str:
         """Determine the action required based on highest priority outcome."""
+        tests_by_outcome = self._get_tests_by_outcome()
+
         if not qc_outcomes:
             # If no outcomes (PASS case), find the PASS action
-            pass_test = self.qc_tests[
-                self.qc_tests['outcome_id'] == 'PASS'
-            ]
-            if not pass_test.empty:
-                return pass_test.iloc[0]['action_required']
-            return 'none'
-        
+            pass_test = tests_by_outcome.get('PASS')
+            return pass_test[1] if pass_test else 'none'
+
         # Find the highest priority among the outcomes
         highest_priority = 0
         action_required = 'none'
-        
+
         for outcome_id in qc_outcomes:
-            test_match = self.qc_tests[
-                self.qc_tests['outcome_id'] == outcome_id
-            ]
-            if not test_match.empty:
-                test_priority = test_match.iloc[0]['priority']
-                test_action = test_match.iloc[0]['action_required']
-                
+            test_match = tests_by_outcome.get(outcome_id)
+            if test_match:
+                test_priority, test_action = test_match
+
                 # Higher number = higher priority
                 if test_priority > highest_priority:
                     highest_priority = test_priority
                     action_required = test_action
-        
+
         return action_required
 
     def save_results(self):
         """Save processing results to output file."""
         try:
-            output_path = self.qc_config.output.results
-            self.results.to_csv(output_path, sep='\t', index=False)
+            output = self.qc_config.output
+            output_path = output.results
+            # Written in chunks so the formatted CSV is never held in
+            # memory all at once
+            self.results.to_csv(
+                output_path, sep='\t', index=False,
+                chunksize=output.chunksize
+            )
             self.logger.info(f"✓ Results saved to {output_path}")
         except Exception as e:
             self.logger.error(f"✗ Error saving results: {e}")
@@ -544,23 +882,30 @@ class QCProcessor:
         try:
             warnings_path = self.qc_config.output.warnings
             
+            # All rows share the save time
+            timestamp = datetime.now().isoformat()
+
             # Create warnings dataframe
-            warnings_data = []
-            for warning in sorted(self.warnings):
-                warnings_data.append({
+            warnings_data = [
+                {
                     'warning_type': 'processing',
                     'warning_message': warning,
-                    'timestamp': pd.Timestamp.now().isoformat()
-                })
-            
+                    'timestamp': timestamp
+                }
+                for warning in sorted(self.warnings)
+            ]
+
             # Add skipped rules as warnings
-            for rule in sorted(self.skipped_rules):
-                warning_msg = f"Rule {rule} skipped due to missing fields"
-                warnings_data.append({
+            warnings_data += [
+                {
                     'warning_type': 'skipped_rule',
-                    'warning_message': warning_msg,
-                    'timestamp': pd.Timestamp.now().isoformat()
-                })
+                    'warning_message': (
+                        f"Rule {rule} skipped due to missing fields"
+                    ),
+                    'timestamp': timestamp
+                }
+                for rule in sorted(self.skipped_rules)
+            ]
             
             if warnings_data:
                 warnings_df = pd.DataFrame(warnings_data)
@@ -581,48 +926,135 @@ class QCProcessor:
             raise ProcessingError(f"Failed to save warnings: {e}")
 
     def print_summary(self):
-        """Print processing summary statistics."""
-        self.logger.info("\n📊 Processing Summary:")
-        self.logger.info(f"   Total samples processed: {len(self.results)}")
+        """Print processing summary statistics.
+
+        The summary is logged as a single multi-line record.
+        """
+        lines = [
+            "\n📊 Processing Summary:",
+            f"   Total samples processed: {len(self.results)}",
+        ]
 
         # Count QC outcomes
-        outcome_counts = {}
-        for outcomes_str in self.results['qc_outcome']:
-            if outcomes_str and outcomes_str != 'PASS':
-                for outcome in outcomes_str.split(','):
-                    outcome = outcome.strip()
-                    current_count = outcome_counts.get(outcome, 0)
-                    outcome_counts[outcome] = current_count + 1
-
-        if outcome_counts:
-            self.logger.info("   QC Outcomes:")
-            for outcome, count in sorted(outcome_counts.items()):
-                self.logger.info(f"     {outcome}: {count}")
+        outcomes = self.results['qc_outcome']
+        outcomes = outcomes[outcomes.ne('') & outcomes.ne('PASS')].dropna()
+        outcome_counts = _count_comma_separated(outcomes)
+
+        if not outcome_counts.empty:
+            lines.append("   QC Outcomes:")
+            lines.extend(
+                f"     {outcome}: {count}"
+                for outcome, count in outcome_counts.sort_index().items()
+            )
 
         # Count most common failed rules
-        failed_rule_counts = {}
-        for failed_rules_str in self.results['failed_rules']:
-            if failed_rules_str:
-                for rule in failed_rules_str.split(','):
-                    rule = rule.strip()
-                    count = failed_rule_counts.get(rule, 0) + 1
-                    failed_rule_counts[rule] = count
-
-        if failed_rule_counts:
-            self.logger.info("   Most common failed rules:")
-            items = failed_rule_counts.items()
-            sorted_failures = sorted(items, key=lambda x: x[1], reverse=True)
-            for rule, count in sorted_failures[:10]:  # Top 10
-                self.logger.info(f"     {rule}: {count}")
+        failed_rules = self.results['failed_rules']
+        failed_rules = failed_rules[failed_rules.ne('')].dropna()
+        failed_rule_counts = _count_comma_separated(failed_rules)
+
+        if not failed_rule_counts.empty:
+            lines.append("   Most common failed rules:")
+            sorted_failures = failed_rule_counts.sort_values(
+                ascending=False, kind='stable'
+            )
+            lines.extend(
+                f"     {rule}: {count}"
+                for rule, count in sorted_failures.head(10).items()  # Top 10
+            )
 
         # Display unique warnings
         if self.warnings:
-            self.logger.info("\n⚠️ Warnings encountered:")
-            for warning in sorted(self.warnings):
-                self.logger.info(f"   {warning}")
+            lines.append("\n⚠️ Warnings encountered:")
+            lines.extend(f"   {warning}" for warning in sorted(self.warnings))
 
         # Display unique skipped rules
         if self.skipped_rules:
             skipped_list = ', '.join(sorted(self.skipped_rules))
-            self.logger.info("\n⚠️ Skipped rules (due to missing fields):")
-            self.logger.info(f"   {skipped_list}")
+            lines.append("\n⚠️ Skipped rules (due to missing fields):")
+            lines.append(f"   {skipped_list}")
+
+        self.logger.info("\n".join(lines))
+
+
+def _count_comma_separated(values: pd.Series) -> pd.Series:
+    """Count stripped items of comma-separated strings, in first-seen order.
+
+    Samples sharing a rule-status pattern repeat the same strings, so each
+    distinct string is split once and its items weighted by its count.
+    """
+    if values.empty:
+        return pd.Series(dtype='int64')
+    cells = values.value_counts(sort=False)
+    items = cells.index.to_series(index=cells.to_numpy())
+    items = items.str.split(',').explode().str.strip()
+    return pd.Series(items.index, index=items.to_numpy()).groupby(
+        level=0, sort=False
+    ).sum()
+
+
+@functools.lru_cache(maxsize=8)
+def _load_default_config(cwd: str) -> UQCMeConfig:
+    """Load the bundled config, resolving input files for ``cwd``.
+
+    Cached per working directory because local files take precedence over
+    the bundled ones. Callers must copy the result before modifying it.
+    """
+    config_path = DEFAULTS_DIR / 'config.yaml'
+
+    try:
+        config = load_config_from_file(str(config_path))
+    except Exception as e:
+        raise ConfigError(f"Error loading default config: {e}")
+
+    # Update paths to point to the defaults directory if local files
+    # don't exist
+    if config.qc and config.qc.input:
+        inp = config.qc.input
+        # List each directory once rather than stat-ing every file
+        listings: Dict[Path, set] = {}
+        # Update mapping, rules, tests to absolute paths in defaults dir
+        for attribute in ('mapping', 'qc_rules', 'qc_tests'):
+            path = Path(cwd) / getattr(inp, attribute)
+            if path.parent not in listings:
+                try:
+                    with os.scandir(path.parent) as entries:
+                        listings[path.parent] = {
+                            entry.name for entry in entries
+                        }
+                except OSError:
+                    listings[path.parent] = set()
+            if path.name not in listings[path.parent]:
+                setattr(inp, attribute, str(DEFAULTS_DIR / path.name))
+
+    return config
+
+
+def _unique_rows(matrix: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Distinct rows of a 2-D int8 array, and each row's index into them.
+
+    Each row is viewed as one fixed-width byte string and hashed, which
+    avoids the lexicographic sort ``np.unique(axis=0)`` does.
+    """
+    n_rows, n_cols = matrix.shape
+    if n_cols == 0:
+        return matrix[:min(n_rows, 1)], np.zeros(n_rows, dtype=np.intp)
+    rows = np.ascontiguousarray(matrix).view(f'S{n_cols}').reshape(-1)
+    codes, _ = pd.factorize(rows)
+    _, first = np.unique(codes, return_index=True)
+    return matrix[first], codes
+
+
+def _normalize_species(value: Any) -> str:
+    """Strip and lower-case a species value; falsy values become ''."""
+    return str(value).strip().lower() if value else ''
+
+
+def _parse_rule_list(conditions: Any) -> Optional[FrozenSet[str]]:
+    """Split a comma-separated rule condition, or None if unspecified."""
+    if (
+        pd.notna(conditions)
+        and isinstance(conditions, str)
+        and conditions.strip()
+    ):
+        return frozenset(rule.strip() for rule in conditions.split(','))
+    return None
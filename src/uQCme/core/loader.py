@@ -1,21 +1,129 @@
 """Data loading utilities for uQCme."""
 
+import contextlib
 import copy
+import functools
+import json
 import os
 import pandas as pd
 import requests
 import urllib3
 import yaml
+from dataclasses import dataclass, field
+from http.cookiejar import DefaultCookiePolicy
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib.parse import parse_qs, urlencode, urlparse, urlunparse
-from typing import Union, Dict, Any, Optional, List, Tuple
+from typing import Union, Dict, Any, Iterator, Optional, List, Tuple
 import logging
+import pandera.pandas as pa
 from pandera.errors import SchemaError
 from .config import UQCMeConfig, DataInput
 from .exceptions import ConfigError, DataLoadError, ValidationError
-from .schemas import RunDataSchema
+from .schemas import RunDataSchema, fast_validate_run_data
+
+try:
+    import orjson
+except ImportError:  # Optional; the standard library parser is used instead
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
+# libyaml-backed safe loader when PyYAML was built with it
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+logger.debug("YAML loader: %s", YAML_LOADER.__name__)
+
+# Parsed YAML files by absolute path, with the (mtime, size) parsed at
+_YAML_CACHE: Dict[str, Tuple[Tuple[int, int], Any]] = {}
+
+
+def load_yaml(stream: Any) -> Any:
+    """Parse YAML like ``yaml.safe_load``, using libyaml when available.
+
+    Binary streams are passed to the parser as-is, which detects the
+    encoding itself and so avoids a separate decode step.
+    """
+    return yaml.load(stream, Loader=YAML_LOADER)
+
+
+def load_yaml_file(path: Union[str, os.PathLike]) -> Any:
+    """
+    Parse a YAML file, reusing the previous parse while it is unchanged.
+
+    Files are re-read when their modification time or size changes.
+    Callers get a deep copy and may mutate it without affecting the cache.
+    """
+    abs_path = os.path.abspath(path)
+    stat = os.stat(abs_path)
+    stamp = (stat.st_mtime_ns, stat.st_size)
+
+    cached = _YAML_CACHE.get(abs_path)
+    if cached is None or cached[0] != stamp:
+        with open(abs_path, 'rb') as f:
+            cached = (stamp, load_yaml(f))
+        _YAML_CACHE[abs_path] = cached
+    return copy.deepcopy(cached[1])
+
+
+def _build_http_session() -> requests.Session:
+    """Create the shared API session with pooled, retrying connections."""
+    retry = Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(502, 503, 504),
+        # Connection errors, timeouts and SSL errors surface immediately,
+        # as before; only the status codes above are retried
+        connect=0,
+        read=False,
+        other=0,
+        # Hand back the last response so 502/504 keep their own messages
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=4, pool_maxsize=16, max_retries=retry
+    )
+    session = requests.Session()
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    # Never keep server-set cookies: the session is shared by all callers
+    session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+    return session
+
+
+# Shared by API loads so connections are kept alive between requests
+_HTTP_SESSION = _build_http_session()
+
+# Hosts whose certificates failed verification; later requests skip it
+_UNVERIFIED_HOSTS: set = set()
+
+
+# Media types of newline-delimited JSON, one record per line
+JSON_LINES_MEDIA_TYPES = frozenset({
+    'application/x-ndjson',
+    'application/ndjson',
+    'application/jsonl',
+    'application/x-jsonlines',
+})
+
+
+def _parse_json(content: bytes) -> Any:
+    """Parse a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(content)
+    return json.loads(content)
+
+
+def _parse_response_body(response: requests.Response) -> Any:
+    """Parse a JSON or newline-delimited JSON response body."""
+    content_type = response.headers.get('content-type', '')
+    media_type = content_type.split(';', 1)[0].strip().lower()
+    if media_type in JSON_LINES_MEDIA_TYPES:
+        return [
+            _parse_json(line)
+            for line in response.content.splitlines() if line.strip()
+        ]
+    return _parse_json(response.content)
+
 
 def _extract_api_error_detail(
     response: Optional[requests.Response]
@@ -114,41 +222,43 @@ def _resolve_api_bearer_token(
     return None
 
 
-def _get_column_mappings(mapping_config: Optional[Dict[str, Any]]) -> Dict[str, str]:
+def _compile_mapping(
+    mapping_config: Optional[Dict[str, Any]]
+) -> Tuple[Dict[str, str], Optional[str]]:
     """
-    Extract column mappings from mapping config.
-    
-    Looks for fields where 'QC.mapping' contains a target column name and returns
-    a dict mapping from source column (data.mapping) to target column (QC.mapping).
-    
+    Collect column renames from mapping config in a single pass.
+
     The mapping structure is:
     - data.mapping: source column name in input data
     - QC.mapping: target column name(s) in processed data
-    
+
     Args:
         mapping_config: The mapping configuration dictionary.
-        
+
     Returns:
-        Dict mapping source column names to target column names.
+        Tuple of the source-to-standard-field column mappings and the
+        source column that QC.mapping names 'sample_name' (or None).
     """
-    column_mappings = {}
-    
+    column_mappings: Dict[str, str] = {}
+    sample_name_source: Optional[str] = None
+
     if not mapping_config or 'Sections' not in mapping_config:
-        return column_mappings
-    
+        return column_mappings, sample_name_source
+
+    standard_fields = ('sample_name', 'species')
     for section_data in mapping_config['Sections'].values():
         for field_config in section_data.values():
             if not isinstance(field_config, dict):
                 continue
-            
-            qc_config = field_config.get('QC', {})
-            qc_mapping = qc_config.get('mapping')
-            data_config = field_config.get('data', {})
-            data_mapping = data_config.get('mapping')
-            
+
+            qc_mapping = field_config.get('QC', {}).get('mapping')
+            data_mapping = field_config.get('data', {}).get('mapping')
             if not data_mapping:
                 continue
-                
+
+            if qc_mapping == 'sample_name' and sample_name_source is None:
+                sample_name_source = data_mapping
+
             # Handle both string and list QC mappings
             if isinstance(qc_mapping, str):
                 qc_targets = [qc_mapping]
@@ -156,15 +266,31 @@ def _get_column_mappings(mapping_config: Optional[Dict[str, Any]]) -> Dict[str,
                 qc_targets = qc_mapping
             else:
                 continue
-            
-            # Map the data column to each QC target that's a standard field
-            standard_fields = ['sample_name', 'species']
+
+            # Map the data column to the first QC target that's a
+            # standard field
             for target in qc_targets:
                 if target in standard_fields:
                     column_mappings[data_mapping] = target
-                    break  # Only map to first matching standard field
+                    break
+
+    return column_mappings, sample_name_source
+
+
+def _get_column_mappings(mapping_config: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """
+    Extract column mappings from mapping config.
     
-    return column_mappings
+    Looks for fields where 'QC.mapping' contains a target column name and returns
+    a dict mapping from source column (data.mapping) to target column (QC.mapping).
+    
+    Args:
+        mapping_config: The mapping configuration dictionary.
+        
+    Returns:
+        Dict mapping source column names to target column names.
+    """
+    return _compile_mapping(mapping_config)[0]
 
 
 def _get_sample_name_source(mapping_config: Optional[Dict[str, Any]]) -> Optional[str]:
@@ -175,36 +301,13 @@ def _get_sample_name_source(mapping_config: Optional[Dict[str, Any]]) -> Optiona
     'data.mapping' value (the original column name in the input data that
     should be renamed to sample_name).
     
-    The mapping structure is:
-    - data.mapping: source column name in input data
-    - QC.mapping: target column name in processed data
-    
     Args:
         mapping_config: The mapping configuration dictionary.
         
     Returns:
         The source column name to rename to 'sample_name', or None if not found.
     """
-    if not mapping_config or 'Sections' not in mapping_config:
-        return None
-    
-    for section_data in mapping_config['Sections'].values():
-        for field_config in section_data.values():
-            if not isinstance(field_config, dict):
-                continue
-            
-            # Check if this field's QC mapping targets 'sample_name'
-            qc_config = field_config.get('QC', {})
-            qc_mapping = qc_config.get('mapping')
-            
-            if qc_mapping == 'sample_name':
-                # Get the source column from data.mapping
-                data_config = field_config.get('data', {})
-                data_mapping = data_config.get('mapping')
-                if data_mapping:
-                    return data_mapping
-    
-    return None
+    return _compile_mapping(mapping_config)[1]
 
 
 def _format_duplicate_value(value: Any) -> str:
@@ -220,9 +323,12 @@ def _format_duplicate_value(value: Any) -> str:
 
 
 def get_unique_columns_from_mapping(
-    mapping_config: Optional[Dict[str, Any]]
+    mapping_config: Union['MappingPlan', Dict[str, Any], None]
 ) -> List[str]:
     """Return mapped data columns marked as unique in mapping config."""
+    if isinstance(mapping_config, MappingPlan):
+        return list(mapping_config.unique_columns)
+
     unique_columns: List[str] = []
     seen = set()
 
@@ -250,6 +356,48 @@ def get_unique_columns_from_mapping(
     return unique_columns
 
 
+@dataclass(frozen=True)
+class MappingPlan:
+    """
+    Column handling derived from a mapping config.
+
+    Loaders accept a plan wherever they accept the mapping dict; building
+    one with ``MappingPlan.from_config`` and passing it to repeated loads
+    interprets the mapping only once.
+    """
+
+    column_mappings: Dict[str, str] = field(default_factory=dict)
+    sample_name_source: Optional[str] = None
+    unique_columns: Tuple[str, ...] = ()
+
+    @classmethod
+    def from_config(
+        cls, mapping_config: Union['MappingPlan', Dict[str, Any], None]
+    ) -> 'MappingPlan':
+        """Build a plan from a mapping config; plans are returned as-is."""
+        if isinstance(mapping_config, MappingPlan):
+            return mapping_config
+        column_mappings, sample_name_source = _compile_mapping(
+            mapping_config
+        )
+        return cls(
+            column_mappings=column_mappings,
+            sample_name_source=sample_name_source,
+            unique_columns=tuple(
+                get_unique_columns_from_mapping(mapping_config)
+            ),
+        )
+
+    @property
+    def dtypes(self) -> Dict[str, Any]:
+        """Identifier columns read as text, keeping e.g. leading zeros."""
+        columns = {'sample_name', 'species', 'sampleName'}
+        columns.update(self.column_mappings)
+        if self.sample_name_source:
+            columns.add(self.sample_name_source)
+        return dict.fromkeys(columns, str)
+
+
 def get_duplicate_rows_for_column(
     df: pd.DataFrame,
     column: str
@@ -301,7 +449,7 @@ def collect_duplicate_row_warnings(
 
 def validate_unique_columns(
     df: pd.DataFrame,
-    mapping_config: Optional[Dict[str, Any]]
+    mapping_config: Union[MappingPlan, Dict[str, Any], None]
 ) -> None:
     """Validate mapped columns marked as unique."""
     errors: List[str] = []
@@ -323,44 +471,59 @@ def validate_unique_columns(
 
 def validate_run_data_frame(
     df: pd.DataFrame,
-    mapping_config: Optional[Dict[str, Any]] = None
+    mapping_config: Union[MappingPlan, Dict[str, Any], None] = None
 ) -> None:
-    """Validate run data schema and mapping-driven uniqueness rules."""
-    try:
-        RunDataSchema.validate(df)
-    except SchemaError as e:
-        raise ValidationError(f"Data validation failed: {e}")
+    """Validate run data schema and mapping-driven uniqueness rules.
+
+    The schema is checked with plain pandas calls unless
+    ``UQCME_STRICT_VALIDATE=1`` selects full pandera validation. Frames
+    that already passed pandera validation carry the schema on their
+    ``pandera`` accessor and are not validated against it again.
+    """
+    if os.environ.get('UQCME_STRICT_VALIDATE') == '1':
+        schema = RunDataSchema.to_schema()
+        accessor = getattr(df, 'pandera', None)
+        if accessor is None or accessor.schema is not schema:
+            try:
+                RunDataSchema.validate(df)
+            except SchemaError as e:
+                raise ValidationError(f"Data validation failed: {e}")
+            df.pandera.add_schema(schema)
+    else:
+        fast_validate_run_data(df)
 
     validate_unique_columns(df, mapping_config)
 
 
 def prepare_loaded_data_frame(
     df: pd.DataFrame,
-    mapping_config: Optional[Dict[str, Any]] = None
+    mapping_config: Union[MappingPlan, Dict[str, Any], None] = None
 ) -> pd.DataFrame:
     """Apply configured column mappings and validate loaded data."""
-    if df is not None and mapping_config:
-        column_mappings = _get_column_mappings(mapping_config)
-        rename_map = {}
-
-        for source_col, target_col in column_mappings.items():
-            # Only rename if source exists and target doesn't
-            if source_col in df.columns and target_col not in df.columns:
-                rename_map[source_col] = target_col
-
+    plan = MappingPlan.from_config(mapping_config)
+
+    if df is not None:
+        columns = set(df.columns)
+        # Only rename if source exists and target doesn't
+        rename_map = {
+            source_col: target_col
+            for source_col, target_col in plan.column_mappings.items()
+            if source_col in columns and target_col not in columns
+        }
+
+        # Fallback for sample_name if not mapped
+        if 'sample_name' not in columns.union(rename_map.values()):
+            for candidate in (plan.sample_name_source, 'sampleName'):
+                if (candidate and candidate in columns
+                        and candidate not in rename_map):
+                    rename_map[candidate] = 'sample_name'
+                    break
+
+        # One rename for all changes; the column data is not copied
         if rename_map:
-            df = df.rename(columns=rename_map)
-
-    # Fallback for sample_name if not mapped
-    if df is not None and 'sample_name' not in df.columns:
-        sample_name_source = _get_sample_name_source(mapping_config)
-        if sample_name_source and sample_name_source in df.columns:
-            df = df.rename(columns={sample_name_source: 'sample_name'})
-        elif 'sampleName' in df.columns:
-            # Fallback: try camelCase version
-            df = df.rename(columns={'sampleName': 'sample_name'})
-
-    validate_run_data_frame(df, mapping_config)
+            df = df.rename(columns=rename_map, copy=False)
+
+    validate_run_data_frame(df, plan)
     return df
 
 
@@ -422,7 +585,7 @@ def _load_api_payload(
         request_headers: Dict[str, str],
         cookies: Optional[Dict[str, str]] = None
     ):
-        return requests.get(
+        return _HTTP_SESSION.get(
             resolved_url,
             headers=request_headers,
             timeout=30,
@@ -446,7 +609,8 @@ def _load_api_payload(
     }
 
     try:
-        verify_ssl = True
+        host = urlparse(resolved_url).netloc
+        verify_ssl = host not in _UNVERIFIED_HOSTS
         try:
             response = _send_request(
                 verify=verify_ssl,
@@ -456,9 +620,12 @@ def _load_api_payload(
             warning_msg = ("SSL verification failed, retrying without "
                            "SSL verification...")
             logger.warning(warning_msg)
-            urllib3.disable_warnings(
-                urllib3.exceptions.InsecureRequestWarning
-            )
+            # Silenced on the first unverified host; the filter is global
+            if not _UNVERIFIED_HOSTS:
+                urllib3.disable_warnings(
+                    urllib3.exceptions.InsecureRequestWarning
+                )
+            _UNVERIFIED_HOSTS.add(host)
             verify_ssl = False
             response = _send_request(
                 verify=verify_ssl,
@@ -482,7 +649,7 @@ def _load_api_payload(
                 debug_info['status_code'] = response.status_code
 
         response.raise_for_status()
-        data = response.json()
+        data = _parse_response_body(response)
         debug_info['payload_type'] = type(data).__name__
         debug_info['payload_preview'] = _payload_preview(data)
         return data, debug_info
@@ -560,28 +727,155 @@ def load_config_from_file(config_path: str) -> UQCMeConfig:
         ConfigError: If file cannot be read or parsed.
     """
     try:
-        with open(config_path, 'r', encoding='utf-8') as f:
-            config_dict = yaml.safe_load(f)
-            return UQCMeConfig(**config_dict)
+        config_dict = load_yaml_file(config_path)
+        return UQCMeConfig(**config_dict)
     except (IOError, yaml.YAMLError, Exception) as e:
         raise ConfigError(
             f"Failed to load configuration from {config_path}: {e}"
         )
 
 
+def read_reference_table(
+    path: str, schema: type[pa.DataFrameModel]
+) -> pd.DataFrame:
+    """
+    Read a QC rules/tests TSV with string columns typed from its schema.
+
+    Declaring the string columns up front lets the C parser skip type
+    inference for them; other columns are still inferred so that invalid
+    values surface as schema validation errors.
+
+    Args:
+        path: Path to the TSV file.
+        schema: Pandera model describing the table.
+
+    Returns:
+        pd.DataFrame: The table as read, not yet validated.
+    """
+    dtypes = {
+        name: str
+        for name, column in schema.to_schema().columns.items()
+        if str(column.dtype) == 'str'
+    }
+    return pd.read_csv(path, sep='\t', engine='c', dtype=dtypes)
+
+
+def read_run_data_table(
+    path: Any,
+    dtype: Optional[Dict[str, Any]] = None,
+    chunksize: Optional[int] = None
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    """
+    Read a run data TSV with the C parser in a single pass.
+
+    With ``low_memory=False`` each column's type is inferred from the
+    whole file rather than per internal chunk, so large files neither
+    re-scan columns nor end up with mixed-type object columns.
+
+    Args:
+        path: Path to, or open file object of, the TSV file.
+        dtype: Optional column types, skipping inference for those columns.
+        chunksize: If given, return an iterator of frames of this many rows.
+
+    Returns:
+        pd.DataFrame: The data as read, before column mapping, or an
+        iterator over it when ``chunksize`` is given.
+    """
+    if chunksize is not None:
+        # low_memory only applies to whole-file reads
+        return pd.read_csv(
+            path, sep='\t', engine='c', dtype=dtype, chunksize=chunksize
+        )
+    return pd.read_csv(
+        path, sep='\t', engine='c', low_memory=False, dtype=dtype
+    )
+
+
+@functools.singledispatch
+def _load_raw_data(
+    data_config: Any,
+    dtype: Optional[Dict[str, Any]] = None,
+    chunksize: Optional[int] = None
+) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    """Load unmapped data for a data source; a plain file path by default.
+
+    ``dtype`` and ``chunksize`` apply to file sources only; API payloads
+    keep their JSON types and always arrive as one frame.
+    """
+    # Legacy structure - direct file path
+    return read_run_data_table(data_config, dtype, chunksize)
+
+
+@_load_raw_data.register
+def _(data_config: DataInput,
+      dtype: Optional[Dict[str, Any]] = None,
+      chunksize: Optional[int] = None
+      ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    if data_config.api_call:
+        bearer_token = _resolve_api_bearer_token(
+            api_bearer_token=data_config.api_bearer_token,
+            api_bearer_token_env=data_config.api_bearer_token_env
+        )
+        return load_data_from_api(
+            data_config.api_call,
+            bearer_token=bearer_token,
+            custom_headers=data_config.api_headers
+        )
+    if data_config.file:
+        return read_run_data_table(data_config.file, dtype, chunksize)
+    raise ConfigError("Either 'file' or 'api_call' must be specified")
+
+
+@_load_raw_data.register
+def _(data_config: dict,
+      dtype: Optional[Dict[str, Any]] = None,
+      chunksize: Optional[int] = None
+      ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+    # New structure with file/api_call options
+    if data_config.get('api_call'):
+        bearer_token = _resolve_api_bearer_token(
+            api_bearer_token=data_config.get('api_bearer_token'),
+            api_bearer_token_env=data_config.get('api_bearer_token_env')
+        )
+        return load_data_from_api(
+            data_config['api_call'],
+            bearer_token=bearer_token,
+            custom_headers=data_config.get('api_headers')
+        )
+    if data_config.get('file'):
+        return read_run_data_table(data_config['file'], dtype, chunksize)
+    raise ConfigError(
+        "Either 'file' or 'api_call' must be specified for data input"
+    )
+
+
+@contextlib.contextmanager
+def _data_load_errors() -> Iterator[None]:
+    """Report loading failures as DataLoadError, except config/validation."""
+    try:
+        yield
+    except (pd.errors.ParserError, IOError) as e:
+        raise DataLoadError(f"Failed to load data: {e}")
+    except (ConfigError, ValidationError):
+        raise
+    except Exception as e:
+        raise DataLoadError(f"Unexpected error loading data: {e}")
+
+
 def load_data_from_config(
-    data_config: Union[str, Dict[str, Any], DataInput],
-    mapping_config: Optional[Dict[str, Any]] = None
+    data_config: Union[str, os.PathLike, Dict[str, Any], DataInput],
+    mapping_config: Union[MappingPlan, Dict[str, Any], None] = None
 ) -> pd.DataFrame:
 
     """
     Load data from a file or API based on configuration.
     
     Args:
-        data_config: Configuration for data source. Can be a string
-                    (file path), a dictionary, or a DataInput model.
+        data_config: Configuration for data source. Can be a string or
+                    path (file path), a dictionary, or a DataInput model.
         mapping_config: Optional mapping configuration that defines
-                       column name mappings (e.g., QC.mapping -> sample_name).
+                       column name mappings (e.g., QC.mapping -> sample_name),
+                       or a MappingPlan built from one.
                     
     Returns:
         pd.DataFrame: Loaded data.
@@ -590,64 +884,52 @@ def load_data_from_config(
         ConfigError: If configuration is invalid.
         DataLoadError: If data cannot be loaded.
     """
-    try:
-        df = None
-        if isinstance(data_config, DataInput):
-            if data_config.api_call:
-                bearer_token = _resolve_api_bearer_token(
-                    api_bearer_token=data_config.api_bearer_token,
-                    api_bearer_token_env=data_config.api_bearer_token_env
-                )
-                df = load_data_from_api(
-                    data_config.api_call,
-                    bearer_token=bearer_token,
-                    custom_headers=data_config.api_headers
-                )
-            elif data_config.file:
-                df = pd.read_csv(data_config.file, sep='\t')
-            else:
-                # If both are None, check if it was initialized empty
-                # For now, raise error if neither is set
-                error_msg = "Either 'file' or 'api_call' must be specified"
-                raise ConfigError(error_msg)
-                
-        elif isinstance(data_config, dict):
-            # New structure with file/api_call options
-            if data_config.get('api_call'):
-                # Load data from API
-                api_url = data_config['api_call']
-                bearer_token = _resolve_api_bearer_token(
-                    api_bearer_token=data_config.get('api_bearer_token'),
-                    api_bearer_token_env=data_config.get(
-                        'api_bearer_token_env'
-                    )
-                )
-                df = load_data_from_api(
-                    api_url,
-                    bearer_token=bearer_token,
-                    custom_headers=data_config.get('api_headers')
-                )
-            elif data_config.get('file'):
-                # Load data from file
-                df = pd.read_csv(data_config['file'], sep='\t')
-            else:
-                error_msg = ("Either 'file' or 'api_call' must be "
-                             "specified for data input")
-                raise ConfigError(error_msg)
-        else:
-            # Legacy structure - direct file path
-            df = pd.read_csv(data_config, sep='\t')
-            
-        df = prepare_loaded_data_frame(df, mapping_config)
-            
-        return df
-        
-    except (pd.errors.ParserError, IOError) as e:
-        raise DataLoadError(f"Failed to load data: {e}")
-    except (ConfigError, ValidationError):
-        raise
-    except Exception as e:
-        raise DataLoadError(f"Unexpected error loading data: {e}")
+    with _data_load_errors():
+        plan = MappingPlan.from_config(mapping_config)
+        df = _load_raw_data(data_config, plan.dtypes)
+        return prepare_loaded_data_frame(df, plan)
+
+
+def iter_data_from_config(
+    data_config: Union[str, os.PathLike, Dict[str, Any], DataInput],
+    mapping_config: Union[MappingPlan, Dict[str, Any], None] = None,
+    chunksize: int = 100_000
+) -> Iterator[pd.DataFrame]:
+    """
+    Load data like ``load_data_from_config``, in chunks of rows.
+
+    File sources are read ``chunksize`` rows at a time, so peak memory is
+    bounded by one chunk; API payloads are fetched whole and then sliced.
+    Each chunk is mapped and validated before it is yielded, and nothing
+    is read until the first chunk is requested. Row positions in
+    validation messages refer to the whole input, but duplicates in
+    unique columns are only detected within a chunk.
+
+    Args:
+        data_config: Configuration for data source, as for
+                    ``load_data_from_config``.
+        mapping_config: Optional mapping configuration or MappingPlan.
+        chunksize: Maximum number of rows per chunk.
+
+    Yields:
+        pd.DataFrame: Consecutive chunks of the loaded data.
+
+    Raises:
+        ConfigError: If configuration is invalid.
+        DataLoadError: If data cannot be loaded.
+    """
+    with _data_load_errors():
+        plan = MappingPlan.from_config(mapping_config)
+        raw = _load_raw_data(data_config, plan.dtypes, chunksize)
+        if isinstance(raw, pd.DataFrame):
+            raw = contextlib.nullcontext(
+                raw.iloc[start:start + chunksize]
+                for start in range(0, max(len(raw), 1), chunksize)
+            )
+        # Closes the file even if the caller stops iterating early
+        with raw as chunks:
+            for chunk in chunks:
+                yield prepare_loaded_data_frame(chunk, plan)
 
 
 def load_data_from_api(
@@ -2,11 +2,60 @@
 Logging configuration for uQCme.
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from typing import Optional
 
+# Background writer for the log file, replaced on each setup_logging call
+_file_listener: Optional[QueueListener] = None
+
+# Write buffer for the log file; it is flushed on errors and on shutdown
+LOG_BUFFER_SIZE = 64 * 1024
+
+
+class _BufferedFileHandler(logging.FileHandler):
+    """File handler that does not flush after every record.
+
+    ``StreamHandler.emit`` flushes the stream after each record. Here that
+    happens only for records at ``flush_level`` or above; everything else
+    stays in the write buffer until it fills or the handler is closed.
+    """
+
+    def __init__(self, filename: str, mode: str = 'a',
+                 flush_level: int = logging.ERROR):
+        self.flush_level = flush_level
+        self._flush_record = False
+        super().__init__(filename, mode)
+
+    def _open(self):
+        return open(self.baseFilename, self.mode, buffering=LOG_BUFFER_SIZE,
+                    encoding=self.encoding, errors=self.errors)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self._flush_record = record.levelno >= self.flush_level
+        super().emit(record)
+
+    def flush(self) -> None:
+        if self._flush_record:
+            super().flush()
+
+
+def _stop_file_listener() -> None:
+    """Drain the log queue and close the file handler behind it."""
+    global _file_listener
+    if _file_listener is not None:
+        _file_listener.stop()
+        for handler in _file_listener.handlers:
+            handler.close()
+        _file_listener = None
+
+
+atexit.register(_stop_file_listener)
+
 
 def setup_logging(log_file: Optional[str] = None) -> logging.Logger:
     """
@@ -25,6 +74,7 @@ def setup_logging(log_file: Optional[str] = None) -> logging.Logger:
     # Clear any existing handlers to avoid duplicates
     if logger.hasHandlers():
         logger.handlers.clear()
+    _stop_file_listener()
     
     # Create console handler
     console_handler = logging.StreamHandler(sys.stdout)
@@ -40,8 +90,8 @@ def setup_logging(log_file: Optional[str] = None) -> logging.Logger:
             log_dir = log_path.parent
             log_dir.mkdir(parents=True, exist_ok=True)
             
-            # Create file handler
-            file_handler = logging.FileHandler(str(log_path), mode='a')
+            # Create file handler; closing it flushes what is buffered
+            file_handler = _BufferedFileHandler(str(log_path), mode='a')
             file_handler.setLevel(logging.INFO)
             
             # Create formatter (TSV format for file)
@@ -50,7 +100,18 @@ def setup_logging(log_file: Optional[str] = None) -> logging.Logger:
                 datefmt='%Y-%m-%d %H:%M:%S'
             )
             file_handler.setFormatter(file_formatter)
-            logger.addHandler(file_handler)
+
+            # File writes happen on a listener thread, off the caller's path
+            log_queue = queue.SimpleQueue()
+            queue_handler = QueueHandler(log_queue)
+            queue_handler.setLevel(logging.INFO)
+            logger.addHandler(queue_handler)
+
+            global _file_listener
+            _file_listener = QueueListener(
+                log_queue, file_handler, respect_handler_level=True
+            )
+            _file_listener.start()
             
         except (OSError, IOError) as e:
             # Fallback to console warning if file logging fails
@@ -2,10 +2,13 @@
 Pandera schemas for data validation.
 """
 
+import pandas as pd
 import pandera.pandas as pa
 from pandera.typing import Series
 from typing import Optional
 
+from .exceptions import ValidationError
+
 
 class QCRulesSchema(pa.DataFrameModel):
     """Schema for QC rules definition file."""
@@ -82,3 +85,28 @@ class RunDataSchema(pa.DataFrameModel):
     class Config:
         coerce = True
         strict = False  # Allow extra columns (metrics)
+
+
+def fast_validate_run_data(df: pd.DataFrame) -> None:
+    """
+    Check run data against ``RunDataSchema`` with plain pandas calls.
+
+    The schema's columns are optional, nullable and coerced to str, so
+    any values pass; what can be wrong is the frame itself or a schema
+    column appearing more than once.
+
+    Raises:
+        ValidationError: If the data does not fit the schema.
+    """
+    if not isinstance(df, pd.DataFrame):
+        raise ValidationError(
+            f"Data validation failed: expected a DataFrame, "
+            f"got {type(df).__name__}"
+        )
+
+    for column in RunDataSchema.to_schema().columns:
+        if (df.columns == column).sum() > 1:
+            raise ValidationError(
+                f"Data validation failed: column '{column}' appears "
+                "more than once"
+            )
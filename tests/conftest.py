@@ -5,32 +5,35 @@ This module contains pytest fixtures that are shared across
 all test modules in the uQCme test suite.
 """
 
+import copy
+
 import pytest
 import pandas as pd
 import yaml
 from pathlib import Path
 
+from uQCme.core.engine import QCProcessor
 
-@pytest.fixture
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+def _load_yaml(path):
+    with open(path, 'rb') as f:
+        return yaml.load(f, Loader=YAML_LOADER)
+
+
+@pytest.fixture(scope="session")
 def test_data_dir():
     """Return path to test data directory."""
     return Path(__file__).parent / "data"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_fixtures_dir():
     """Return path to test fixtures directory."""
     return Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
-def sample_config(test_fixtures_dir):
-    """Load test configuration file."""
-    config_path = test_fixtures_dir / "config_example.yaml"
-    with open(config_path, 'r') as f:
-        return yaml.safe_load(f)
-
-
 @pytest.fixture
 def test_data_paths(test_data_dir):
     """Return dictionary of test data file paths."""
@@ -42,26 +45,80 @@ def test_data_paths(test_data_dir):
     }
 
 
+# Files are parsed once per session; the fixtures below hand each test
+# its own copy so mutations cannot leak between tests.
+
+@pytest.fixture(scope="session")
+def _parsed_sample_config(test_fixtures_dir):
+    return _load_yaml(test_fixtures_dir / "config_example.yaml")
+
+
+@pytest.fixture(scope="session")
+def _parsed_mapping_config(test_data_dir):
+    return _load_yaml(test_data_dir / "mapping.yaml")
+
+
+@pytest.fixture(scope="session")
+def _parsed_tables(test_data_dir):
+    return {
+        name: pd.read_csv(test_data_dir / filename, sep='\t')
+        for name, filename in (
+            ('example_run_data', "example_run_data.tsv"),
+            ('qc_rules', "QC_rules.tsv"),
+            ('qc_tests', "QC_tests.tsv"),
+        )
+    }
+
+
+@pytest.fixture(scope="session")
+def _built_processor(test_fixtures_dir):
+    return QCProcessor(str(test_fixtures_dir / "config_example.yaml"))
+
+
+@pytest.fixture(scope="session")
+def _loaded_processor(test_fixtures_dir):
+    processor = QCProcessor(str(test_fixtures_dir / "config_example.yaml"))
+    processor.load_input_files()
+    return processor
+
+
 @pytest.fixture
-def sample_run_data(test_data_paths):
+def sample_config(_parsed_sample_config):
+    """Load test configuration file."""
+    return copy.deepcopy(_parsed_sample_config)
+
+
+@pytest.fixture
+def sample_run_data(_parsed_tables):
     """Load sample run data for testing."""
-    return pd.read_csv(test_data_paths['example_run_data'], sep='\t')
+    return _parsed_tables['example_run_data'].copy()
 
 
 @pytest.fixture
-def qc_rules_data(test_data_paths):
+def qc_rules_data(_parsed_tables):
     """Load QC rules data for testing."""
-    return pd.read_csv(test_data_paths['qc_rules'], sep='\t')
+    return _parsed_tables['qc_rules'].copy()
 
 
 @pytest.fixture
-def qc_tests_data(test_data_paths):
+def qc_tests_data(_parsed_tables):
     """Load QC tests data for testing."""
-    return pd.read_csv(test_data_paths['qc_tests'], sep='\t')
+    return _parsed_tables['qc_tests'].copy()
 
 
 @pytest.fixture
-def mapping_config(test_data_paths):
+def mapping_config(_parsed_mapping_config):
     """Load mapping configuration for testing."""
-    with open(test_data_paths['mapping'], 'r') as f:
-        return yaml.safe_load(f)
+    return copy.deepcopy(_parsed_mapping_config)
+
+
+@pytest.fixture
+def processor(_built_processor):
+    """Return a processor with its configuration loaded."""
+    return copy.deepcopy(_built_processor)
+
+
+@pytest.fixture
+def loaded_processor(_loaded_processor):
+    """Return a processor with rules, tests, mapping and run data loaded."""
+    return copy.deepcopy(_loaded_processor)
@@ -10,44 +10,156 @@ The test data is structured with two groups:
   - test_* samples: edge cases for systematic rule coverage
 """
 
+import csv
+import functools
+import hashlib
+import pickle
 import unittest
+import numpy as np
 import pandas as pd
 import yaml
 import sys
 import os
 from pathlib import Path
+from types import SimpleNamespace
 
-# Add the src directory to sys.path to import uQCme package
-sys.path.insert(0, str(Path(__file__).parents[2] / "src"))
+if __name__ == '__main__':
+    # Run directly, outside the pytest pythonpath setting in pyproject.toml
+    sys.path.insert(0, str(Path(__file__).parents[2] / "src"))
 from uQCme.core.engine import QCProcessor
 
+YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+# Every outcome_id defined in tests/data/QC_tests.tsv
+VALID_OUTCOMES = frozenset({
+    'PASS', 'PASS_GENERAL', 'WARN', 'FAIL', 'FAIL_GENERAL',
+    'FAIL_ACINETOBACTER_BAUMANNII',
+    'FAIL_CAMPYLOBACTER_COLI',
+    'FAIL_CAMPYLOBACTER_JEJUNI',
+    'FAIL_ESCHERICHIA_COLI',
+    'FAIL_ENTEROCOCCUS_FAECIUM',
+    'FAIL_ENTEROBACTER_SPP',
+    'FAIL_HAEMOPHILUS_INFLUENZAE',
+    'FAIL_HELICOBACTER_PYLORI',
+    'FAIL_KLEBSIELLA_PNEUMONIAE',
+    'FAIL_MYCOPLASMA_GENITALIUM',
+    'FAIL_NEISSERIA_GONORRHOEAE',
+    'FAIL_PSEUDOMONAS_AERUGINOSA',
+    'FAIL_STAPHYLOCOCCUS_AUREUS',
+    'FAIL_SALMONELLA_ENTERICA',
+    'FAIL_SHIGELLA_FLEXNERI',
+    'FAIL_STREPTOCOCCUS_PNEUMONIAE',
+    'FAIL_SHIGELLA_SONNEI',
+})
+
+# Rules whose fields the test mapping does not provide
+EXPECTED_SKIPPED_RULES = frozenset({
+    'A16', 'A17', 'A18', 'A19', 'A3',
+    'EC5', 'EC10', 'EC13', 'EC14', 'EC15',
+    'KP5', 'KP8', 'KP13', 'KP14', 'KP15', 'KP24', 'KP29',
+    'KP32', 'KP33', 'KP34',
+    'SA5', 'SA10', 'SA13', 'SA14', 'SA15',
+})
+
+# The only results columns the outcome tests look at
+RESULT_COLUMNS = ('sample_name', 'qc_outcome', 'failed_rules', 'qc_action')
+
+
+REPO_ROOT = Path(__file__).parents[2]
+PIPELINE_CACHE_DIR = REPO_ROOT / ".pytest_cache" / "uqcme"
+
+
+def _pipeline_key(config_path: str) -> str:
+    """Hash the config, the test data and the engine sources."""
+    digest = hashlib.blake2b(digest_size=16)
+    paths = [Path(config_path)]
+    paths += sorted((REPO_ROOT / "tests" / "data").iterdir())
+    paths += sorted((REPO_ROOT / "src" / "uQCme" / "core").glob("*.py"))
+    for path in paths:
+        digest.update(path.name.encode())
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+@functools.lru_cache(maxsize=None)
+def _get_processor(config_path: str) -> SimpleNamespace:
+    """Return the pipeline outputs the tests read, cached on disk.
+
+    The cache key covers the engine sources as well as the inputs, so
+    a code change always reruns the pipeline.
+    """
+    cache_path = PIPELINE_CACHE_DIR / f"{_pipeline_key(config_path)}.pkl"
+    try:
+        with open(cache_path, 'rb') as f:
+            skipped_rules, warnings = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, ValueError):
+        processor = QCProcessor(config_path)
+        processor.load_input_files()
+        processor.process_samples()
+        skipped_rules, warnings = processor.skipped_rules, processor.warnings
+        PIPELINE_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            pickle.dump((skipped_rules, warnings), f)
+        os.replace(tmp_path, cache_path)
+    return SimpleNamespace(skipped_rules=skipped_rules, warnings=warnings)
+
+
+def _read_header(path: Path) -> list:
+    """Return the column names of a TSV without parsing any rows."""
+    with open(path, newline='') as f:
+        return next(csv.reader(f, delimiter='\t'))
+
+
+@functools.lru_cache(maxsize=None)
+def _get_results(results_path: str) -> pd.DataFrame:
+    """Read an expected results TSV once per path."""
+    try:
+        # Multithreaded parse when pyarrow is installed; dtype=str is
+        # left out because this engine turns nulls into the text 'None'
+        return pd.read_csv(results_path, sep='\t', usecols=RESULT_COLUMNS,
+                           engine='pyarrow')
+    except ImportError:
+        return pd.read_csv(results_path, sep='\t', usecols=RESULT_COLUMNS,
+                           dtype=str)
+
 
 class TestUQCmeOutcomes(unittest.TestCase):
     """Test QC outcome generation for example dataset."""
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.test_dir = Path(__file__).parent.parent
-        self.config_path = self.test_dir / "fixtures" / "config_example.yaml"
-        self.results_path = self.test_dir / "uQCme_example_run_data.tsv"
+    @classmethod
+    def setUpClass(cls):
+        """Run the pipeline once; the tests only read its outputs."""
+        cls.test_dir = Path(__file__).parent.parent
+        cls.config_path = cls.test_dir / "fixtures" / "config_example.yaml"
+        cls.results_path = cls.test_dir / "uQCme_example_run_data.tsv"
 
-        # Initialize processor
-        self.processor = QCProcessor(str(self.config_path))
-        self.processor.load_input_files()
-        self.processor.process_samples()
+        # Pipeline outputs (skipped rules and warnings)
+        cls.processor = _get_processor(str(cls.config_path))
 
         # Load expected outcomes
-        self.results = pd.read_csv(self.results_path, sep='\t')
+        cls.results = _get_results(str(cls.results_path)).set_index(
+            'sample_name', drop=False)
+        cls._rows_by_name = {
+            row.sample_name: row
+            for row in cls.results.itertuples(index=False)
+        }
+        # Rule IDs as sets, so 'A2' cannot match inside 'A20'
+        cls._failed_by_name = {
+            row.sample_name: (
+                frozenset(row.failed_rules.split(','))
+                if isinstance(row.failed_rules, str) and row.failed_rules
+                else frozenset()
+            )
+            for row in cls._rows_by_name.values()
+        }
 
     def _get_outcome_set(self, sample_name):
-        """Return (outcome_set, failed_rules_str) for a sample."""
-        sample_row = self.results[self.results['sample_name'] == sample_name]
-        self.assertEqual(len(sample_row), 1, f"Sample {sample_name} not found")
-        outcome = sample_row.iloc[0]['qc_outcome']
-        failed = sample_row.iloc[0]['failed_rules']
-        if pd.isna(failed):
-            failed = ''
-        return set(outcome.split(',')), failed
+        """Return (outcome_set, failed_rule_set) for a sample."""
+        self.assertIn(sample_name, self._rows_by_name,
+            f"Sample {sample_name} not found")
+        outcomes = self._rows_by_name[sample_name].qc_outcome
+        return set(outcomes.split(',')), self._failed_by_name[sample_name]
 
     # ── Example samples ──────────────────────────────────────────
 
@@ -55,13 +167,13 @@ class TestUQCmeOutcomes(unittest.TestCase):
         """E. coli sample passing all rules (PASS + PASS_GENERAL)."""
         outcomes, failed = self._get_outcome_set('example_pass_ecoli')
         self.assertEqual(outcomes, {'PASS', 'PASS_GENERAL'})
-        self.assertEqual(failed, '')
+        self.assertEqual(failed, frozenset())
 
     def test_example_pass_saureus(self):
         """S. aureus sample passing all rules (PASS + PASS_GENERAL)."""
         outcomes, failed = self._get_outcome_set('example_pass_saureus')
         self.assertEqual(outcomes, {'PASS', 'PASS_GENERAL'})
-        self.assertEqual(failed, '')
+        self.assertEqual(failed, frozenset())
 
     def test_example_pass_general_fail_species_kp(self):
         """K. pneumoniae: passes general + read QC, fails species rules."""
@@ -76,17 +188,18 @@ class TestUQCmeOutcomes(unittest.TestCase):
         outcomes, failed = self._get_outcome_set('example_warn_review')
         self.assertEqual(outcomes, {'WARN'})
         # Should have failed strict PASS rules
-        for rule in ['PASS1', 'PASS2', 'PASS3', 'PASS4', 'PASS5']:
-            self.assertIn(rule, failed,
-                f"Expected {rule} in failed rules for WARN sample")
+        missing = {'PASS1', 'PASS2', 'PASS3', 'PASS4', 'PASS5'} - failed
+        self.assertFalse(missing,
+            f"Expected rules missing from failed for WARN sample: {missing}")
 
     def test_example_fail_read_qc(self):
         """Sample failing all read QC thresholds → FAIL outcome."""
         outcomes, failed = self._get_outcome_set('example_fail_read_qc')
         self.assertEqual(outcomes, {'FAIL'})
         # Should have failed both PASS and WARN rules
-        for rule in ['WARN1', 'WARN2', 'WARN3', 'WARN4', 'WARN5']:
-            self.assertIn(rule, failed)
+        missing = {'WARN1', 'WARN2', 'WARN3', 'WARN4', 'WARN5'} - failed
+        self.assertFalse(missing,
+            f"Expected rules missing from failed: {missing}")
 
     def test_example_fail_assembly(self):
         """Sample with good read QC but bad assembly → PASS + FAIL_GENERAL."""
@@ -94,8 +207,9 @@ class TestUQCmeOutcomes(unittest.TestCase):
         self.assertIn('PASS', outcomes)
         self.assertIn('FAIL_GENERAL', outcomes)
         # A-rules should be in failed
-        for rule in ['A1', 'A2']:
-            self.assertIn(rule, failed)
+        missing = {'A1', 'A2'} - failed
+        self.assertFalse(missing,
+            f"Expected rules missing from failed: {missing}")
 
     # ── Test: boundary conditions ────────────────────────────────
 
@@ -103,7 +217,7 @@ class TestUQCmeOutcomes(unittest.TestCase):
         """All PASS thresholds exactly at limit → should PASS."""
         outcomes, failed = self._get_outcome_set('test_boundary_pass_exact')
         self.assertEqual(outcomes, {'PASS', 'PASS_GENERAL'})
-        self.assertEqual(failed, '')
+        self.assertEqual(failed, frozenset())
 
     def test_boundary_warn_exact(self):
         """All WARN thresholds exactly at limit → should WARN."""
@@ -112,45 +226,24 @@ class TestUQCmeOutcomes(unittest.TestCase):
 
     # ── Test: individual WARN-tier failures ──────────────────────
 
-    def test_fail_coverage(self):
-        """Coverage just below WARN threshold → FAIL."""
-        outcomes, _ = self._get_outcome_set('test_fail_coverage')
-        self.assertEqual(outcomes, {'FAIL'})
-
-    def test_fail_contamination(self):
-        """Contamination just above WARN threshold → FAIL."""
-        outcomes, _ = self._get_outcome_set('test_fail_contamination')
-        self.assertEqual(outcomes, {'FAIL'})
-
-    def test_fail_q30(self):
-        """Q30 just below WARN threshold → FAIL."""
-        outcomes, _ = self._get_outcome_set('test_fail_q30')
-        self.assertEqual(outcomes, {'FAIL'})
-
-    def test_fail_readlen(self):
-        """Read length just below WARN threshold → FAIL."""
-        outcomes, _ = self._get_outcome_set('test_fail_readlen')
-        self.assertEqual(outcomes, {'FAIL'})
-
-    def test_fail_dup(self):
-        """Duplication rate just above WARN threshold → FAIL."""
-        outcomes, _ = self._get_outcome_set('test_fail_dup')
-        self.assertEqual(outcomes, {'FAIL'})
-
-    def test_fail_gc(self):
-        """Unexpected GC just above threshold → FAIL."""
-        outcomes, _ = self._get_outcome_set('test_fail_gc')
-        self.assertEqual(outcomes, {'FAIL'})
-
-    def test_fail_ncontent(self):
-        """N content just above threshold → FAIL."""
-        outcomes, _ = self._get_outcome_set('test_fail_ncontent')
-        self.assertEqual(outcomes, {'FAIL'})
-
-    def test_fail_adapter(self):
-        """Adapter count just above threshold → FAIL."""
-        outcomes, _ = self._get_outcome_set('test_fail_adapter')
-        self.assertEqual(outcomes, {'FAIL'})
+    # Each sample sits just past one WARN-tier threshold
+    _WARN_TIER_FAIL_SAMPLES = (
+        'test_fail_coverage',       # coverage below
+        'test_fail_contamination',  # contamination above
+        'test_fail_q30',            # Q30 below
+        'test_fail_readlen',        # read length below
+        'test_fail_dup',            # duplication rate above
+        'test_fail_gc',             # unexpected GC above
+        'test_fail_ncontent',       # N content above
+        'test_fail_adapter',        # adapter count above
+    )
+
+    def test_individual_warn_tier_failures(self):
+        """A single WARN-tier threshold miss → FAIL."""
+        for sample_name in self._WARN_TIER_FAIL_SAMPLES:
+            with self.subTest(sample=sample_name):
+                outcomes, _ = self._get_outcome_set(sample_name)
+                self.assertEqual(outcomes, {'FAIL'})
 
     # ── Test: special cases ──────────────────────────────────────
 
@@ -168,8 +261,9 @@ class TestUQCmeOutcomes(unittest.TestCase):
         self.assertIn('PASS_GENERAL', outcomes)
         self.assertIn('FAIL_STAPHYLOCOCCUS_AUREUS', outcomes)
         # SA GC rules should fail (SA4 = GC<=33.1, SA12 = GC(%)<33.1)
-        self.assertIn('SA4', failed)
-        self.assertIn('SA12', failed)
+        missing = {'SA4', 'SA12'} - failed
+        self.assertFalse(missing,
+            f"Expected rules missing from failed: {missing}")
 
     def test_multiple_failures(self):
         """Everything bad → FAIL + FAIL_GENERAL."""
@@ -181,18 +275,10 @@ class TestUQCmeOutcomes(unittest.TestCase):
 
     def test_skipped_rules(self):
         """Test that the correct rules are skipped due to missing fields."""
-        expected_skipped_rules = {
-            'A16', 'A17', 'A18', 'A19', 'A3',
-            'EC5', 'EC10', 'EC13', 'EC14', 'EC15',
-            'KP5', 'KP8', 'KP13', 'KP14', 'KP15', 'KP24', 'KP29',
-            'KP32', 'KP33', 'KP34',
-            'SA5', 'SA10', 'SA13', 'SA14', 'SA15',
-        }
-
         actual_skipped = self.processor.skipped_rules
 
-        self.assertEqual(actual_skipped, expected_skipped_rules,
-            f"Expected skipped rules {sorted(expected_skipped_rules)}, "
+        self.assertEqual(actual_skipped, EXPECTED_SKIPPED_RULES,
+            f"Expected skipped rules {sorted(EXPECTED_SKIPPED_RULES)}, "
             f"got {sorted(actual_skipped)}")
 
     def test_warnings_generated(self):
@@ -212,78 +298,61 @@ class TestUQCmeOutcomes(unittest.TestCase):
         """Test that all 19 samples are processed."""
         self.assertEqual(len(self.results), 19,
             f"Expected 19 samples, got {len(self.results)}")
+        self.assertEqual(len(self._rows_by_name), 19,
+            "Sample names should be unique")
 
     def test_no_empty_outcomes(self):
         """Test that no samples have empty or invalid outcomes."""
-        for idx, row in self.results.iterrows():
-            sample_name = row['sample_name']
-            outcome = row['qc_outcome']
+        outcomes = self.results['qc_outcome']
 
-            with self.subTest(sample=sample_name):
-                self.assertIsNotNone(outcome,
-                    f"Sample {sample_name} has None outcome")
-                self.assertNotEqual(outcome, '',
-                    f"Sample {sample_name} has empty outcome")
-                self.assertIsInstance(outcome, str,
-                    f"Sample {sample_name} outcome is not string")
+        missing = outcomes.index[outcomes.isna()].tolist()
+        self.assertEqual(missing, [], f"Samples with None outcome: {missing}")
+        empty = outcomes.index[outcomes.eq('')].tolist()
+        self.assertEqual(empty, [], f"Samples with empty outcome: {empty}")
+        not_str = outcomes.index[~outcomes.map(type).eq(str)].tolist()
+        self.assertEqual(not_str, [],
+            f"Samples with non-string outcome: {not_str}")
 
     def test_outcome_format(self):
         """Test that QC outcomes follow expected format."""
-        valid_outcomes = {
-            'PASS', 'PASS_GENERAL', 'WARN', 'FAIL', 'FAIL_GENERAL',
-            'FAIL_ACINETOBACTER_BAUMANNII',
-            'FAIL_CAMPYLOBACTER_COLI',
-            'FAIL_CAMPYLOBACTER_JEJUNI',
-            'FAIL_ESCHERICHIA_COLI',
-            'FAIL_ENTEROCOCCUS_FAECIUM',
-            'FAIL_ENTEROBACTER_SPP',
-            'FAIL_HAEMOPHILUS_INFLUENZAE',
-            'FAIL_HELICOBACTER_PYLORI',
-            'FAIL_KLEBSIELLA_PNEUMONIAE',
-            'FAIL_MYCOPLASMA_GENITALIUM',
-            'FAIL_NEISSERIA_GONORRHOEAE',
-            'FAIL_PSEUDOMONAS_AERUGINOSA',
-            'FAIL_STAPHYLOCOCCUS_AUREUS',
-            'FAIL_SALMONELLA_ENTERICA',
-            'FAIL_SHIGELLA_FLEXNERI',
-            'FAIL_STREPTOCOCCUS_PNEUMONIAE',
-            'FAIL_SHIGELLA_SONNEI',
-        }
 
-        for idx, row in self.results.iterrows():
-            sample_name = row['sample_name']
-            outcome = row['qc_outcome']
-
-            with self.subTest(sample=sample_name):
-                for single_outcome in outcome.split(','):
-                    single_outcome = single_outcome.strip()
-                    self.assertIn(single_outcome, valid_outcomes,
-                        f"Sample {sample_name} has invalid outcome: "
-                        f"{single_outcome}")
+        outcomes = (
+            self.results['qc_outcome']
+            .str.split(',').explode().str.strip()
+        )
+        invalid = outcomes[~outcomes.isin(VALID_OUTCOMES)]
+        self.assertTrue(invalid.empty,
+            f"Invalid outcomes found:\n{invalid.to_string()}")
 
     def test_action_consistency(self):
         """Test that qc_action matches the highest-priority outcome."""
-        for idx, row in self.results.iterrows():
-            sample_name = row['sample_name']
-            outcomes = set(row['qc_outcome'].split(','))
-            action = row['qc_action']
-
-            with self.subTest(sample=sample_name):
-                if outcomes == {'PASS', 'PASS_GENERAL'}:
-                    self.assertEqual(action, 'none')
-                elif 'FAIL' in outcomes or 'FAIL_GENERAL' in outcomes or any(
-                        o.startswith('FAIL_') for o in outcomes):
-                    self.assertEqual(action, 'reject')
-                elif 'WARN' in outcomes:
-                    self.assertEqual(action, 'review')
+        results = self.results
+        outcomes = results['qc_outcome']
+
+        is_pass = outcomes.isin({'PASS,PASS_GENERAL', 'PASS_GENERAL,PASS'})
+        # FAIL, FAIL_GENERAL and every species-specific FAIL_* outcome
+        is_fail = outcomes.str.contains(r'(?:^|,)FAIL(?:_|,|$)')
+        is_warn = outcomes.str.contains(r'(?:^|,)WARN(?:,|$)')
+
+        expected = pd.Series(
+            np.select([is_pass, is_fail, is_warn],
+                      ['none', 'reject', 'review'], default=''),
+            index=is_pass.index, name='qc_action'
+        )
+        checked = expected.ne('')
+        pd.testing.assert_series_equal(
+            results.loc[checked.index[checked], 'qc_action'],
+            expected[checked]
+        )
 
 
 class TestDataIntegrity(unittest.TestCase):
     """Test the integrity of test data files."""
 
-    def setUp(self):
+    @classmethod
+    def setUpClass(cls):
         """Set up test fixtures."""
-        self.test_dir = Path(__file__).parent.parent
+        cls.test_dir = Path(__file__).parent.parent
 
     def test_all_test_files_exist(self):
         """Test that all required test files exist."""
@@ -295,17 +364,24 @@ class TestDataIntegrity(unittest.TestCase):
             ('data/QC_tests.tsv', 'QC tests')
         ]
 
+        # One directory listing per parent instead of a stat per file
+        listings = {}
         for filename, description in required_files:
             file_path = self.test_dir / filename
-            self.assertTrue(file_path.exists(),
+            if file_path.parent not in listings:
+                with os.scandir(file_path.parent) as entries:
+                    listings[file_path.parent] = {
+                        entry.name for entry in entries
+                    }
+            self.assertIn(file_path.name, listings[file_path.parent],
                 f"Required {description} file {filename} does not exist")
 
     def test_config_file_validity(self):
         """Test that the config file is valid YAML."""
         config_path = self.test_dir / "fixtures" / "config_example.yaml"
 
-        with open(config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        with open(config_path, 'rb') as f:
+            config = yaml.load(f, Loader=YAML_LOADER)
 
         self.assertIsInstance(config, dict, "Config file should be a dictionary")
         self.assertIn('qc', config, "Config should have 'qc' section")
@@ -316,25 +392,25 @@ class TestDataIntegrity(unittest.TestCase):
         """Test that data files have expected structure."""
         # Test example_run_data.tsv
         data_path = self.test_dir / "data" / "example_run_data.tsv"
-        data = pd.read_csv(data_path, sep='\t')
+        data_columns = _read_header(data_path)
 
         required_columns = ['sample_name', 'species', 'GC', 'N50',
                             'coverage_x', 'contamination_percent',
                             'q30_fraction', 'mean_read_length_bp',
                             'duplication_rate', 'number_of_genomes']
-        for col in required_columns:
-            self.assertIn(col, data.columns,
-                f"Required column {col} missing from example_run_data.tsv")
+        missing = set(required_columns) - set(data_columns)
+        self.assertFalse(missing,
+            f"Missing columns in example_run_data.tsv: {missing}")
 
         # Test QC_rules.tsv
         rules_path = self.test_dir / "data" / "QC_rules.tsv"
-        rules = pd.read_csv(rules_path, sep='\t')
+        rule_columns = _read_header(rules_path)
 
         required_rule_columns = ['rule_id', 'species', 'assembly_type',
                                  'software', 'field', 'operator', 'value']
-        for col in required_rule_columns:
-            self.assertIn(col, rules.columns,
-                f"Required column {col} missing from QC_rules.tsv")
+        missing = set(required_rule_columns) - set(rule_columns)
+        self.assertFalse(missing,
+            f"Missing columns in QC_rules.tsv: {missing}")
 
 
 if __name__ == '__main__':
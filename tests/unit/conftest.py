@@ -0,0 +1,144 @@
+"""
+Streamlit stubs shared by the unit tests.
+
+The dashboard imports streamlit at module level, so the stub modules must
+be in place before uQCme.app is first imported. They are installed only
+when a test requests them, so runs without dashboard tests never touch
+sys.modules, and they are removed again when the session ends.
+"""
+
+import sys
+import types
+
+import pytest
+
+
+class DummyPlotter:
+    """Minimal QCPlotter substitute for dashboard construction."""
+
+    def __init__(self, config):
+        self.config = config
+
+
+def _empty_metrics(_):
+    return []
+
+
+class StreamlitStub(types.ModuleType):
+    """Lightweight stub of the streamlit API used in QCDashboard."""
+
+    def __init__(self):
+        super().__init__("streamlit")
+        self.sidebar = types.SimpleNamespace()
+        self.sidebar.subheader = lambda *args, **kwargs: None
+        self.sidebar.markdown = lambda *args, **kwargs: None
+        self.sidebar.columns = lambda n: [
+            _ContextStub() for _ in range(n)
+        ]
+        self.reset()
+
+    def reset(self):
+        self.info_calls = []
+        self.warning_calls = []
+        self.success_calls = []
+        self.write_calls = []
+        self.json_calls = []
+        self.dataframe_calls = []
+        self.query_params = _QueryParamsStub()
+
+    def info(self, message):
+        self.info_calls.append(message)
+
+    def warning(self, message):
+        self.warning_calls.append(message)
+
+    def success(self, message):
+        self.success_calls.append(message)
+
+    def write(self, message):
+        self.write_calls.append(message)
+
+    def json(self, payload):
+        self.json_calls.append(payload)
+
+    def dataframe(self, data, **kwargs):
+        self.dataframe_calls.append((data, kwargs))
+        return None
+
+    def expander(self, *args, **kwargs):
+        return _ContextStub()
+
+    def error(self, message):
+        raise AssertionError(f"st.error called unexpectedly: {message}")
+
+    def stop(self):
+        raise AssertionError("st.stop called unexpectedly")
+
+    @property
+    def runtime(self):
+        return types.SimpleNamespace(exists=lambda: True)
+
+
+class _ContextStub:
+    """Simple context manager used by sidebar.columns stub."""
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    def metric(self, *args, **kwargs):
+        return None
+
+
+class _QueryParamsStub(dict):
+    """Dictionary-like query params stub with Streamlit-compatible API."""
+
+    def to_dict(self):
+        return dict(self)
+
+
+def _install_streamlit_stub():
+    """Register the streamlit, streamlit.web and uQCme.plot stubs."""
+    stub = StreamlitStub()
+
+    # Mock streamlit.web and streamlit.web.cli
+    web_stub = types.ModuleType("streamlit.web")
+    cli_stub = types.ModuleType("streamlit.web.cli")
+    cli_stub.main = lambda: None
+    web_stub.cli = cli_stub
+    stub.web = web_stub
+
+    plot_stub = types.ModuleType("uQCme.plot")
+    plot_stub.QCPlotter = DummyPlotter
+    plot_stub.get_available_metrics = _empty_metrics
+
+    modules = {
+        "streamlit": stub,
+        "streamlit.web": web_stub,
+        "streamlit.web.cli": cli_stub,
+        "uQCme.plot": plot_stub,
+    }
+    previous = {name: sys.modules.get(name) for name in modules}
+    sys.modules.update(modules)
+    return stub, previous
+
+
+@pytest.fixture(scope="session")
+def streamlit_modules():
+    """Install the stub modules for the session and yield the stub."""
+    stub, previous = _install_streamlit_stub()
+    yield stub
+    for name, module in previous.items():
+        if module is None:
+            sys.modules.pop(name, None)
+        else:
+            sys.modules[name] = module
+
+
+@pytest.fixture
+def streamlit_stub(streamlit_modules):
+    """Return the installed streamlit stub with its call records cleared."""
+    streamlit_modules.reset()
+    return streamlit_modules
@@ -1,16 +1,20 @@
 #!/usr/bin/env python3
 """Unit tests for configuration models."""
 
+import os
 import sys
+import tempfile
 import unittest
 from pathlib import Path
 
 from pydantic import ValidationError
 
-# Add src directory to import path.
-sys.path.insert(0, str(Path(__file__).parents[2] / "src"))
+if __name__ == "__main__":
+    # Run directly, outside the pytest pythonpath setting in pyproject.toml
+    sys.path.insert(0, str(Path(__file__).parents[2] / "src"))
 
 from uQCme.core.config import UQCMeConfig
+from uQCme.core.loader import load_yaml_file
 
 
 class TestConfigModels(unittest.TestCase):
@@ -154,6 +158,47 @@ class TestConfigModels(unittest.TestCase):
         self.assertEqual(action.api_bearer_token, "test-token")
         self.assertEqual(action.api_bearer_token_env, "UQCME_ACTION_TOKEN")
 
+    def test_qc_output_chunksize(self):
+        """Result write chunk size defaults to 100k and must be positive."""
+        qc_input = {
+            "mapping": "config/mapping.yaml",
+            "qc_rules": "config/QC_rules.tsv",
+            "qc_tests": "config/QC_tests.tsv",
+        }
+        config = UQCMeConfig(qc={"input": qc_input, "output": {}})
+        self.assertEqual(config.qc.output.chunksize, 100_000)
+
+        with self.assertRaises(ValidationError):
+            UQCMeConfig(
+                qc={"input": qc_input, "output": {"chunksize": 0}}
+            )
+
+    def test_null_sections_match_missing_sections(self):
+        """A null qc or app section is the same as omitting it."""
+        config = UQCMeConfig(qc=None, app=None)
+        self.assertIsNone(config.qc)
+        self.assertIsNone(config.app)
+        self.assertEqual(config, UQCMeConfig())
+
+
+class TestLoadYamlFile(unittest.TestCase):
+    """Tests for the cached YAML file loader."""
+
+    def test_reparses_only_when_file_changes(self):
+        """Unchanged files reuse the parse; callers get independent copies."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "mapping.yaml"
+            path.write_text("Sections:\n  a: 1\n", encoding="utf-8")
+
+            first = load_yaml_file(path)
+            first["Sections"]["a"] = 2
+            self.assertEqual(load_yaml_file(path), {"Sections": {"a": 1}})
+
+            stat = path.stat()
+            path.write_text("Sections:\n  b: 22\n", encoding="utf-8")
+            os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+            self.assertEqual(load_yaml_file(path), {"Sections": {"b": 22}})
+
 
 if __name__ == "__main__":
     unittest.main()
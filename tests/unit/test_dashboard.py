@@ -2,147 +2,100 @@
 
 from __future__ import annotations
 
-import sys
-import types
+import json
 import importlib
-from pathlib import Path
+import socket
+import sys
+from unittest.mock import MagicMock, patch
 
 import pandas as pd
 import pytest
 import requests
-import yaml
-
-# Add src to path
-sys.path.insert(0, str(Path(__file__).parents[2] / "src"))
-
-
-class DummyPlotter:
-    """Minimal QCPlotter substitute for dashboard construction."""
-
-    def __init__(self, config):
-        self.config = config
-
-
-def _empty_metrics(_):
-    return []
-
-
-class StreamlitStub(types.ModuleType):
-    """Lightweight stub of the streamlit API used in QCDashboard."""
-
-    def __init__(self):
-        super().__init__("streamlit")
-        self.sidebar = types.SimpleNamespace()
-        self.sidebar.subheader = lambda *args, **kwargs: None
-        self.sidebar.markdown = lambda *args, **kwargs: None
-        self.sidebar.columns = lambda n: [
-            _ContextStub() for _ in range(n)
-        ]
-        self.reset()
+import urllib3
 
-    def reset(self):
-        self.info_calls = []
-        self.warning_calls = []
-        self.success_calls = []
-        self.write_calls = []
-        self.json_calls = []
-        self.dataframe_calls = []
-        self.query_params = _QueryParamsStub()
-
-    def info(self, message):
-        self.info_calls.append(message)
-
-    def warning(self, message):
-        self.warning_calls.append(message)
-
-    def success(self, message):
-        self.success_calls.append(message)
-
-    def write(self, message):
-        self.write_calls.append(message)
-
-    def json(self, payload):
-        self.json_calls.append(payload)
+from uQCme.core import loader
 
-    def dataframe(self, data, **kwargs):
-        self.dataframe_calls.append((data, kwargs))
-        return None
 
-    def expander(self, *args, **kwargs):
-        return _ContextStub()
+@pytest.fixture(scope="module")
+def app(streamlit_modules):
+    """Import the dashboard package only when a dashboard test runs."""
+    main = sys.modules.get("uQCme.app.main")
+    if main is not None and main.st is not streamlit_modules:
+        # Imported earlier against the real streamlit (e.g. by importing
+        # uQCme.app.plot); rebind it, and the package export, to the stub
+        importlib.reload(main)
+        importlib.reload(sys.modules["uQCme.app"])
+    return importlib.import_module("uQCme.app")
 
-    def error(self, message):
-        raise AssertionError(f"st.error called unexpectedly: {message}")
 
-    def stop(self):
-        raise AssertionError("st.stop called unexpectedly")
-    
-    @property
-    def runtime(self):
-        return types.SimpleNamespace(exists=lambda: True)
+def _mock_response(
+    payload=None,
+    status_code: int = 200,
+    content: bytes | None = None,
+    content_type: str = "application/json",
+):
+    """Return a requests.Response mock carrying a JSON (or raw) body."""
+    response = MagicMock(spec=requests.Response)
+    response.status_code = status_code
+    response.headers = {"content-type": content_type}
+    response.json.return_value = payload
+    response.content = (
+        json.dumps(payload).encode("utf-8") if content is None else content
+    )
+    response.text = ""
+    response.raise_for_status.return_value = None
+    return response
 
 
-class _ContextStub:
-    """Simple context manager used by sidebar.columns stub."""
+class RecordingAdapter(requests.adapters.BaseAdapter):
+    """Transport adapter that records requests and answers with JSON.
 
-    def __enter__(self):
-        return self
+    Mounted on the shared session, it exercises the real request
+    preparation and response handling without any network access.
+    """
 
-    def __exit__(self, exc_type, exc, tb):
-        return False
+    def __init__(self, payload, status_code: int = 200):
+        super().__init__()
+        self._body = json.dumps(payload).encode("utf-8")
+        self._status_code = status_code
+        self.calls = []
+
+    def send(self, request, **kwargs):
+        self.calls.append((request, kwargs))
+        response = requests.Response()
+        response.status_code = self._status_code
+        response.headers["content-type"] = "application/json"
+        response._content = self._body
+        response.url = request.url
+        response.request = request
+        return response
 
-    def metric(self, *args, **kwargs):
+    def close(self):
         return None
 
 
-class _QueryParamsStub(dict):
-    """Dictionary-like query params stub with Streamlit-compatible API."""
-
-    def to_dict(self):
-        return dict(self)
-
-
-streamlit_stub = StreamlitStub()
-
-# Mock streamlit.web and streamlit.web.cli
-web_stub = types.ModuleType("streamlit.web")
-cli_stub = types.ModuleType("streamlit.web.cli")
-cli_stub.main = lambda: None
-web_stub.cli = cli_stub
-streamlit_stub.web = web_stub
-sys.modules["streamlit.web"] = web_stub
-sys.modules["streamlit.web.cli"] = cli_stub
-
-plot_stub = types.ModuleType("uQCme.plot")
-plot_stub.QCPlotter = DummyPlotter
-plot_stub.get_available_metrics = _empty_metrics
-
-sys.modules["streamlit"] = streamlit_stub
-sys.modules["uQCme.plot"] = plot_stub
-
-from uQCme import app
-from uQCme.core import loader
-
-dashboard_main = importlib.import_module("uQCme.app.main")
-
-
-class DummyResponse:
-    """Simple response object emulating requests.Response for tests."""
-
-    def __init__(self, payload, status_code: int = 200):
-        self._payload = payload
-        self.status_code = status_code
-        self.headers = {"content-type": "application/json"}
+def _assert_single_get(adapter, url, headers):
+    """The adapter saw exactly one GET, with headers on top of the defaults."""
+    (request, kwargs), = adapter.calls
+    assert request.method == "GET"
+    assert request.url == url
+    expected = requests.structures.CaseInsensitiveDict(
+        loader._HTTP_SESSION.headers
+    )
+    expected.update(headers)
+    assert dict(request.headers.lower_items()) == dict(expected.lower_items())
+    assert kwargs["timeout"] == 30
+    # The session may resolve verify=True to a CA bundle path
+    assert kwargs["verify"] is not False
 
-    def json(self):
-        return self._payload
 
-    @property
-    def text(self):
-        return ""
+def _write_config(path, config):
+    """Write a config for the YAML loader.
 
-    def raise_for_status(self):
-        return None
+    JSON is valid YAML, and the stdlib encoder is much cheaper than a
+    YAML dump, which these throwaway per-test configs do not need.
+    """
+    path.write_text(json.dumps(config), encoding="utf-8")
 
 
 def _build_api_config(
@@ -176,11 +129,12 @@ def _build_api_config(
         }
     }
     config_path = tmp_path / "config_api.yaml"
-    config_path.write_text(yaml.safe_dump(config), encoding="utf-8")
+    _write_config(config_path, config)
     return config_path
 
 
 def _build_dashboard_with_sample_action(
+    app,
     tmp_path,
     test_data_paths,
     sample_action: dict,
@@ -199,13 +153,14 @@ def _build_dashboard_with_sample_action(
         }
     }
     config_path = tmp_path / "config_sample_action.yaml"
-    config_path.write_text(yaml.safe_dump(config), encoding="utf-8")
+    _write_config(config_path, config)
     return app.QCDashboard(str(config_path))
 
 
-def test_load_data_from_api(monkeypatch, tmp_path, test_data_paths):
+def test_load_data_from_api(
+    monkeypatch, tmp_path, test_data_paths, streamlit_stub, app
+):
     """QCDashboard.load_data should populate data from an API endpoint."""
-    streamlit_stub.reset()
 
     expected_url = "https://example.test/api/run-data"
     config_path = _build_api_config(tmp_path, test_data_paths, expected_url)
@@ -226,50 +181,41 @@ def test_load_data_from_api(monkeypatch, tmp_path, test_data_paths):
         },
     ]
 
-    response = DummyResponse(api_payload)
-
-    def fake_get(url, headers, timeout, verify, cookies=None):
-        assert url == expected_url
-        assert headers == {"accept": "application/json"}
-        assert timeout == 30
-        assert verify is True
-        return response
-
-    monkeypatch.setattr(loader.requests, "get", fake_get)
+    adapter = RecordingAdapter(api_payload)
+    monkeypatch.setitem(loader._HTTP_SESSION.adapters, "https://", adapter)
 
     dashboard.load_data()
 
-    expected_df = pd.DataFrame(api_payload)
-    pd.testing.assert_frame_equal(
-        dashboard.data.sort_index(axis=1), expected_df.sort_index(axis=1)
+    _assert_single_get(
+        adapter, expected_url, {"accept": "application/json"}
     )
 
+    # Plain record dicts; key order does not matter
+    assert dashboard.data.to_dict(orient="records") == api_payload
+
 
 def test_load_data_from_api_allows_missing_sample_name_when_not_required(
-    monkeypatch, tmp_path, test_data_paths
+    monkeypatch, tmp_path, test_data_paths, streamlit_stub, app
 ):
     """API data without sample_name should load when mapping does not require it."""
-    streamlit_stub.reset()
 
     expected_url = "https://example.test/api/run-data"
     mapping_path = tmp_path / "mapping_without_sample_name.yaml"
-    mapping_path.write_text(
-        yaml.safe_dump(
-            {
-                "Sections": {
-                    "QC_metrics": {
-                        "QC outcome": {
-                            "data": {"mapping": "qc_outcome"},
-                            "report": {"filter": True},
-                        },
-                        "Provided Species": {
-                            "data": {"mapping": "species"},
-                        },
-                    }
+    _write_config(
+        mapping_path,
+        {
+            "Sections": {
+                "QC_metrics": {
+                    "QC outcome": {
+                        "data": {"mapping": "qc_outcome"},
+                        "report": {"filter": True},
+                    },
+                    "Provided Species": {
+                        "data": {"mapping": "species"},
+                    },
                 }
             }
-        ),
-        encoding="utf-8",
+        }
     )
 
     config = {
@@ -283,7 +229,7 @@ def test_load_data_from_api_allows_missing_sample_name_when_not_required(
         }
     }
     config_path = tmp_path / "config_api_without_sample_name.yaml"
-    config_path.write_text(yaml.safe_dump(config), encoding="utf-8")
+    _write_config(config_path, config)
     dashboard = app.QCDashboard(str(config_path))
 
     api_payload = [
@@ -299,30 +245,23 @@ def test_load_data_from_api_allows_missing_sample_name_when_not_required(
         },
     ]
 
-    response = DummyResponse(api_payload)
-
-    def fake_get(url, headers, timeout, verify, cookies=None):
-        assert url == expected_url
-        assert headers == {"accept": "application/json"}
-        assert timeout == 30
-        assert verify is True
-        return response
-
-    monkeypatch.setattr(loader.requests, "get", fake_get)
+    adapter = RecordingAdapter(api_payload)
+    monkeypatch.setitem(loader._HTTP_SESSION.adapters, "https://", adapter)
 
     dashboard.load_data()
 
-    expected_df = pd.DataFrame(api_payload)
-    pd.testing.assert_frame_equal(
-        dashboard.data.sort_index(axis=1), expected_df.sort_index(axis=1)
+    _assert_single_get(
+        adapter, expected_url, {"accept": "application/json"}
     )
 
+    # Plain record dicts; key order does not matter
+    assert dashboard.data.to_dict(orient="records") == api_payload
+
 
 def test_load_data_from_api_with_bearer_token(
-    monkeypatch, tmp_path, test_data_paths
+    monkeypatch, tmp_path, test_data_paths, streamlit_stub, app
 ):
     """API data loading should include bearer token from config."""
-    streamlit_stub.reset()
 
     expected_url = "https://example.test/api/run-data"
     config_path = _build_api_config(
@@ -333,7 +272,7 @@ def test_load_data_from_api_with_bearer_token(
     )
     dashboard = app.QCDashboard(str(config_path))
 
-    response = DummyResponse([
+    adapter = RecordingAdapter([
         {
             "sample_name": "S1",
             "qc_outcome": "PASS",
@@ -341,27 +280,20 @@ def test_load_data_from_api_with_bearer_token(
             "provided_species": "E. coli",
         }
     ])
-
-    def fake_get(url, headers, timeout, verify, cookies=None):
-        assert url == expected_url
-        assert headers == {
-            "accept": "application/json",
-            "Authorization": "Bearer token-from-config",
-        }
-        assert timeout == 30
-        assert verify is True
-        return response
-
-    monkeypatch.setattr(loader.requests, "get", fake_get)
+    monkeypatch.setitem(loader._HTTP_SESSION.adapters, "https://", adapter)
 
     dashboard.load_data()
 
+    _assert_single_get(adapter, expected_url, {
+        "accept": "application/json",
+        "Authorization": "Bearer token-from-config",
+    })
+
 
 def test_load_data_from_api_with_bearer_token_env(
-    monkeypatch, tmp_path, test_data_paths
+    monkeypatch, tmp_path, test_data_paths, streamlit_stub, app
 ):
     """API data loading should include bearer token from configured env var."""
-    streamlit_stub.reset()
     monkeypatch.setenv("UQCME_TEST_API_TOKEN", "token-from-env")
 
     expected_url = "https://example.test/api/run-data"
@@ -373,7 +305,7 @@ def test_load_data_from_api_with_bearer_token_env(
     )
     dashboard = app.QCDashboard(str(config_path))
 
-    response = DummyResponse([
+    adapter = RecordingAdapter([
         {
             "sample_name": "S1",
             "qc_outcome": "PASS",
@@ -381,27 +313,20 @@ def test_load_data_from_api_with_bearer_token_env(
             "provided_species": "E. coli",
         }
     ])
-
-    def fake_get(url, headers, timeout, verify, cookies=None):
-        assert url == expected_url
-        assert headers == {
-            "accept": "application/json",
-            "Authorization": "Bearer token-from-env",
-        }
-        assert timeout == 30
-        assert verify is True
-        return response
-
-    monkeypatch.setattr(loader.requests, "get", fake_get)
+    monkeypatch.setitem(loader._HTTP_SESSION.adapters, "https://", adapter)
 
     dashboard.load_data()
 
+    _assert_single_get(adapter, expected_url, {
+        "accept": "application/json",
+        "Authorization": "Bearer token-from-env",
+    })
+
 
 def test_load_data_from_api_debug_captures_payload(
-    monkeypatch, tmp_path, test_data_paths
+    monkeypatch, tmp_path, test_data_paths, streamlit_stub, app
 ):
     """Debug mode should retain API payload preview for browser inspection."""
-    streamlit_stub.reset()
 
     expected_url = "https://example.test/api/run-data"
     config_path = _build_api_config(
@@ -427,13 +352,13 @@ def test_load_data_from_api_debug_captures_payload(
         },
     ]
 
-    response = DummyResponse(api_payload)
+    response = _mock_response(api_payload)
 
     def fake_get(url, headers, timeout, verify, cookies=None):
         assert url == expected_url
         return response
 
-    monkeypatch.setattr(loader.requests, "get", fake_get)
+    monkeypatch.setattr(loader._HTTP_SESSION, "get", fake_get)
 
     dashboard.load_data()
 
@@ -445,10 +370,9 @@ def test_load_data_from_api_debug_captures_payload(
 
 
 def test_render_api_debug_panel_shows_payload(
-    monkeypatch, tmp_path, test_data_paths
+    monkeypatch, tmp_path, test_data_paths, streamlit_stub, app
 ):
     """Debug panel should render payload preview and table preview."""
-    streamlit_stub.reset()
 
     expected_url = "https://example.test/api/run-data"
     config_path = _build_api_config(
@@ -478,10 +402,9 @@ def test_render_api_debug_panel_shows_payload(
 
 
 def test_url_debug_param_enables_api_debug(
-    tmp_path, test_data_paths
+    tmp_path, test_data_paths, streamlit_stub, app
 ):
     """URL debug query param should override config and enable debug."""
-    streamlit_stub.reset()
     streamlit_stub.query_params["debug"] = "TRUE"
 
     expected_url = "https://example.test/api/run-data"
@@ -497,10 +420,9 @@ def test_url_debug_param_enables_api_debug(
 
 
 def test_url_debug_param_disables_api_debug(
-    tmp_path, test_data_paths
+    tmp_path, test_data_paths, streamlit_stub, app
 ):
     """URL debug query param should override config and disable debug."""
-    streamlit_stub.reset()
     streamlit_stub.query_params["debug"] = "FALSE"
 
     expected_url = "https://example.test/api/run-data"
@@ -516,11 +438,11 @@ def test_url_debug_param_disables_api_debug(
 
 
 def test_trigger_sample_api_action_with_bearer_token(
-    monkeypatch, tmp_path, test_data_paths
+    tmp_path, test_data_paths, streamlit_stub, app
 ):
     """Sample action requests should include bearer token from config."""
-    streamlit_stub.reset()
     dashboard = _build_dashboard_with_sample_action(
+        app,
         tmp_path,
         test_data_paths,
         {
@@ -536,35 +458,36 @@ def test_trigger_sample_api_action_with_bearer_token(
         {"sample_name": "S1", "sample_id": "ID-1"},
         {"sample_name": "S2", "sample_id": "ID-2"},
     ])
-    response = DummyResponse({"ok": True})
-
-    def fake_request(**kwargs):
-        assert kwargs["method"] == "POST"
-        assert kwargs["url"] == "https://example.test/api/action"
-        assert kwargs["timeout"] == 30
-        assert kwargs["headers"] == {
+    response = _mock_response({"ok": True})
+
+    with patch.object(
+        requests, "request", return_value=response
+    ) as mock_request:
+        result = dashboard._trigger_sample_api_action(
+            action, selected_rows, "sample_id"
+        )
+
+    mock_request.assert_called_once_with(
+        method="POST",
+        url="https://example.test/api/action",
+        timeout=30,
+        headers={
             "X-Trace-Id": "trace-123",
             "Authorization": "Bearer action-token",
-        }
-        assert kwargs["json"] == {"sample_name": ["S1", "S2"]}
-        return response
-
-    monkeypatch.setattr(dashboard_main.requests, "request", fake_request)
-
-    result = dashboard._trigger_sample_api_action(
-        action, selected_rows, "sample_id"
+        },
+        json={"sample_name": ["S1", "S2"]},
     )
-
+    response.raise_for_status.assert_called_once_with()
     assert result is response
 
 
 def test_trigger_sample_api_action_with_bearer_token_env(
-    monkeypatch, tmp_path, test_data_paths
+    monkeypatch, tmp_path, test_data_paths, streamlit_stub, app
 ):
     """Sample action requests should include bearer token from env var."""
-    streamlit_stub.reset()
     monkeypatch.setenv("UQCME_ACTION_TOKEN", "env-action-token")
     dashboard = _build_dashboard_with_sample_action(
+        app,
         tmp_path,
         test_data_paths,
         {
@@ -579,29 +502,29 @@ def test_trigger_sample_api_action_with_bearer_token_env(
     selected_rows = pd.DataFrame([
         {"sample_name": "S1", "sample_id": "ID-1"},
     ])
-    response = DummyResponse({"ok": True})
-
-    def fake_request(**kwargs):
-        assert kwargs["headers"] == {
-            "Authorization": "Bearer env-action-token",
-        }
-        assert kwargs["json"] == {"sample_name": "S1"}
-        return response
-
-    monkeypatch.setattr(dashboard_main.requests, "request", fake_request)
-
-    result = dashboard._trigger_sample_api_action(
-        action, selected_rows, "sample_id"
+    response = _mock_response({"ok": True})
+
+    with patch.object(
+        requests, "request", return_value=response
+    ) as mock_request:
+        result = dashboard._trigger_sample_api_action(
+            action, selected_rows, "sample_id"
+        )
+
+    mock_request.assert_called_once_with(
+        method="POST",
+        url="https://example.test/api/action",
+        timeout=30,
+        headers={"Authorization": "Bearer env-action-token"},
+        json={"sample_name": "S1"},
     )
-
     assert result is response
 
 
 def test_load_data_from_api_with_custom_headers(
-    monkeypatch, tmp_path, test_data_paths
+    monkeypatch, tmp_path, test_data_paths, streamlit_stub, app
 ):
     """X-Project-Id header should be converted to project_id query param."""
-    streamlit_stub.reset()
 
     expected_url = "https://example.test/api/run-data"
     config_path = _build_api_config(
@@ -615,7 +538,7 @@ def test_load_data_from_api_with_custom_headers(
     )
     dashboard = app.QCDashboard(str(config_path))
 
-    response = DummyResponse([
+    adapter = RecordingAdapter([
         {
             "sample_name": "S1",
             "qc_outcome": "PASS",
@@ -623,21 +546,15 @@ def test_load_data_from_api_with_custom_headers(
             "provided_species": "E. coli",
         }
     ])
-
-    def fake_get(url, headers, timeout, verify, cookies=None):
-        assert url == f"{expected_url}?project_id=project-123"
-        assert headers == {
-            "accept": "application/json",
-            "X-Trace-Id": "trace-abc",
-        }
-        assert timeout == 30
-        assert verify is True
-        return response
-
-    monkeypatch.setattr(loader.requests, "get", fake_get)
+    monkeypatch.setitem(loader._HTTP_SESSION.adapters, "https://", adapter)
 
     dashboard.load_data()
 
+    _assert_single_get(adapter, f"{expected_url}?project_id=project-123", {
+        "accept": "application/json",
+        "X-Trace-Id": "trace-abc",
+    })
+
 
 def test_load_data_from_api_retries_with_session_cookie(monkeypatch):
     """401 NOT_AUTHENTICATED should retry using viewer_session cookie."""
@@ -665,7 +582,7 @@ def test_load_data_from_api_retries_with_session_cookie(monkeypatch):
                 "401 Client Error: Unauthorized", response=self
             )
 
-    response = DummyResponse(payload)
+    response = _mock_response(payload)
 
     def fake_get(url, headers, timeout, verify, cookies=None):
         assert url == expected_url
@@ -680,17 +597,14 @@ def test_load_data_from_api_retries_with_session_cookie(monkeypatch):
         assert cookies == {"viewer_session": "token-from-config"}
         return response
 
-    monkeypatch.setattr(loader.requests, "get", fake_get)
+    monkeypatch.setattr(loader._HTTP_SESSION, "get", fake_get)
 
     df = loader.load_data_from_api(
         expected_url, bearer_token="token-from-config"
     )
 
     assert call_count["value"] == 2
-    expected_df = pd.DataFrame(payload)
-    pd.testing.assert_frame_equal(
-        df.sort_index(axis=1), expected_df.sort_index(axis=1)
-    )
+    assert df.to_dict(orient="records") == payload
 
 
 def test_load_data_from_api_http_error_surfaces_detail(monkeypatch):
@@ -714,7 +628,7 @@ def test_load_data_from_api_http_error_surfaces_detail(monkeypatch):
         assert url == expected_url
         return ErrorResponse()
 
-    monkeypatch.setattr(loader.requests, "get", fake_get)
+    monkeypatch.setattr(loader._HTTP_SESSION, "get", fake_get)
 
     with pytest.raises(loader.DataLoadError) as exc_info:
         loader.load_data_from_api(expected_url)
@@ -723,3 +637,234 @@ def test_load_data_from_api_http_error_surfaces_detail(monkeypatch):
     assert "HTTP 404" in message
     assert expected_url in message
     assert detail in message
+
+
+def test_load_data_from_api_invalid_json(monkeypatch):
+    """A body that is not JSON raises an invalid JSON load error."""
+    response = _mock_response(content=b"<html>Service Unavailable</html>")
+
+    def fake_get(url, headers, timeout, verify, cookies=None):
+        return response
+
+    monkeypatch.setattr(loader._HTTP_SESSION, "get", fake_get)
+
+    with pytest.raises(loader.DataLoadError) as exc_info:
+        loader.load_data_from_api("https://example.test/api/run-data")
+
+    assert "Invalid JSON response" in str(exc_info.value)
+
+
+def test_http_session_does_not_retry_refused_connections():
+    """A refused connection fails on the first attempt, without backoff."""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    with patch(
+        "urllib3.connection.connection.create_connection",
+        wraps=urllib3.util.connection.create_connection,
+    ) as connect:
+        with pytest.raises(requests.ConnectionError):
+            loader._HTTP_SESSION.get(f"http://127.0.0.1:{port}/", timeout=1)
+
+    assert connect.call_count == 1
+
+
+def test_compile_mapping_collects_renames_in_one_pass():
+    """Standard-field renames and the sample_name source come from one walk."""
+    mapping = {
+        "Sections": {
+            "Sample": {
+                "id": {"data": {"mapping": "sampleId"},
+                       "QC": {"mapping": "sample_name"}},
+                "organism": {"data": {"mapping": "organism"},
+                             "QC": {"mapping": ["taxon", "species"]}},
+                "unmapped": {"QC": {"mapping": "sample_name"}},
+                "note": "not a field",
+            },
+            "Metrics": {
+                "gc": {"data": {"mapping": "GC"}, "QC": {"mapping": "GC"}},
+            },
+        }
+    }
+
+    column_mappings, sample_name_source = loader._compile_mapping(mapping)
+
+    assert column_mappings == {
+        "sampleId": "sample_name", "organism": "species"
+    }
+    assert sample_name_source == "sampleId"
+    assert loader._get_column_mappings(mapping) == column_mappings
+    assert loader._get_sample_name_source(mapping) == "sampleId"
+    assert loader._compile_mapping(None) == ({}, None)
+
+
+def test_validate_run_data_frame_skips_validated_frames(monkeypatch):
+    """Strict schema checks run once per frame object, not once per call."""
+    calls = []
+    original = loader.RunDataSchema.validate
+
+    def counting_validate(df, *args, **kwargs):
+        calls.append(df)
+        return original(df, *args, **kwargs)
+
+    monkeypatch.setattr(loader.RunDataSchema, "validate", counting_validate)
+    monkeypatch.setenv("UQCME_STRICT_VALIDATE", "1")
+    df = pd.DataFrame({"sample_name": ["S1", "S2"], "GC": [50.0, 51.0]})
+
+    loader.validate_run_data_frame(df)
+    loader.validate_run_data_frame(df)
+    assert len(calls) == 1
+
+    loader.validate_run_data_frame(df.copy())
+    assert len(calls) == 2
+
+
+def test_validate_run_data_frame_fast_path(monkeypatch):
+    """Without strict mode the schema is checked without pandera."""
+    monkeypatch.delenv("UQCME_STRICT_VALIDATE", raising=False)
+
+    def fail_validate(*args, **kwargs):
+        raise AssertionError("pandera validation should not run")
+
+    monkeypatch.setattr(loader.RunDataSchema, "validate", fail_validate)
+
+    loader.validate_run_data_frame(
+        pd.DataFrame({"sample_name": ["S1", None], "GC": [50.0, 51.0]})
+    )
+    loader.validate_run_data_frame(pd.DataFrame({"GC": [50.0]}))
+
+    duplicated = pd.DataFrame(
+        [["S1", "S2"]], columns=["sample_name", "sample_name"]
+    )
+    with pytest.raises(loader.ValidationError, match="more than once"):
+        loader.validate_run_data_frame(duplicated)
+
+
+def test_load_data_from_config_reads_identifiers_as_text(tmp_path):
+    """Numeric-looking sample names keep their leading zeros."""
+    data_path = tmp_path / "run_data.tsv"
+    data_path.write_text(
+        "sample_name\tspecies\tGC\n001\tE. coli\t50.5\n002\t\t51.0\n",
+        encoding="utf-8",
+    )
+
+    df = loader.load_data_from_config(str(data_path))
+
+    assert df["sample_name"].tolist() == ["001", "002"]
+    assert df["species"].isna().tolist() == [False, True]
+    assert df["GC"].dtype == float
+
+
+def test_prepare_loaded_data_frame_applies_renames_once():
+    """Mapped renames and the sample_name fallback land in one frame."""
+    mapping = {
+        "Sections": {
+            "Sample": {
+                "id": {"data": {"mapping": "sampleId"},
+                       "QC": {"mapping": "sample_name_raw"}},
+                "organism": {"data": {"mapping": "organism"},
+                             "QC": {"mapping": "species"}},
+            }
+        }
+    }
+    raw = pd.DataFrame({
+        "sampleName": ["S1", "S2"],
+        "organism": ["E. coli", "Listeria"],
+        "GC": [50.0, 51.0],
+    })
+
+    df = loader.prepare_loaded_data_frame(raw, mapping)
+
+    assert df.columns.tolist() == ["sample_name", "species", "GC"]
+    assert raw.columns.tolist() == ["sampleName", "organism", "GC"]
+    assert df["species"].tolist() == ["E. coli", "Listeria"]
+
+
+def test_load_data_from_api_reads_ndjson(monkeypatch):
+    """Newline-delimited JSON responses yield one row per line."""
+    response = _mock_response(
+        content=(
+            b'{"sample_name": "S1", "GC": 50.5}\n'
+            b'\n'
+            b'{"sample_name": "S2", "GC": 51.0}\n'
+        ),
+        content_type="application/x-ndjson; charset=utf-8",
+    )
+
+    def fake_get(url, headers, timeout, verify, cookies=None):
+        return response
+
+    monkeypatch.setattr(loader._HTTP_SESSION, "get", fake_get)
+
+    df = loader.load_data_from_api("https://example.test/api/run-data")
+
+    assert df["sample_name"].tolist() == ["S1", "S2"]
+    assert df["GC"].tolist() == [50.5, 51.0]
+
+
+def test_mapping_plan_reused_across_loads(tmp_path):
+    """A prebuilt MappingPlan drives renames, dtypes and unique checks."""
+    mapping = {
+        "Sections": {
+            "Sample": {
+                "id": {"data": {"mapping": "sampleId", "unique": True},
+                       "QC": {"mapping": "sample_name"}},
+            }
+        }
+    }
+    plan = loader.MappingPlan.from_config(mapping)
+
+    assert plan.column_mappings == {"sampleId": "sample_name"}
+    assert plan.unique_columns == ("sampleId",)
+    assert plan.dtypes["sampleId"] is str
+    assert loader.MappingPlan.from_config(plan) is plan
+
+    data_path = tmp_path / "run_data.tsv"
+    data_path.write_text("sampleId\tGC\n007\t50.5\n", encoding="utf-8")
+    df = loader.load_data_from_config(str(data_path), plan)
+    assert df["sample_name"].tolist() == ["007"]
+
+    raw = pd.DataFrame({"sampleId": ["A", "A"], "GC": [1.0, 2.0]})
+    with pytest.raises(loader.ValidationError, match="marked unique"):
+        loader.validate_run_data_frame(raw, plan)
+
+
+def test_load_data_from_api_remembers_unverified_hosts(monkeypatch):
+    """After an SSL failure the host is called without verification."""
+    monkeypatch.setattr(loader, "_UNVERIFIED_HOSTS", set())
+    verify_flags = []
+
+    def fake_get(url, headers, timeout, verify, cookies=None):
+        verify_flags.append(verify)
+        if verify:
+            raise requests.exceptions.SSLError("certificate verify failed")
+        return _mock_response([{"sample_name": "S1"}])
+
+    monkeypatch.setattr(loader._HTTP_SESSION, "get", fake_get)
+
+    loader.load_data_from_api("https://self-signed.test/api/run-data")
+    loader.load_data_from_api("https://self-signed.test/api/other")
+
+    assert verify_flags == [True, False, False]
+    assert loader._UNVERIFIED_HOSTS == {"self-signed.test"}
+
+
+def test_iter_data_from_config_yields_validated_chunks(test_data_paths):
+    """Chunked loading matches a whole-file load, chunk by chunk."""
+    path = str(test_data_paths["example_run_data"])
+
+    chunks = list(loader.iter_data_from_config(path, chunksize=7))
+
+    assert [len(chunk) for chunk in chunks[:-1]] == [7] * (len(chunks) - 1)
+    pd.testing.assert_frame_equal(
+        pd.concat(chunks), loader.load_data_from_config(path)
+    )
+
+
+def test_iter_data_from_config_is_lazy(tmp_path):
+    """Load errors surface when the first chunk is requested."""
+    chunks = loader.iter_data_from_config(str(tmp_path / "missing.tsv"))
+
+    with pytest.raises(loader.DataLoadError, match="Failed to load data"):
+        next(chunks)
@@ -0,0 +1,28 @@
+#!/usr/bin/env python3
+"""Unit tests for uQCme logging setup."""
+
+import logging
+
+from uQCme.core.logging import _BufferedFileHandler
+
+
+def _record(level, message):
+    return logging.LogRecord('uQCme', level, __file__, 0, message, None, None)
+
+
+def test_buffered_file_handler_flushes_on_errors_and_close(tmp_path):
+    """Info records stay buffered until an error record or close."""
+    log_path = tmp_path / "uQCme.log"
+    handler = _BufferedFileHandler(str(log_path))
+    try:
+        handler.emit(_record(logging.INFO, "first"))
+        assert log_path.read_text() == ""
+
+        handler.emit(_record(logging.ERROR, "second"))
+        assert log_path.read_text() == "first\nsecond\n"
+
+        handler.emit(_record(logging.INFO, "third"))
+    finally:
+        handler.close()
+
+    assert log_path.read_text() == "first\nsecond\nthird\n"
@@ -0,0 +1,355 @@
+#!/usr/bin/env python3
+"""Unit tests for the QCPlotter plotting helpers."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from uQCme.app.plot import (
+    DEFAULT_OUTCOME_COLORS,
+    SCATTER_DOWNSAMPLE_THRESHOLD,
+    SCATTER_MAX_POINTS_PER_OUTCOME,
+    QCPlotter,
+    _category_counts,
+    _downcast_numeric,
+    get_available_metrics,
+    validate_metric_for_plotting,
+)
+from uQCme.core.config import UQCMeConfig
+
+
+@pytest.fixture
+def plotter():
+    """Return a plotter built from an empty configuration."""
+    return QCPlotter(UQCMeConfig())
+
+
+def test_analyze_failed_rules_counts_and_sorts(plotter):
+    """Failed rules are split, stripped, counted and sorted descending."""
+    data = pd.DataFrame({
+        'failed_rules': ['R1,R2', 'R2', None, '', 'R2, R3', 'R1']
+    })
+
+    result = plotter._analyze_failed_rules(data)
+
+    assert list(result.columns) == ['rule', 'count']
+    assert result.iloc[0].tolist() == ['R2', 3]
+    assert dict(zip(result['rule'], result['count'])) == {
+        'R1': 2, 'R2': 3, 'R3': 1
+    }
+
+
+def test_analyze_failed_rules_empty(plotter):
+    """No failed rules yields an empty frame with the expected columns."""
+    for data in (
+        pd.DataFrame({'failed_rules': [None, '', None]}),
+        pd.DataFrame({'failed_rules': [np.nan, np.nan]}),
+        pd.DataFrame({'qc_outcome': ['PASS']}),
+    ):
+        result = plotter._analyze_failed_rules(data)
+
+        assert result.empty
+        assert list(result.columns) == ['rule', 'count']
+
+
+def test_outcome_colors_merge_config_overrides():
+    """Configured outcome colors override the defaults once, at init."""
+    config = UQCMeConfig(app={
+        "input": {
+            "data": {"file": "output/qc_results.tsv"},
+            "mapping": "config/mapping.yaml",
+            "qc_rules": "config/QC_rules.tsv",
+            "qc_tests": "config/QC_tests.tsv",
+        },
+        "priority_colors": {"qc_outcome": {"PASS": "#000000"}},
+    })
+
+    colors = QCPlotter(config)._get_outcome_colors()
+
+    assert colors['PASS'] == '#000000'
+    assert colors['FAIL'] == DEFAULT_OUTCOME_COLORS['FAIL']
+    assert DEFAULT_OUTCOME_COLORS['PASS'] == '#28a745'
+
+
+@pytest.mark.parametrize("with_missing", [False, True])
+def test_compute_correlation_matches_pandas(plotter, with_missing):
+    """Correlation fast path agrees with DataFrame.corr."""
+    data = pd.DataFrame({
+        'GC': [50.1, 51.3, 49.8, 52.0, 50.6],
+        'N50': [100000, 120000, 90000, 130000, 110000],
+        'coverage_x': [40.0, 35.5, 60.2, 20.1, 45.0],
+    })
+    if with_missing:
+        data.loc[2, 'N50'] = None
+    metrics = ['GC', 'N50', 'coverage_x']
+
+    result = plotter._compute_correlation(data, metrics)
+
+    pd.testing.assert_frame_equal(result, data[metrics].corr())
+
+
+def test_distribution_plot_prebins_per_outcome(plotter):
+    """Histogram bins are computed server-side, one stacked trace per outcome."""
+    data = pd.DataFrame({
+        'GC': [50.5, 51.25, 49.75, None, 50.0],
+        'qc_outcome': ['PASS', 'FAIL', 'PASS', 'PASS', 'FAIL'],
+    })
+
+    fig = plotter.create_distribution_plot(data, 'GC')
+
+    assert [trace.name for trace in fig.data] == ['PASS', 'FAIL']
+    assert all(len(trace.x) == 30 for trace in fig.data)
+    assert sum(sum(trace.y) for trace in fig.data) == 4
+    assert fig.layout.barmode == 'stack'
+
+
+def test_box_plot_uses_precomputed_statistics(plotter):
+    """Box plots carry quartiles per outcome rather than raw samples."""
+    data = pd.DataFrame({
+        'GC': [1.0, 2.0, 3.0, 4.0, 100.0, 5.0],
+        'qc_outcome': ['PASS', 'PASS', 'PASS', 'PASS', 'PASS', 'FAIL'],
+    })
+
+    fig = plotter.create_box_plot(data, 'GC')
+
+    passed, failed = fig.data
+    assert passed.name == 'PASS'
+    assert passed.median == (3.0,)
+    assert (passed.q1, passed.q3) == ((2.0,), (4.0,))
+    assert passed.upperfence == (4.0,)
+    assert failed.median == (5.0,)
+
+
+def test_scatter_plot_downsamples_large_inputs(plotter):
+    """Large scatter inputs are reduced per outcome, keeping extremes."""
+    rng = np.random.default_rng(0)
+    n = SCATTER_DOWNSAMPLE_THRESHOLD + 1000
+    data = pd.DataFrame({
+        'GC': rng.normal(50, 2, n),
+        'N50': rng.normal(1e5, 1e4, n),
+        'qc_outcome': np.where(np.arange(n) % 2, 'PASS', 'FAIL'),
+        'sample_name': [f"S{i}" for i in range(n)],
+    })
+
+    fig = plotter.create_scatter_plot(data, 'GC', 'N50')
+
+    assert len(fig.data) == 2
+    for trace in fig.data:
+        assert len(trace.x) == SCATTER_MAX_POINTS_PER_OUTCOME
+    all_x = np.concatenate([trace.x for trace in fig.data])
+    assert np.isclose(all_x.min(), data['GC'].min(), rtol=1e-6)
+    assert np.isclose(all_x.max(), data['GC'].max(), rtol=1e-6)
+
+
+def test_downcast_numeric_keeps_floats_float32_would_round():
+    """Floats are narrowed only when float32 holds them exactly."""
+    data = pd.DataFrame({
+        'total_bases': [123456789.0, np.nan],
+        'GC': [50.5, np.nan],
+        'contigs': [12, 40],
+    })
+
+    result = _downcast_numeric(data, ['total_bases', 'GC', 'contigs'])
+
+    assert result['total_bases'].dtype == np.float64
+    assert result['total_bases'].iloc[0] == 123456789.0
+    assert result['GC'].dtype == np.float32
+    assert result['contigs'].dtype == np.int8
+    assert data['GC'].dtype == np.float64
+
+
+@pytest.mark.parametrize("column,expected", [
+    ('QC_coverage_x', 'Coverage X'),
+    ('QC.gc_content', 'Gc Content'),
+    ('number_of_genomes', 'Number Of Genomes'),
+])
+def test_format_column_name(plotter, column, expected):
+    """Known prefixes are stripped and names are title-cased."""
+    assert plotter._format_column_name(column) == expected
+
+
+def test_get_available_metrics_filters_columns():
+    """Only numeric, non-system columns with data are offered."""
+    data = pd.DataFrame({
+        'sample_name': ['S1', 'S2'],
+        'GC': [50.0, 51.0],
+        'empty_metric': [None, None],
+        'N50': [100000, 90000],
+        'error': [0, 1],
+        'species': ['E. coli', 'E. coli'],
+    })
+    data['empty_metric'] = data['empty_metric'].astype(float)
+
+    assert get_available_metrics(data) == ['GC', 'N50']
+
+
+def test_figures_are_cached_on_column_content(plotter):
+    """Unchanged input reuses the cached figure; changed input rebuilds."""
+    data = pd.DataFrame({
+        'qc_outcome': ['PASS', 'FAIL', 'PASS'],
+        'GC': [50.0, 51.0, 52.0],
+    })
+
+    first = plotter.create_outcome_pie_chart(data)
+    assert plotter.create_outcome_pie_chart(data.copy()) is first
+
+    # Columns the figure does not depend on do not invalidate it
+    data['GC'] = [1.0, 2.0, 3.0]
+    assert plotter.create_outcome_pie_chart(data) is first
+
+    data.loc[0, 'qc_outcome'] = 'FAIL'
+    assert plotter.create_outcome_pie_chart(data) is not first
+    assert plotter.create_outcome_pie_chart(data, title="Other") is not first
+
+
+def test_overview_dashboard_json_is_cached(plotter):
+    """Overview JSON is serialized once per distinct input."""
+    data = pd.DataFrame({
+        'qc_outcome': ['PASS', 'FAIL', 'PASS'],
+        'failed_rules': ['', 'R1', ''],
+        'species': ['E. coli', 'E. coli', 'Listeria'],
+        'GC': [50.0, 51.0, 52.0],
+        'N50': [100000, 90000, 110000],
+    })
+
+    result = plotter.create_quality_overview_dashboard_json(data)
+
+    assert set(result) == {
+        'outcome_pie', 'species_bar', 'failed_rules',
+        'metric_dist', 'metric_box', 'correlation'
+    }
+    assert json.loads(result['outcome_pie'])['data'][0]['type'] == 'pie'
+    assert plotter.create_quality_overview_dashboard_json(data) is result
+
+
+def test_overview_dashboard_builds_only_uncached_figures(plotter):
+    """Cached overview figures are reused without going to the pool."""
+    data = pd.DataFrame({
+        'qc_outcome': ['PASS', 'FAIL', 'PASS'],
+        'failed_rules': ['', 'R1', ''],
+        'species': ['E. coli', 'E. coli', 'Listeria'],
+        'GC': [50.0, 51.0, 52.0],
+        'N50': [100000, 90000, 110000],
+    })
+    first = plotter.create_quality_overview_dashboard(data)
+
+    with patch(
+        'uQCme.app.plot.ThreadPoolExecutor', wraps=ThreadPoolExecutor
+    ) as pool:
+        second = plotter.create_quality_overview_dashboard(data)
+
+    # Only the uncached distribution and box plots are built again
+    pool.assert_called_once_with(max_workers=2)
+    assert list(second) == list(first)
+    for name in ('outcome_pie', 'species_bar', 'failed_rules', 'correlation'):
+        assert second[name] is first[name]
+
+
+def test_overview_dashboard_json_ignores_unplotted_columns(plotter):
+    """List-valued columns the overview does not plot are not hashed."""
+    data = pd.DataFrame({
+        'qc_outcome': ['PASS', 'FAIL'],
+        'failed_rules': ['', 'R1'],
+        'species': ['E. coli', 'Listeria'],
+        'GC': [50.0, 51.0],
+        'files': [['a.fastq', 'b.fastq'], ['c.fastq']],
+    })
+
+    result = plotter.create_quality_overview_dashboard_json(data)
+
+    data['files'] = [[], ['d.fastq']]
+    assert plotter.create_quality_overview_dashboard_json(data) is result
+
+    data.loc[0, 'GC'] = 49.0
+    assert plotter.create_quality_overview_dashboard_json(data) is not result
+
+
+def test_scatter_hover_ships_only_varying_fields(plotter):
+    """Constant species goes into the hover template, not per-point data."""
+    data = pd.DataFrame({
+        'GC': [50.0, 51.0, 52.0],
+        'N50': [100000, 90000, 110000],
+        'qc_outcome': ['PASS', 'FAIL', 'PASS'],
+        'sample_name': ['S1', 'S2', 'S3'],
+        'species': ['E. coli'] * 3,
+    })
+
+    fig = plotter.create_scatter_plot(data, 'GC', 'N50')
+
+    passed = fig.data[0]
+    assert [row.tolist() for row in passed.customdata] == [['S1'], ['S3']]
+    assert 'Species: E. coli' in passed.hovertemplate
+
+    assert passed.marker.color == DEFAULT_OUTCOME_COLORS['PASS']
+
+    data.loc[1, 'species'] = 'Listeria'
+    fig = plotter.create_scatter_plot(data, 'GC', 'N50')
+    assert fig.data[1].customdata[0].tolist() == ['S2', 'Listeria']
+
+
+def test_analyze_failed_rules_arrow_backed(plotter):
+    """Arrow-backed failed rules are counted with Arrow compute kernels."""
+    pa = pytest.importorskip("pyarrow")
+    data = pd.DataFrame({
+        'failed_rules': pd.Series(
+            ['R1,R2', 'R2', None, '', 'R2, R3', 'R1'],
+            dtype=pd.ArrowDtype(pa.string())
+        )
+    })
+
+    result = plotter._analyze_failed_rules(data)
+
+    assert list(result.columns) == ['rule', 'count']
+    assert dict(zip(result['rule'], result['count'])) == {
+        'R1': 2, 'R2': 3, 'R3': 1
+    }
+
+
+def test_count_charts_use_aggregated_arrays(plotter):
+    """Count charts carry one bar or slice per category."""
+    data = pd.DataFrame({
+        'qc_outcome': ['PASS', 'FAIL', 'PASS'],
+        'species': ['E. coli', 'E. coli', 'Listeria'],
+        'failed_rules': ['', 'R1, R2', 'R2'],
+    })
+
+    pie = plotter.create_outcome_pie_chart(data)
+    species = plotter.create_species_bar_chart(data)
+    rules = plotter.create_failed_rules_chart(data)
+
+    assert dict(zip(pie.data[0].labels, pie.data[0].values)) == {
+        'PASS': 2, 'FAIL': 1
+    }
+    assert list(species.data[0].y) == ['E. coli', 'Listeria']
+    assert list(species.data[0].x) == [2, 1]
+    assert rules.data[0].orientation == 'h'
+    assert list(rules.data[0].y) == ['R2', 'R1']
+    assert rules.layout.yaxis.title.text == 'QC Rule'
+
+
+def test_category_counts_match_value_counts():
+    """Categorical code counting agrees with value_counts."""
+    values = pd.Series(['PASS', 'FAIL', None, 'PASS', 'WARNING', 'PASS'])
+
+    result = _category_counts(values)
+
+    assert result.to_dict() == values.value_counts().to_dict()
+    assert result.index[0] == 'PASS'
+
+
+def test_validate_metric_for_plotting():
+    """Numeric or numeric-convertible columns are plottable."""
+    data = pd.DataFrame({
+        'GC': [50.0, 51.0],
+        'N50_text': ['100000', 'n/a'],
+        'species': ['E. coli', 'Listeria'],
+    })
+
+    assert validate_metric_for_plotting(data, 'GC')
+    assert validate_metric_for_plotting(data, 'N50_text')
+    assert not validate_metric_for_plotting(data, 'species')
+    assert not validate_metric_for_plotting(data, 'missing')
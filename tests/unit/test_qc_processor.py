@@ -6,449 +6,510 @@ These tests focus on individual methods and components
 rather than full integration workflows.
 """
 
-import unittest
+import logging
+import re
 import sys
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pytest
 
-# Add the src directory to sys.path to import uQCme package
-sys.path.insert(0, str(Path(__file__).parents[2] / "src"))
-from uQCme.core.engine import QCProcessor
+if __name__ == '__main__':
+    # Run directly, outside the pytest pythonpath setting in pyproject.toml
+    sys.path.insert(0, str(Path(__file__).parents[2] / "src"))
 from uQCme.core.config import UQCMeConfig
+from uQCme.core.engine import _unique_rows
 from uQCme.core.exceptions import ValidationError
 from uQCme.core.loader import validate_run_data_frame
 
-
-class TestQCProcessor(unittest.TestCase):
-    """Unit tests for QCProcessor class methods."""
-
-    def setUp(self):
-        """Set up test fixtures."""
-        self.test_dir = Path(__file__).parent.parent
-        self.config_path = self.test_dir / "fixtures" / "config_example.yaml"
-        self.processor = QCProcessor(str(self.config_path))
-
-    def test_load_config(self):
-        """Test configuration loading."""
-        self.assertIsInstance(self.processor.config, UQCMeConfig)
-        self.assertIsNotNone(self.processor.config.qc)
-        self.assertIsNotNone(self.processor.config.qc.input)
-        self.assertIsNotNone(self.processor.config.qc.output)
-
-    def test_apply_operator(self):
-        """Test operator application logic."""
-        # Test numeric comparisons
-        self.assertTrue(self.processor._apply_operator(5, '>=', 3))
-        self.assertFalse(self.processor._apply_operator(2, '>=', 3))
-        self.assertTrue(self.processor._apply_operator(10, '<=', 15))
-        self.assertFalse(self.processor._apply_operator(20, '<=', 15))
-        self.assertTrue(self.processor._apply_operator(7, '>', 5))
-        self.assertFalse(self.processor._apply_operator(3, '>', 5))
-        self.assertTrue(self.processor._apply_operator(4, '<', 8))
-        self.assertFalse(self.processor._apply_operator(10, '<', 8))
-        
-        # Test string equality
-        self.assertTrue(self.processor._apply_operator('test', '=', 'test'))
-        self.assertFalse(self.processor._apply_operator('test', '=', 'other'))
-
-    def test_get_sample_attributes(self):
-        """Test sample attribute extraction."""
-        sample_data = pd.Series({
-            'species': 'Escherichia coli',
-            'assembly_type': 'short',
-            'other_field': 'value'
-        })
-        
-        # Load QC overrides first
-        self.processor.load_input_files()
-        
-        attributes = self.processor._get_sample_attributes(sample_data)
-        
-        self.assertEqual(attributes['species'], 'Escherichia coli')
-        self.assertIn('assembly_type', attributes)
-
-    def test_rule_matches_criteria(self):
-        """Test rule matching logic."""
-        # Load input files to get QC overrides
-        self.processor.load_input_files()
-        
-        # Test rule that matches all species
-        rule = pd.Series({
-            'species': 'all',
-            'assembly_type': 'all',
-            'software': 'checkm'
-        })
-        
-        sample_attributes = {
-            'species': 'Escherichia coli',
-            'assembly_type': 'short'
+# Read-only Series inputs, built once for the whole module
+SAMPLE_ECOLI = pd.Series({
+    'species': 'Escherichia coli',
+    'assembly_type': 'short',
+    'other_field': 'value'
+})
+RULE_ALL_SPECIES = pd.Series({
+    'species': 'all',
+    'assembly_type': 'all',
+    'software': 'checkm'
+})
+RULE_SALMONELLA = pd.Series({
+    'species': 'Salmonella enterica',
+    'assembly_type': 'all',
+    'software': 'checkm'
+})
+# _evaluate_rule looks fields up in the sample's index, so it stays a Series
+METRIC_SAMPLE = pd.Series({'test_metric': 10})
+METRIC_RULES = [
+    pytest.param(
+        pd.Series({
+            'rule_id': rule_id, 'field': field,
+            'operator': '>=', 'value': value
+        }),
+        outcome,
+        id=outcome,
+    )
+    for outcome, rule_id, field, value in (
+        ('PASS', 'R1', 'Test Metric', 5),
+        ('FAIL', 'R2', 'Test Metric', 15),
+        # Field the mapping does not provide
+        ('SKIP', 'R3', 'Missing Metric', 5),
+    )
+]
+
+
+@pytest.fixture(scope="module")
+def qc_tests_df():
+    """QC tests table with PASS, WARN_TEST and FAIL_TEST outcomes."""
+    return pd.DataFrame([
+        {
+            'outcome_id': 'PASS',
+            'passed_rule_conditions': '',
+            'failed_rule_conditions': '',
+            'priority': 1,
+            'action_required': 'none'
+        },
+        {
+            'outcome_id': 'WARN_TEST',
+            'passed_rule_conditions': '',
+            'failed_rule_conditions': 'R1,R2',
+            'priority': 2,
+            'action_required': 'review'
+        },
+        {
+            'outcome_id': 'FAIL_TEST',
+            'passed_rule_conditions': '',
+            'failed_rule_conditions': 'R3',
+            'priority': 3,
+            'action_required': 'reject'
         }
-        
-        self.assertTrue(
-            self.processor._rule_matches_criteria(rule, sample_attributes)
-        )
-        
-        # Test rule that doesn't match species
-        rule_specific = pd.Series({
-            'species': 'Salmonella enterica',
-            'assembly_type': 'all',
-            'software': 'checkm'
-        })
-        
-        self.assertFalse(
-            self.processor._rule_matches_criteria(
-                rule_specific, sample_attributes
-            )
-        )
-
-    def test_determine_qc_outcomes(self):
-        """Test QC outcome determination logic."""
-        # Mock QC tests dataframe with new two-column schema
-        self.processor.qc_tests = pd.DataFrame([
-            {
-                'outcome_id': 'PASS',
-                'passed_rule_conditions': '',
-                'failed_rule_conditions': '',
-                'priority': 1,
-                'action_required': 'none'
-            },
-            {
-                'outcome_id': 'WARN_TEST',
-                'passed_rule_conditions': '',
-                'failed_rule_conditions': 'R1,R2',
-                'priority': 2,
-                'action_required': 'review'
-            },
-            {
-                'outcome_id': 'FAIL_TEST',
-                'passed_rule_conditions': '',
-                'failed_rule_conditions': 'R3',
-                'priority': 3,
-                'action_required': 'reject'
-            }
-        ])
-
-        # Test no failed rules (both empty = PASS when no failures)
-        outcomes = self.processor._determine_qc_outcomes([], [])
-        self.assertIn('PASS', outcomes)
-
-        # Test warning condition (R1 failed)
-        outcomes = self.processor._determine_qc_outcomes(['R1'], [])
-        self.assertIn('WARN_TEST', outcomes)
-        self.assertNotIn('PASS', outcomes)
-
-        # Test fail condition (R3 failed)
-        outcomes = self.processor._determine_qc_outcomes(['R3'], [])
-        self.assertIn('FAIL_TEST', outcomes)
-
-        # Test multiple failures
-        outcomes = self.processor._determine_qc_outcomes(['R1', 'R3'], [])
-        self.assertIn('WARN_TEST', outcomes)
-        self.assertIn('FAIL_TEST', outcomes)
-
-        # Test unknown rule failure (should default to FAIL)
-        outcomes = self.processor._determine_qc_outcomes(['R99'], [])
-        self.assertIn('FAIL', outcomes)
-
-    def test_passed_rule_conditions_not_applicable(self):
-        """Test that tests with passed_rule_conditions are skipped when rules are not evaluated."""
-        # Mock QC tests with passed_rule_conditions
-        self.processor.qc_tests = pd.DataFrame([
-            {
-                'outcome_id': 'PASS',
-                'passed_rule_conditions': '',
-                'failed_rule_conditions': '',
-                'priority': 1,
-                'action_required': 'none'
-            },
-            {
-                'outcome_id': 'TEST_WITH_PASSED_CONDITIONS',
-                'passed_rule_conditions': 'R10,R11',  # Rules that won't be evaluated
-                'failed_rule_conditions': '',
-                'priority': 2,
-                'action_required': 'review'
-            },
-            {
-                'outcome_id': 'FAIL_TEST',
-                'passed_rule_conditions': '',
-                'failed_rule_conditions': 'R3',
-                'priority': 3,
-                'action_required': 'reject'
-            }
-        ])
-
-        # Test: When R10 and R11 are not evaluated (not in passed_rules or failed_rules),
-        # the test should be skipped (not applicable), not treated as failed
-        outcomes = self.processor._determine_qc_outcomes(['R3'], ['R1', 'R2'])
-        # TEST_WITH_PASSED_CONDITIONS should NOT appear in outcomes (skipped, not applicable)
-        self.assertNotIn('TEST_WITH_PASSED_CONDITIONS', outcomes)
-        # FAIL_TEST should appear because R3 is in failed_rules
-        self.assertIn('FAIL_TEST', outcomes)
-        # PASS should NOT appear because there are failed rules
-        self.assertNotIn('PASS', outcomes)
-
-    def test_passed_rule_conditions_evaluated_and_passed(self):
-        """Test that tests with passed_rule_conditions pass when all required rules pass."""
-        # Mock QC tests with passed_rule_conditions
-        self.processor.qc_tests = pd.DataFrame([
-            {
-                'outcome_id': 'PASS',
-                'passed_rule_conditions': '',
-                'failed_rule_conditions': '',
-                'priority': 1,
-                'action_required': 'none'
-            },
-            {
-                'outcome_id': 'TEST_WITH_PASSED_CONDITIONS',
-                'passed_rule_conditions': 'R10,R11',
-                'failed_rule_conditions': '',
-                'priority': 2,
-                'action_required': 'review'
-            }
-        ])
-
-        # Test: When R10 and R11 are evaluated and passed (in passed_rules),
-        # the test should pass
-        outcomes = self.processor._determine_qc_outcomes([], ['R10', 'R11', 'R1'])
-        # TEST_WITH_PASSED_CONDITIONS should appear (all rules passed)
-        self.assertIn('TEST_WITH_PASSED_CONDITIONS', outcomes)
-        # PASS should also appear (no failed rules)
-        self.assertIn('PASS', outcomes)
-
-    def test_passed_rule_conditions_evaluated_and_failed(self):
-        """Test that tests with passed_rule_conditions fail when any required rule fails."""
-        # Mock QC tests with passed_rule_conditions
-        self.processor.qc_tests = pd.DataFrame([
-            {
-                'outcome_id': 'PASS',
-                'passed_rule_conditions': '',
-                'failed_rule_conditions': '',
-                'priority': 1,
-                'action_required': 'none'
-            },
-            {
-                'outcome_id': 'TEST_WITH_PASSED_CONDITIONS',
-                'passed_rule_conditions': 'R10,R11',
-                'failed_rule_conditions': '',
-                'priority': 2,
-                'action_required': 'review'
-            }
-        ])
-
-        # Test: When R10 passed but R11 failed (in failed_rules),
-        # the test should NOT pass (failed)
-        outcomes = self.processor._determine_qc_outcomes(['R11'], ['R10', 'R1'])
-        # TEST_WITH_PASSED_CONDITIONS should NOT appear (R11 failed)
-        self.assertNotIn('TEST_WITH_PASSED_CONDITIONS', outcomes)
-        # PASS should NOT appear (there are failed rules)
-        self.assertNotIn('PASS', outcomes)
-        # Should have generic FAIL
-        self.assertIn('FAIL', outcomes)
-
-    def test_determine_qc_action(self):
-        """Test QC action determination logic."""
-        # Mock QC tests dataframe
-        self.processor.qc_tests = pd.DataFrame([
-            {
-                'outcome_id': 'PASS',
-                'priority': 1,
-                'action_required': 'none'
-            },
-            {
-                'outcome_id': 'WARN_TEST',
-                'priority': 2,
-                'action_required': 'review'
-            },
-            {
-                'outcome_id': 'FAIL_TEST',
-                'priority': 3,
-                'action_required': 'reject'
-            }
-        ])
-
-        # Test PASS action
-        action = self.processor._determine_qc_action(['PASS'])
-        self.assertEqual(action, 'none')
-
-        # Test WARN action
-        action = self.processor._determine_qc_action(['WARN_TEST'])
-        self.assertEqual(action, 'review')
-
-        # Test FAIL action (higher priority)
-        action = self.processor._determine_qc_action(['FAIL_TEST'])
-        self.assertEqual(action, 'reject')
-
-        # Test mixed actions (should take highest priority)
-        action = self.processor._determine_qc_action(
-            ['WARN_TEST', 'FAIL_TEST']
-        )
-        self.assertEqual(action, 'reject')
-
-    def test_evaluate_rule(self):
-        """Test rule evaluation logic."""
-        # Mock field mapping
-        self.processor.mapping = {
-            'Sections': {
-                'Test': {
-                    'Metric': {
-                        'QC': {'mapping': 'Test Metric'},
-                        'data': {'mapping': 'test_metric'}
-                    }
+    ])
+
+
+def _qc_tests_with_passed_conditions(*extra_rows):
+    """Return a tests table with PASS and a passed-conditions outcome."""
+    return pd.DataFrame([
+        {
+            'outcome_id': 'PASS',
+            'passed_rule_conditions': '',
+            'failed_rule_conditions': '',
+            'priority': 1,
+            'action_required': 'none'
+        },
+        {
+            'outcome_id': 'TEST_WITH_PASSED_CONDITIONS',
+            'passed_rule_conditions': 'R10,R11',
+            'failed_rule_conditions': '',
+            'priority': 2,
+            'action_required': 'review'
+        },
+        *extra_rows,
+    ])
+
+
+# ── QCProcessor methods ──────────────────────────────────────────
+
+def test_load_config(processor):
+    """Test configuration loading."""
+    assert isinstance(processor.config, UQCMeConfig)
+    assert processor.config.qc is not None
+    assert processor.config.qc.input is not None
+    assert processor.config.qc.output is not None
+
+
+def test_default_config_is_parsed_once_and_copied(processor):
+    """Default config is cached, but each caller gets its own copy."""
+    first = processor._get_default_config()
+    second = processor._get_default_config()
+
+    assert first is not second
+    assert first.model_dump() == second.model_dump()
+
+    first.qc.input.mapping = 'changed.yaml'
+    third = processor._get_default_config()
+    assert third.qc.input.mapping != 'changed.yaml'
+
+
+@pytest.mark.parametrize("value,operator,threshold,expected", [
+    # Numeric comparisons
+    (5, '>=', 3, True),
+    (2, '>=', 3, False),
+    (10, '<=', 15, True),
+    (20, '<=', 15, False),
+    (7, '>', 5, True),
+    (3, '>', 5, False),
+    (4, '<', 8, True),
+    (10, '<', 8, False),
+    # String equality
+    ('test', '=', 'test', True),
+    ('test', '=', 'other', False),
+    # Regex
+    ('good', 'regex', '^go', True),
+    ('bad', 'regex', '^go', False),
+])
+def test_apply_operator(processor, value, operator, threshold, expected):
+    """Test operator application logic."""
+    assert processor._apply_operator(value, operator, threshold) is expected
+
+
+def test_apply_operator_precompiled_regex(processor):
+    """A precompiled pattern is used in place of the threshold string."""
+    assert processor._apply_operator(
+        'good', 'regex', '^go', compiled=re.compile('^go')
+    )
+
+
+def test_get_sample_attributes(loaded_processor):
+    """Test sample attribute extraction."""
+    attributes = loaded_processor._get_sample_attributes(SAMPLE_ECOLI)
+
+    assert attributes['species'] == 'Escherichia coli'
+    assert 'assembly_type' in attributes
+
+
+def test_rule_matches_criteria(loaded_processor):
+    """Test rule matching logic."""
+    sample_attributes = {
+        'species': 'Escherichia coli',
+        'assembly_type': 'short'
+    }
+
+    # Rule that matches all species
+    assert loaded_processor._rule_matches_criteria(
+        RULE_ALL_SPECIES, sample_attributes
+    )
+    # Rule that doesn't match species
+    assert not loaded_processor._rule_matches_criteria(
+        RULE_SALMONELLA, sample_attributes
+    )
+
+
+def test_determine_qc_outcomes(processor, qc_tests_df):
+    """Test QC outcome determination logic."""
+    processor.qc_tests = qc_tests_df.copy(deep=False)
+
+    # Test no failed rules (both empty = PASS when no failures)
+    outcomes = processor._determine_qc_outcomes([], [])
+    assert 'PASS' in outcomes
+
+    # Test warning condition (R1 failed)
+    outcomes = processor._determine_qc_outcomes(['R1'], [])
+    assert 'WARN_TEST' in outcomes
+    assert 'PASS' not in outcomes
+
+    # Test fail condition (R3 failed)
+    outcomes = processor._determine_qc_outcomes(['R3'], [])
+    assert 'FAIL_TEST' in outcomes
+
+    # Test multiple failures
+    outcomes = processor._determine_qc_outcomes(['R1', 'R3'], [])
+    assert 'WARN_TEST' in outcomes
+    assert 'FAIL_TEST' in outcomes
+
+    # Test unknown rule failure (should default to FAIL)
+    outcomes = processor._determine_qc_outcomes(['R99'], [])
+    assert 'FAIL' in outcomes
+
+
+def test_passed_rule_conditions_not_applicable(processor):
+    """Tests whose passed_rule_conditions were not evaluated are skipped."""
+    processor.qc_tests = _qc_tests_with_passed_conditions({
+        'outcome_id': 'FAIL_TEST',
+        'passed_rule_conditions': '',
+        'failed_rule_conditions': 'R3',
+        'priority': 3,
+        'action_required': 'reject'
+    })
+
+    # R10 and R11 are neither passed nor failed, so the test is skipped
+    # (not applicable) rather than treated as failed
+    outcomes = processor._determine_qc_outcomes(['R3'], ['R1', 'R2'])
+    assert 'TEST_WITH_PASSED_CONDITIONS' not in outcomes
+    # FAIL_TEST should appear because R3 is in failed_rules
+    assert 'FAIL_TEST' in outcomes
+    # PASS should NOT appear because there are failed rules
+    assert 'PASS' not in outcomes
+
+
+def test_passed_rule_conditions_evaluated_and_passed(processor):
+    """Tests with passed_rule_conditions pass when all required rules pass."""
+    processor.qc_tests = _qc_tests_with_passed_conditions()
+
+    outcomes = processor._determine_qc_outcomes([], ['R10', 'R11', 'R1'])
+    # TEST_WITH_PASSED_CONDITIONS should appear (all rules passed)
+    assert 'TEST_WITH_PASSED_CONDITIONS' in outcomes
+    # PASS should also appear (no failed rules)
+    assert 'PASS' in outcomes
+
+
+def test_passed_rule_conditions_evaluated_and_failed(processor):
+    """Tests with passed_rule_conditions fail when any required rule fails."""
+    processor.qc_tests = _qc_tests_with_passed_conditions()
+
+    outcomes = processor._determine_qc_outcomes(['R11'], ['R10', 'R1'])
+    # TEST_WITH_PASSED_CONDITIONS should NOT appear (R11 failed)
+    assert 'TEST_WITH_PASSED_CONDITIONS' not in outcomes
+    # PASS should NOT appear (there are failed rules)
+    assert 'PASS' not in outcomes
+    # Should have generic FAIL
+    assert 'FAIL' in outcomes
+
+
+def test_determine_qc_action(processor, qc_tests_df):
+    """Test QC action determination logic."""
+    processor.qc_tests = qc_tests_df.copy(deep=False)
+
+    assert processor._determine_qc_action(['PASS']) == 'none'
+    assert processor._determine_qc_action(['WARN_TEST']) == 'review'
+    assert processor._determine_qc_action(['FAIL_TEST']) == 'reject'
+    # Mixed actions take the highest priority
+    assert processor._determine_qc_action(
+        ['WARN_TEST', 'FAIL_TEST']
+    ) == 'reject'
+
+    # Empty outcomes fall back to the PASS action
+    assert processor._determine_qc_action([]) == 'none'
+
+    # Replacing the tests table refreshes the outcome lookup
+    processor.qc_tests = pd.DataFrame([
+        {'outcome_id': 'PASS', 'priority': 1, 'action_required': 'ok'}
+    ])
+    assert processor._determine_qc_action([]) == 'ok'
+    assert processor._determine_qc_action(['FAIL_TEST']) == 'none'
+
+
+def test_save_warnings_shares_timestamp(processor, tmp_path):
+    """All warning rows are stamped with the same save time."""
+    warnings_path = tmp_path / "warnings.tsv"
+    processor.config.qc.output.warnings = str(warnings_path)
+    processor.warnings = {'second warning', 'first warning'}
+    processor.skipped_rules = {'R1'}
+
+    processor.save_warnings()
+    saved = pd.read_csv(warnings_path, sep='\t')
+
+    assert saved['warning_type'].tolist() == [
+        'processing', 'processing', 'skipped_rule'
+    ]
+    assert saved['warning_message'].iloc[0] == 'first warning'
+    assert saved['timestamp'].nunique() == 1
+
+
+def test_print_summary_counts(processor, caplog):
+    """Summary counts outcomes by name and failed rules by frequency.
+
+    The whole summary is logged as one record.
+    """
+    processor.results = pd.DataFrame({
+        'qc_outcome': ['PASS', 'WARN,FAIL', 'FAIL', 'PASS,PASS_GENERAL'],
+        'failed_rules': ['', 'R2, R1', 'R1', ''],
+    })
+
+    with caplog.at_level(logging.INFO, logger=processor.logger.name):
+        processor.print_summary()
+    assert len(caplog.records) == 1
+    messages = [
+        line.strip() for line in caplog.records[0].getMessage().splitlines()
+    ]
+
+    outcomes_at = messages.index('QC Outcomes:')
+    assert messages[outcomes_at + 1:outcomes_at + 5] == [
+        'FAIL: 2', 'PASS: 1', 'PASS_GENERAL: 1', 'WARN: 1'
+    ]
+    rules_at = messages.index('Most common failed rules:')
+    assert messages[rules_at + 1:rules_at + 3] == ['R1: 2', 'R2: 1']
+
+
+@pytest.mark.parametrize("rule,expected", METRIC_RULES)
+def test_evaluate_rule(processor, rule, expected):
+    """Test rule evaluation logic."""
+    processor.mapping = {
+        'Sections': {
+            'Test': {
+                'Metric': {
+                    'QC': {'mapping': 'Test Metric'},
+                    'data': {'mapping': 'test_metric'}
                 }
             }
         }
-        
-        sample = pd.Series({'test_metric': 10})
-        
-        # Test PASS rule
-        pass_rule = pd.Series({
-            'rule_id': 'R1',
-            'field': 'Test Metric',
-            'operator': '>=',
-            'value': 5
-        })
-        self.assertEqual(
-            self.processor._evaluate_rule(sample, pass_rule), 'PASS'
-        )
-        
-        # Test FAIL rule
-        fail_rule = pd.Series({
-            'rule_id': 'R2',
-            'field': 'Test Metric',
-            'operator': '>=',
-            'value': 15
-        })
-        self.assertEqual(
-            self.processor._evaluate_rule(sample, fail_rule), 'FAIL'
-        )
-        
-        # Test SKIP rule (missing field)
-        skip_rule = pd.Series({
-            'rule_id': 'R3',
-            'field': 'Missing Metric',
-            'operator': '>=',
-            'value': 5
-        })
-        self.assertEqual(
-            self.processor._evaluate_rule(sample, skip_rule), 'SKIP'
-        )
-        self.assertIn('R3', self.processor.skipped_rules)
-
-    def test_prepare_run_data_warns_on_duplicate_sample_names(self):
-        """Duplicate sample_name values should warn when not marked unique."""
-        self.processor.mapping = {
-            'Sections': {
-                'Basic': {
-                    'Name': {
-                        'data': {'mapping': 'sample_name'},
-                        'report': {'id': True}
-                    }
+    }
+
+    assert processor._evaluate_rule(METRIC_SAMPLE, rule) == expected
+    assert (rule['rule_id'] in processor.skipped_rules) == (expected == 'SKIP')
+
+
+def test_prepare_run_data_warns_on_duplicate_sample_names(processor):
+    """Duplicate sample_name values should warn when not marked unique."""
+    processor.mapping = {
+        'Sections': {
+            'Basic': {
+                'Name': {
+                    'data': {'mapping': 'sample_name'},
+                    'report': {'id': True}
                 }
             }
         }
-
-        duplicate_data = pd.DataFrame([
-            {'sample_name': 'S1', 'species': 'Escherichia coli'},
-            {'sample_name': 'S1', 'species': 'Escherichia coli'},
-            {'sample_name': 'S2', 'species': 'Salmonella enterica'},
-        ])
-
-        prepared = self.processor.prepare_run_data(duplicate_data)
-
-        pd.testing.assert_frame_equal(prepared, duplicate_data)
-        self.assertTrue(
-            any(
-                "Duplicate value 'S1' found in column 'sample_name'" in warning
-                for warning in self.processor.warnings
-            )
-        )
-
-    def test_prepare_run_data_rejects_duplicate_unique_column(self):
-        """Duplicate values should fail when mapping marks the column unique."""
-        self.processor.mapping = {
-            'Sections': {
-                'Basic': {
-                    'Name': {
-                        'data': {'mapping': 'sample_name'},
-                        'report': {'id': True, 'unique': True}
-                    }
+    }
+
+    duplicate_data = pd.DataFrame([
+        {'sample_name': 'S1', 'species': 'Escherichia coli'},
+        {'sample_name': 'S1', 'species': 'Escherichia coli'},
+        {'sample_name': 'S2', 'species': 'Salmonella enterica'},
+    ])
+
+    prepared = processor.prepare_run_data(duplicate_data)
+
+    pd.testing.assert_frame_equal(prepared, duplicate_data)
+    assert any(
+        "Duplicate value 'S1' found in column 'sample_name'" in warning
+        for warning in processor.warnings
+    )
+
+
+def test_prepare_run_data_rejects_duplicate_unique_column(processor):
+    """Duplicate values should fail when mapping marks the column unique."""
+    processor.mapping = {
+        'Sections': {
+            'Basic': {
+                'Name': {
+                    'data': {'mapping': 'sample_name'},
+                    'report': {'id': True, 'unique': True}
                 }
             }
         }
+    }
+
+    duplicate_data = pd.DataFrame([
+        {'sample_name': 'S1', 'species': 'Escherichia coli'},
+        {'sample_name': 'S1', 'species': 'Escherichia coli'},
+    ])
+
+    with pytest.raises(ValidationError):
+        processor.prepare_run_data(duplicate_data)
+
+
+def test_validate_run_data_allows_missing_sample_name():
+    """Run data validation should allow datasets without sample_name."""
+    data_without_sample_name = pd.DataFrame([
+        {'species': 'Escherichia coli', 'GC': 50.0, 'N50': 100000},
+        {'species': 'Salmonella enterica', 'GC': 52.0, 'N50': 90000},
+    ])
+
+    validate_run_data_frame(data_without_sample_name)
+
 
-        duplicate_data = pd.DataFrame([
-            {'sample_name': 'S1', 'species': 'Escherichia coli'},
-            {'sample_name': 'S1', 'species': 'Escherichia coli'},
-        ])
-
-        with self.assertRaises(ValidationError):
-            self.processor.prepare_run_data(duplicate_data)
-
-    def test_validate_run_data_allows_missing_sample_name(self):
-        """Run data validation should allow datasets without sample_name."""
-        data_without_sample_name = pd.DataFrame([
-            {'species': 'Escherichia coli', 'GC': 50.0, 'N50': 100000},
-            {'species': 'Salmonella enterica', 'GC': 52.0, 'N50': 90000},
-        ])
-
-        validate_run_data_frame(data_without_sample_name)
-
-    def test_prepare_run_data_allows_missing_sample_name(self):
-        """Preparing run data should not fail when sample_name is absent."""
-        self.processor.mapping = {
-            'Sections': {
-                'Basic': {
-                    'Species': {
-                        'data': {'mapping': 'species'},
-                        'report': {'filter': True}
-                    }
+def test_prepare_run_data_allows_missing_sample_name(processor):
+    """Preparing run data should not fail when sample_name is absent."""
+    processor.mapping = {
+        'Sections': {
+            'Basic': {
+                'Species': {
+                    'data': {'mapping': 'species'},
+                    'report': {'filter': True}
                 }
             }
         }
+    }
 
-        data_without_sample_name = pd.DataFrame([
-            {'species': 'Escherichia coli', 'GC': 50.0},
-            {'species': 'Salmonella enterica', 'GC': 52.0},
-        ])
+    data_without_sample_name = pd.DataFrame([
+        {'species': 'Escherichia coli', 'GC': 50.0},
+        {'species': 'Salmonella enterica', 'GC': 52.0},
+    ])
 
-        prepared = self.processor.prepare_run_data(data_without_sample_name)
+    prepared = processor.prepare_run_data(data_without_sample_name)
 
-        pd.testing.assert_frame_equal(prepared, data_without_sample_name)
-        self.assertEqual(len(self.processor.warnings), 0)
+    pd.testing.assert_frame_equal(prepared, data_without_sample_name)
+    assert len(processor.warnings) == 0
 
 
-class TestFieldMapping(unittest.TestCase):
-    """Unit tests for field mapping functionality."""
+# ── Field mapping ────────────────────────────────────────────────
 
-    def setUp(self):
-        """Set up test fixtures."""
-        self.test_dir = Path(__file__).parent.parent
-        self.config_path = self.test_dir / "fixtures" / "config_example.yaml"
-        self.processor = QCProcessor(str(self.config_path))
-        self.processor.load_input_files()
+def test_build_field_mapping(loaded_processor):
+    """Test field mapping construction."""
+    field_mapping = loaded_processor._build_field_mapping()
 
-    def test_build_field_mapping(self):
-        """Test field mapping construction."""
-        field_mapping = self.processor._build_field_mapping()
-        
-        self.assertIsInstance(field_mapping, dict)
-        # Should have some mappings from our test data
-        self.assertGreater(len(field_mapping), 0)
+    assert isinstance(field_mapping, dict)
+    # Should have some mappings from our test data
+    assert len(field_mapping) > 0
 
-    def test_field_mapping_consistency(self):
-        """Test that field mapping is consistent."""
-        mapping1 = self.processor._build_field_mapping()
-        mapping2 = self.processor._build_field_mapping()
-        
-        self.assertEqual(mapping1, mapping2)
+
+def test_field_mapping_consistency(loaded_processor):
+    """Test that field mapping is consistent."""
+    mapping1 = loaded_processor._build_field_mapping()
+    mapping2 = loaded_processor._build_field_mapping()
+
+    assert mapping1 == mapping2
+
+
+def test_process_samples_matches_per_sample_evaluation(loaded_processor):
+    """Vectorized rule evaluation agrees with per-rule evaluation."""
+    processor = loaded_processor
+    processor.process_samples()
+    results = processor.results
+
+    assert len(results) == len(processor.run_data)
+    for idx, sample in processor.run_data.iterrows():
+        attributes = processor._get_sample_attributes(sample)
+        failed, passed = [], []
+        for _, rule in processor.qc_rules.iterrows():
+            if not processor._rule_matches_criteria(rule, attributes):
+                continue
+            outcome = processor._evaluate_rule(sample, rule)
+            if outcome == 'PASS':
+                passed.append(rule['rule_id'])
+            elif outcome == 'FAIL':
+                failed.append(rule['rule_id'])
+
+        name = sample.get('sample_name', idx)
+        assert results.loc[idx, 'failed_rules'] == ','.join(failed), name
+        assert results.loc[idx, 'passed_rules'] == ','.join(passed), name
+
+
+def test_field_mapping_cached_until_mapping_changes(loaded_processor):
+    """Field mapping is built once and rebuilt when mapping is replaced."""
+    processor = loaded_processor
+    cached = processor._get_field_mapping()
+    assert processor._get_field_mapping() is cached
+    assert cached == processor._build_field_mapping()
+
+    processor.mapping = {}
+    assert processor._get_field_mapping() == {}
+
+
+def test_rules_cached_until_rules_change(loaded_processor, qc_rules_data):
+    """Rule rows are built once per rules table and match its rows."""
+    processor = loaded_processor
+    rules = processor._get_rules()
+    assert processor._get_rules() is rules
+    assert [rule.rule_id for rule in rules] == (
+        processor.qc_rules['rule_id'].tolist()
+    )
+
+    processor.qc_rules = qc_rules_data.head(2)
+    assert [rule.rule_id for rule in processor._get_rules()] == (
+        qc_rules_data['rule_id'].head(2).tolist()
+    )
+
+
+@pytest.mark.parametrize("shape", [(6, 3), (0, 3), (4, 0)])
+def test_unique_rows_matches_numpy(shape):
+    """Hashed row dedup agrees with np.unique(axis=0) up to row order."""
+    rng = np.random.default_rng(0)
+    status = rng.integers(0, 3, size=shape, dtype=np.int8)
+    if shape[0] and shape[1]:
+        status[1] = status[0]
+        status[-1] = 0
+
+    patterns, inverse = _unique_rows(status)
+
+    np.testing.assert_array_equal(patterns[inverse], status)
+    assert len(patterns) == len(np.unique(status, axis=0))
 
 
 if __name__ == '__main__':
     # Change to project root directory so relative paths work
-    test_dir = Path(__file__).parent.parent
     import os
-    os.chdir(test_dir.parent)
-    
-    # Run tests
-    unittest.main(verbosity=2)
+    os.chdir(Path(__file__).parents[2])
+
+    sys.exit(pytest.main([__file__, '-v']))